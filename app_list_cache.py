@@ -0,0 +1,705 @@
+"""
+app_list_cache.py
+=================
+
+This module provides a compact in-memory representation of the Steam app list and a persistent on-disk cache for it.
+
+Classes
+-------
+PackedNames
+    A sequence of strings packed into one UTF-8 buffer with an offset column.
+
+AppList
+    The Steam app list stored as parallel columns of app IDs and names.
+
+NameIndex
+    A lowercase name to app ID index over an AppList.
+
+AppListCache
+    A persistent cache of the Steam app list with a time-to-live and HTTP validators.
+
+Functions
+---------
+iter_app_list_json(chunks)
+    Incrementally parse the apps of a GetAppList response.
+
+Attributes
+----------
+None
+
+Methods
+-------
+PackedNames.from_bytes(data, count)
+    Rebuild packed names from NUL-separated UTF-8 data.
+
+PackedNames.append(name)
+    Append a name.
+
+PackedNames.to_bytes()
+    Serialize the names as NUL-separated UTF-8 data.
+
+AppList.from_apps(apps)
+    Build an AppList from the app dictionaries returned by the Steam Web API.
+
+AppList.from_json_stream(chunks)
+    Build an AppList from the chunks of a GetAppList response without materializing it.
+
+AppList.memory_usage()
+    Return the number of bytes used by the columns.
+
+AppList.from_bytes(appids_data, names_data)
+    Rebuild an AppList from its serialized columns.
+
+AppList.to_bytes()
+    Serialize the columns of the AppList.
+
+NameIndex.build(app_list)
+    Build the index by sorting the app list by lowercase name.
+
+NameIndex.from_bytes(app_list, data)
+    Rebuild the index from its serialized sort order.
+
+NameIndex.to_bytes()
+    Serialize the sort order of the index.
+
+NameIndex.lookup(name)
+    Find the app ID for a name, ignoring case.
+
+NameIndex.lookup_many(names)
+    Find the app IDs for several names, ignoring case.
+
+AppListCache.load()
+    Load the cached app list and its metadata.
+
+AppListCache.load_index(app_list, metadata)
+    Load the name index stored for the cached app list.
+
+AppListCache.save_index(index, metadata)
+    Store the name index for the cached app list.
+
+AppListCache.save(app_list, etag=None, last_modified=None)
+    Store the app list and its HTTP validators.
+
+AppListCache.touch()
+    Mark the cached app list as freshly validated.
+
+AppListCache.is_fresh(metadata)
+    Check if cached metadata is within the time-to-live.
+
+AppListCache.validation_headers(metadata)
+    Build the conditional request headers for revalidating the cache.
+
+Notes
+-----
+- The cache consists of `app_list.bin` (the serialized columns), `app_list.json` (metadata: ETag,
+  Last-Modified, fetch time, entry count and a content version) and `app_list.idx` (the name index).
+- The name index is a permutation of the app list sorted by lowercase name (4 bytes per app), searched
+  with a binary search. It is tagged with the content version it was built for and rebuilt when the list changes.
+- App names are kept as one UTF-8 buffer plus an offset array instead of one Python string per app, which
+  cuts the resident size of the list several times; names are decoded on access.
+- `iter_app_list_json` parses the response one app at a time, so the full JSON document and its list of
+  dictionaries are never held in memory together with the columns.
+- Files are written to a temporary file and swapped in with `os.replace`, so a crash never leaves a torn cache.
+- A stale cache is still returned by `load`; callers decide whether to revalidate or use it offline.
+
+Example
+-------
+To load the cached app list:
+
+from app_list_cache import AppListCache
+
+cache = AppListCache("path/to/cache", ttl=86400)
+app_list, metadata = cache.load()
+if app_list is not None and cache.is_fresh(metadata):
+    print(f"{len(app_list)} apps cached.")
+"""
+
+import os
+import re
+import sys
+import json
+import codecs
+import time
+import array
+import hashlib
+import logging
+import tempfile
+
+_APPS_ARRAY = re.compile(r'"apps"\s*:\s*\[')
+
+
+def _pack_uint32(values):
+    """
+    Serialize an unsigned 32-bit array as little-endian bytes.
+
+    Args:
+        values (array.array): The values to serialize.
+
+    Returns:
+        bytes: The serialized values.
+    """
+    if sys.byteorder != 'little':
+        values = array.array('I', values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack_uint32(data):
+    """
+    Deserialize little-endian bytes into an unsigned 32-bit array.
+
+    Args:
+        data (bytes): The serialized values.
+
+    Returns:
+        array.array: The values.
+    """
+    values = array.array('I')
+    values.frombytes(data)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def iter_app_list_json(chunks):
+    """
+    Incrementally parse the apps of a GetAppList response.
+
+    Only the `apps` array is parsed; each app object is decoded as soon as it is complete.
+
+    Args:
+        chunks (iterable): The response body as chunks of UTF-8 bytes.
+
+    Yields:
+        dict: The app dictionaries with the keys `appid` and `name`.
+
+    Raises:
+        ValueError: If the response does not contain a complete `apps` array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    pos = 0
+    in_array = False
+    for chunk in chunks:
+        buffer = buffer[pos:] + text_decoder.decode(chunk)
+        pos = 0
+        if not in_array:
+            match = _APPS_ARRAY.search(buffer)
+            if not match:
+                continue
+            pos = match.end()
+            in_array = True
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                return
+            try:
+                app, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The object continues in the next chunk.
+                break
+            yield app
+    raise ValueError("Truncated app list: the apps array is incomplete")
+
+
+class PackedNames:
+    """
+    A sequence of strings packed into one UTF-8 buffer with an offset column.
+    """
+
+    def __init__(self, data=None, offsets=None):
+        """
+        Initialize the PackedNames.
+
+        Args:
+            data (bytearray, optional): The NUL-separated UTF-8 names. Defaults to None.
+            offsets (array.array, optional): The start offset of each name in `data`. Defaults to None.
+        """
+        self.data = data if data is not None else bytearray()
+        self.offsets = offsets if offsets is not None else array.array('I')
+
+    @classmethod
+    def from_bytes(cls, data, count):
+        """
+        Rebuild packed names from NUL-separated UTF-8 data.
+
+        Args:
+            data (bytes): The NUL-separated UTF-8 names.
+            count (int): The expected number of names.
+
+        Returns:
+            PackedNames: The names.
+
+        Raises:
+            ValueError: If the data does not hold `count` valid UTF-8 names.
+        """
+        data = bytearray(data)
+        offsets = array.array('I')
+        if count:
+            data.decode('utf-8')
+            offsets.append(0)
+            pos = data.find(0)
+            while pos != -1:
+                offsets.append(pos + 1)
+                pos = data.find(0, pos + 1)
+        if len(offsets) != count:
+            raise ValueError(f"Corrupt app list: {count} app IDs but {len(offsets)} names")
+        return cls(data, offsets)
+
+    def append(self, name):
+        """
+        Append a name.
+
+        Args:
+            name (str): The name; NUL characters are removed.
+        """
+        if self.offsets:
+            self.data.append(0)
+        self.offsets.append(len(self.data))
+        self.data += name.replace('\x00', '').encode('utf-8')
+
+    def to_bytes(self):
+        """
+        Serialize the names as NUL-separated UTF-8 data.
+
+        Returns:
+            bytes: The names.
+        """
+        return bytes(self.data)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, position):
+        count = len(self.offsets)
+        if position < 0:
+            position += count
+        if not 0 <= position < count:
+            raise IndexError("name index out of range")
+        start = self.offsets[position]
+        end = self.offsets[position + 1] - 1 if position + 1 < count else len(self.data)
+        return self.data[start:end].decode('utf-8')
+
+    def __iter__(self):
+        data, offsets = self.data, self.offsets
+        for position in range(len(offsets)):
+            end = offsets[position + 1] - 1 if position + 1 < len(offsets) else len(data)
+            yield data[offsets[position]:end].decode('utf-8')
+
+
+class AppList:
+    """
+    The Steam app list stored as parallel columns of app IDs and names.
+    """
+
+    def __init__(self, appids=None, names=None):
+        """
+        Initialize the AppList with the given columns.
+
+        Args:
+            appids (array.array, optional): The app IDs as an unsigned 32-bit array. Defaults to None.
+            names (PackedNames, optional): The app names, parallel to `appids`. Defaults to None.
+        """
+        self.appids = appids if appids is not None else array.array('I')
+        self.names = names if names is not None else PackedNames()
+
+    @classmethod
+    def from_apps(cls, apps):
+        """
+        Build an AppList from the app dictionaries returned by the Steam Web API.
+
+        Args:
+            apps (iterable): Dictionaries with the keys `appid` and `name`.
+
+        Returns:
+            AppList: The app list.
+        """
+        app_list = cls()
+        for app in apps:
+            app_list.appids.append(app['appid'])
+            app_list.names.append(app['name'])
+        return app_list
+
+    @classmethod
+    def from_json_stream(cls, chunks):
+        """
+        Build an AppList from the chunks of a GetAppList response without materializing it.
+
+        Args:
+            chunks (iterable): The response body as chunks of UTF-8 bytes.
+
+        Returns:
+            AppList: The app list.
+
+        Raises:
+            ValueError: If the response is malformed or truncated.
+        """
+        try:
+            return cls.from_apps(iter_app_list_json(chunks))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed app list entry: {e}") from e
+
+    @classmethod
+    def from_bytes(cls, appids_data, names_data):
+        """
+        Rebuild an AppList from its serialized columns.
+
+        Args:
+            appids_data (bytes): The app IDs as little-endian unsigned 32-bit integers.
+            names_data (bytes): The UTF-8 app names separated by NUL bytes.
+
+        Returns:
+            AppList: The app list.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        appids = _unpack_uint32(appids_data)
+        return cls(appids, PackedNames.from_bytes(names_data, len(appids)))
+
+    def to_bytes(self):
+        """
+        Serialize the columns of the AppList.
+
+        Returns:
+            tuple: The app IDs as little-endian unsigned 32-bit integers and the UTF-8 names separated
+                by NUL bytes.
+        """
+        return _pack_uint32(self.appids), self.names.to_bytes()
+
+    def memory_usage(self):
+        """
+        Return the number of bytes used by the columns.
+
+        Returns:
+            int: The size of the app ID, name and offset buffers.
+        """
+        return (
+            self.appids.itemsize * len(self.appids)
+            + len(self.names.data)
+            + self.names.offsets.itemsize * len(self.names.offsets)
+        )
+
+    def __len__(self):
+        return len(self.appids)
+
+    def __iter__(self):
+        """
+        Iterate over the apps as dictionaries, as returned by the Steam Web API.
+        """
+        for appid, name in zip(self.appids, self.names):
+            yield {'appid': appid, 'name': name}
+
+
+class NameIndex:
+    """
+    A lowercase name to app ID index over an AppList.
+    """
+
+    def __init__(self, app_list, order):
+        """
+        Initialize the NameIndex.
+
+        Args:
+            app_list (AppList): The indexed app list.
+            order (array.array): The positions of the apps sorted by lowercase name.
+        """
+        self.app_list = app_list
+        self.order = order
+
+    @classmethod
+    def build(cls, app_list):
+        """
+        Build the index by sorting the app list by lowercase name.
+
+        Args:
+            app_list (AppList): The app list to index.
+
+        Returns:
+            NameIndex: The index.
+        """
+        lowered = [name.lower() for name in app_list.names]
+        order = array.array('I', sorted(range(len(lowered)), key=lowered.__getitem__))
+        logging.info(f"Built name index for {len(order)} apps.")
+        return cls(app_list, order)
+
+    @classmethod
+    def from_bytes(cls, app_list, data):
+        """
+        Rebuild the index from its serialized sort order.
+
+        Args:
+            app_list (AppList): The indexed app list.
+            data (bytes): The sort order as little-endian unsigned 32-bit integers.
+
+        Returns:
+            NameIndex: The index.
+
+        Raises:
+            ValueError: If the sort order does not match the app list.
+        """
+        order = _unpack_uint32(data)
+        if len(order) != len(app_list):
+            raise ValueError(
+                f"Corrupt name index: {len(order)} entries for {len(app_list)} apps"
+            )
+        return cls(app_list, order)
+
+    def to_bytes(self):
+        """
+        Serialize the sort order of the index.
+
+        Returns:
+            bytes: The sort order as little-endian unsigned 32-bit integers.
+        """
+        return _pack_uint32(self.order)
+
+    def lookup(self, name):
+        """
+        Find the app ID for a name, ignoring case.
+
+        When several apps share a name, the last one in the app list wins.
+
+        Args:
+            name (str): The name of the app.
+
+        Returns:
+            int: The app ID if found, else None.
+        """
+        names, order = self.app_list.names, self.order
+        key = name.lower()
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key < names[order[mid]].lower():
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo and names[order[lo - 1]].lower() == key:
+            return self.app_list.appids[order[lo - 1]]
+        return None
+
+    def lookup_many(self, names):
+        """
+        Find the app IDs for several names, ignoring case.
+
+        Args:
+            names (iterable): The names of the apps.
+
+        Returns:
+            dict: The app ID (or None) for each name.
+        """
+        return {name: self.lookup(name) for name in names}
+
+
+class AppListCache:
+    """
+    A persistent cache of the Steam app list with a time-to-live and HTTP validators.
+    """
+
+    DATA_FILE = 'app_list.bin'
+    META_FILE = 'app_list.json'
+    INDEX_FILE = 'app_list.idx'
+
+    def __init__(self, cache_dir, ttl):
+        """
+        Initialize the AppListCache.
+
+        Args:
+            cache_dir (str): The directory to store the cache files in.
+            ttl (float): The number of seconds a cached app list is considered fresh.
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.data_path = os.path.join(cache_dir, self.DATA_FILE)
+        self.meta_path = os.path.join(cache_dir, self.META_FILE)
+        self.index_path = os.path.join(cache_dir, self.INDEX_FILE)
+
+    def _write_atomic(self, path, data):
+        """
+        Write a file by swapping in a temporary file.
+
+        Args:
+            path (str): The path to the file.
+            data (bytes): The contents of the file.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _read_metadata(self):
+        """
+        Read the cache metadata.
+
+        Returns:
+            dict: The metadata, or an empty dictionary if it is missing or unreadable.
+        """
+        try:
+            with open(self.meta_path, 'r') as file:
+                return json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _write_metadata(self, metadata):
+        """
+        Write the cache metadata.
+
+        Args:
+            metadata (dict): The metadata to write.
+        """
+        self._write_atomic(self.meta_path, json.dumps(metadata, indent=4).encode('utf-8'))
+
+    def load(self):
+        """
+        Load the cached app list and its metadata.
+
+        Returns:
+            tuple: The cached AppList (or None if there is no usable cache) and its metadata.
+        """
+        metadata = self._read_metadata()
+        if not metadata:
+            return None, {}
+        try:
+            with open(self.data_path, 'rb') as f:
+                data = f.read()
+            split = metadata['appids_size']
+            app_list = AppList.from_bytes(data[:split], data[split:])
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable app list cache in {self.cache_dir}: {e}")
+            return None, {}
+        logging.info(f"Loaded {len(app_list)} apps from the app list cache.")
+        return app_list, metadata
+
+    def save(self, app_list, etag=None, last_modified=None):
+        """
+        Store the app list and its HTTP validators.
+
+        Args:
+            app_list (AppList): The app list to store.
+            etag (str, optional): The ETag of the response. Defaults to None.
+            last_modified (str, optional): The Last-Modified date of the response. Defaults to None.
+
+        Returns:
+            dict: The metadata written for the cache.
+        """
+        appids_data, names_data = app_list.to_bytes()
+        version = hashlib.blake2b(appids_data + names_data, digest_size=16).hexdigest()
+        metadata = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': time.time(),
+            'count': len(app_list),
+            'appids_size': len(appids_data),
+            'version': version,
+        }
+        try:
+            self._write_atomic(self.data_path, appids_data + names_data)
+            self._write_metadata(metadata)
+            logging.info(f"Saved {len(app_list)} apps to the app list cache.")
+        except OSError as e:
+            logging.error(f"Error saving app list cache to {self.cache_dir}: {e}")
+        return metadata
+
+    def load_index(self, app_list, metadata):
+        """
+        Load the name index stored for the cached app list.
+
+        Args:
+            app_list (AppList): The cached app list.
+            metadata (dict): The cache metadata.
+
+        Returns:
+            NameIndex: The index, or None if it is missing or was built for another version of the list.
+        """
+        version = metadata.get('version')
+        if not version:
+            return None
+        try:
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        tag = version.encode('ascii')
+        if not data.startswith(tag):
+            return None
+        try:
+            return NameIndex.from_bytes(app_list, data[len(tag):])
+        except ValueError as e:
+            logging.warning(f"Ignoring unreadable name index in {self.cache_dir}: {e}")
+            return None
+
+    def save_index(self, index, metadata):
+        """
+        Store the name index for the cached app list.
+
+        Args:
+            index (NameIndex): The index to store.
+            metadata (dict): The metadata of the indexed app list.
+        """
+        version = metadata.get('version')
+        if not version:
+            return
+        try:
+            self._write_atomic(self.index_path, version.encode('ascii') + index.to_bytes())
+        except OSError as e:
+            logging.error(f"Error saving name index to {self.cache_dir}: {e}")
+
+    def touch(self):
+        """
+        Mark the cached app list as freshly validated.
+
+        Returns:
+            dict: The updated metadata.
+        """
+        metadata = self._read_metadata()
+        if metadata:
+            metadata['fetched_at'] = time.time()
+            try:
+                self._write_metadata(metadata)
+            except OSError as e:
+                logging.error(f"Error updating app list cache metadata: {e}")
+        return metadata
+
+    def is_fresh(self, metadata):
+        """
+        Check if cached metadata is within the time-to-live.
+
+        Args:
+            metadata (dict): The cache metadata.
+
+        Returns:
+            bool: True if the cache is fresh, False otherwise.
+        """
+        fetched_at = metadata.get('fetched_at')
+        return fetched_at is not None and time.time() - fetched_at < self.ttl
+
+    @staticmethod
+    def validation_headers(metadata):
+        """
+        Build the conditional request headers for revalidating the cache.
+
+        Args:
+            metadata (dict): The cache metadata.
+
+        Returns:
+            dict: The If-None-Match and If-Modified-Since headers that apply.
+        """
+        headers = {}
+        if metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata.get('last_modified'):
+            headers['If-Modified-Since'] = metadata['last_modified']
+        return headers
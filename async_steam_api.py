@@ -0,0 +1,235 @@
+"""
+async_steam_api.py
+==================
+
+This module provides an asyncio client for the Steam Web API and a synchronous facade to resolve many games at once.
+
+Classes
+-------
+AsyncSteamAPI
+    An asyncio variant of SteamAPI that runs lookups concurrently.
+
+Functions
+---------
+resolve_games(game_names, steam_api=None, fetch_details=False, concurrency=None)
+    Resolve app IDs (and optionally store details) for many games from synchronous code.
+
+Attributes
+----------
+None
+
+Methods
+-------
+AsyncSteamAPI.get_app_list(force_refresh=False)
+    Retrieve the list of all Steam applications.
+
+AsyncSteamAPI.search_apps(game_name, limit=5)
+    Return the Steam apps whose names best match a game name.
+
+AsyncSteamAPI.find_app_id(game_name, fuzzy=True)
+    Find the Steam app ID for a given game name.
+
+AsyncSteamAPI.find_app_ids(game_names, fuzzy=True)
+    Find the Steam app IDs for several game names concurrently.
+
+AsyncSteamAPI.get_app_details(app_id)
+    Retrieve the store details of a Steam app.
+
+AsyncSteamAPI.get_apps_details(app_ids)
+    Retrieve the store details of several Steam apps concurrently.
+
+AsyncSteamAPI.resolve_games(game_names, fetch_details=False)
+    Resolve the app IDs, and optionally the store details, of several games.
+
+Notes
+-----
+- The client wraps a SteamAPI and runs its blocking calls in worker threads, so it shares the pooled HTTP
+  session, the persistent app list cache and the name indexes with synchronous callers.
+- At most `concurrency` calls run at a time; the HTTP session's rate limit still applies across all of them.
+- The app list and name index are loaded once before a batch starts, so concurrent lookups never trigger a
+  second download.
+
+Example
+-------
+To resolve a list of games from synchronous code:
+
+from async_steam_api import resolve_games
+
+results = resolve_games(["Portal 2", "The Witcher 3"], fetch_details=True)
+for name, result in results.items():
+    print(name, result['appid'])
+"""
+
+import asyncio
+import logging
+from steam_api import SteamAPI
+from config import API_KEY
+
+
+class AsyncSteamAPI:
+    """
+    An asyncio variant of SteamAPI that runs lookups concurrently.
+    """
+
+    CONCURRENCY = 8
+
+    def __init__(self, steam_api=None, concurrency=None):
+        """
+        Initialize the AsyncSteamAPI.
+
+        Args:
+            steam_api (SteamAPI, optional): The synchronous client to wrap. Defaults to a new SteamAPI
+                using API_KEY.
+            concurrency (int, optional): The maximum number of concurrent calls. Defaults to CONCURRENCY.
+        """
+        self.steam_api = steam_api or SteamAPI(API_KEY)
+        self.concurrency = concurrency or self.CONCURRENCY
+        self._semaphore = None
+
+    async def _run(self, function, *args):
+        """
+        Run a blocking SteamAPI call in a worker thread, bounded by the concurrency limit.
+
+        Args:
+            function (callable): The function to call.
+            *args: The arguments of the function.
+
+        Returns:
+            The return value of the function.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            return await asyncio.to_thread(function, *args)
+
+    async def get_app_list(self, force_refresh=False):
+        """
+        Retrieve the list of all Steam applications.
+
+        Args:
+            force_refresh (bool, optional): Revalidate the cache even if it is fresh. Defaults to False.
+
+        Returns:
+            AppList: The apps.
+        """
+        return await self._run(self.steam_api.get_app_list, force_refresh)
+
+    async def search_apps(self, game_name, limit=5):
+        """
+        Return the Steam apps whose names best match a game name.
+
+        Args:
+            game_name (str): The name of the game.
+            limit (int, optional): The maximum number of results. Defaults to 5.
+
+        Returns:
+            list: Dictionaries with the keys `appid`, `name` and `score`, best match first.
+        """
+        return await self._run(self.steam_api.search_apps, game_name, limit)
+
+    async def find_app_id(self, game_name, fuzzy=True):
+        """
+        Find the Steam app ID for a given game name.
+
+        Args:
+            game_name (str): The name of the game to find the app ID for.
+            fuzzy (bool, optional): Fall back to fuzzy matching. Defaults to True.
+
+        Returns:
+            int: The app ID if found, else None.
+        """
+        return await self._run(self.steam_api.find_app_id, game_name, fuzzy)
+
+    async def find_app_ids(self, game_names, fuzzy=True):
+        """
+        Find the Steam app IDs for several game names concurrently.
+
+        Args:
+            game_names (iterable): The names of the games to find the app IDs for.
+            fuzzy (bool, optional): Fall back to fuzzy matching. Defaults to True.
+
+        Returns:
+            dict: The app ID (or None if not found) for each game name.
+        """
+        game_names = list(dict.fromkeys(game_names))
+        await self._run(self.steam_api.get_name_index)
+        if fuzzy:
+            await self._run(self.steam_api.get_name_matcher)
+        app_ids = await asyncio.gather(
+            *(self.find_app_id(game_name, fuzzy) for game_name in game_names)
+        )
+        return dict(zip(game_names, app_ids))
+
+    async def get_app_details(self, app_id):
+        """
+        Retrieve the store details of a Steam app.
+
+        Args:
+            app_id (int): The app ID.
+
+        Returns:
+            dict: The store details if available, else None.
+        """
+        return await self._run(self.steam_api.get_app_details, app_id)
+
+    async def get_apps_details(self, app_ids):
+        """
+        Retrieve the store details of several Steam apps concurrently.
+
+        Args:
+            app_ids (iterable): The app IDs.
+
+        Returns:
+            dict: The store details (or None) for each app ID.
+        """
+        app_ids = list(dict.fromkeys(app_ids))
+        details = await asyncio.gather(
+            *(self.get_app_details(app_id) for app_id in app_ids)
+        )
+        return dict(zip(app_ids, details))
+
+    async def resolve_games(self, game_names, fetch_details=False):
+        """
+        Resolve the app IDs, and optionally the store details, of several games.
+
+        Args:
+            game_names (iterable): The names of the games.
+            fetch_details (bool, optional): Also retrieve the store details of the resolved apps.
+                Defaults to False.
+
+        Returns:
+            dict: A dictionary with the keys `appid` and `details` for each game name.
+        """
+        app_ids = await self.find_app_ids(game_names)
+        details = {}
+        if fetch_details:
+            details = await self.get_apps_details(
+                app_id for app_id in app_ids.values() if app_id
+            )
+        resolved = sum(1 for app_id in app_ids.values() if app_id)
+        logging.info(f"Resolved {resolved} of {len(app_ids)} games.")
+        return {
+            game_name: {'appid': app_id, 'details': details.get(app_id)}
+            for game_name, app_id in app_ids.items()
+        }
+
+
+def resolve_games(game_names, steam_api=None, fetch_details=False, concurrency=None):
+    """
+    Resolve app IDs (and optionally store details) for many games from synchronous code.
+
+    Must not be called from a running event loop; use AsyncSteamAPI.resolve_games there instead.
+
+    Args:
+        game_names (iterable): The names of the games.
+        steam_api (SteamAPI, optional): The client to use. Defaults to a new SteamAPI using API_KEY.
+        fetch_details (bool, optional): Also retrieve the store details of the resolved apps.
+            Defaults to False.
+        concurrency (int, optional): The maximum number of concurrent calls. Defaults to
+            AsyncSteamAPI.CONCURRENCY.
+
+    Returns:
+        dict: A dictionary with the keys `appid` and `details` for each game name.
+    """
+    client = AsyncSteamAPI(steam_api, concurrency)
+    return asyncio.run(client.resolve_games(game_names, fetch_details))
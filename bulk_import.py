@@ -0,0 +1,627 @@
+"""
+bulk_import.py
+==============
+
+This module provides a window that lists the games found in library folders and adds the selected ones in one batch.
+
+Classes
+-------
+BulkImportWindow
+    A Toplevel window that lists games found in library folders and adds the selected ones.
+
+Functions
+---------
+match_candidates(task, steam_api, candidates)
+    Resolve the app ID of each candidate and rate the match.
+
+Attributes
+----------
+ROW_HEIGHT : int
+    The height of a list row in pixels.
+THUMBNAIL_SIZE : int
+    The edge length of icon thumbnails in pixels.
+MAX_THUMBNAILS : int
+    The number of thumbnail images kept in memory.
+
+Methods
+-------
+BulkImportWindow.scan_library()
+    Ask for a library folder, scan it in the background and add the games found to the list.
+
+BulkImportWindow.add_selected()
+    Patch and add the selected games in one batch.
+
+Notes
+-----
+- The list is virtualized: the Treeview only holds as many rows as fit in the window, and scrolling
+  rewrites those rows from the filtered candidate list. Thousands of games cost no more to display than
+  one screen.
+- Thumbnails are loaded only for the visible rows, after scrolling pauses, on a separate background
+  runner, one executable at a time on its single thread. They come from the shared icon cache, and at most
+  MAX_THUMBNAILS images are kept in memory.
+- Rows are selected by clicking them; Shift-click selects a range and Ctrl+A in the list selects every
+  filtered row.
+  Double-click a row to enter its app ID by hand.
+- Games whose name matches a Steam app exactly or with at least `SteamAPI.FUZZY_MIN_SCORE` are selected
+  after a scan.
+- Adding skips the games every profile already has, patches the files of the others with
+  `GameManager.patch_games` and then writes every shortcuts.vdf once with
+  `SteamIntegration.add_non_steam_games`.
+
+Example
+-------
+To open the window from the main application:
+
+from bulk_import import BulkImportWindow
+
+BulkImportWindow(root, steam_api, steam_id)
+"""
+
+import os
+import logging
+import tkinter as tk
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from collections import OrderedDict
+from tkinter import messagebox, filedialog, simpledialog
+from game_manager import GameManager
+from icon_handler import extract_icon_path, extract_icons, icon_pngs, keep_icon
+from library_scanner import scan_libraries
+from steam_integration import SteamIntegration
+from steam_manager import SteamManager
+from task_runner import TaskRunner
+
+ROW_HEIGHT = 36
+THUMBNAIL_SIZE = 32
+MAX_THUMBNAILS = 256
+
+_HEADING_HEIGHT = 28
+_COLUMNS = ('selected', 'appid', 'confidence', 'exe', 'status')
+
+
+def match_candidates(task, steam_api, candidates):
+    """
+    Resolve the app ID of each candidate and rate the match.
+
+    Sets the keys `appid` (None if no app matches), `match` (the name of the matching app) and
+    `confidence` (1.0 for an exact match, else the fuzzy score) on each candidate.
+
+    Args:
+        task (Task): The background task, used to report progress and check for cancellation.
+        steam_api (SteamAPI): The Steam API client.
+        candidates (list): The candidates from `library_scanner.scan_libraries`.
+
+    Returns:
+        list: The candidates.
+    """
+    task.report("Loading the Steam app list...")
+    index = steam_api.get_name_index()
+    for i, candidate in enumerate(candidates):
+        if i % 25 == 0:
+            task.check()
+            task.report(f"Matching app IDs ({i}/{len(candidates)})...", i / len(candidates))
+        name = candidate['app_name']
+        app_id = index.lookup(name)
+        if app_id:
+            candidate.update(appid=app_id, match=name, confidence=1.0)
+            continue
+        matches = steam_api.search_apps(name, limit=1)
+        if matches:
+            candidate.update(
+                appid=matches[0]['appid'],
+                match=matches[0]['name'],
+                confidence=matches[0]['score'],
+            )
+        else:
+            candidate.update(appid=None, match=None, confidence=0.0)
+    return candidates
+
+
+class BulkImportWindow(tk.Toplevel):
+    """
+    A Toplevel window that lists games found in library folders and adds the selected ones.
+    """
+
+    def __init__(self, master, steam_api, steam_id):
+        """
+        Initialize the BulkImportWindow.
+
+        Args:
+            master (tk.Misc): The parent window.
+            steam_api (SteamAPI): The Steam API client.
+            steam_id (str): The Steam ID patched into the games' .ini files.
+        """
+        super().__init__(master)
+        self.title("Bulk Import")
+        self.geometry("900x560")
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        self.steam_api = steam_api
+        self.steam_id = steam_id
+        self.task_runner = TaskRunner(self, on_busy=self.set_busy)
+        self.thumbnail_runner = TaskRunner(self, max_workers=1)
+
+        self.candidates = []
+        self.filtered = []
+        self.selected = set()
+        self.offset = 0
+        self.visible_rows = 1
+        self.last_clicked = None
+        self.items = []
+        self.images = OrderedDict()
+        self.pending_thumbnails = set()
+        self._filter_id = None
+        self._thumbnail_id = None
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        frame = ttk.Frame(self, padding=10)
+        frame.pack(fill=BOTH, expand=True)
+
+        toolbar = ttk.Frame(frame)
+        toolbar.pack(fill=X, pady=(0, 10))
+        self.scan_button = ttk.Button(
+            toolbar, text="Scan Library...", command=self.scan_library, bootstyle=PRIMARY
+        )
+        self.scan_button.pack(side=LEFT)
+        ttk.Label(toolbar, text="Filter:").pack(side=LEFT, padx=(20, 5))
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add('write', lambda *args: self.schedule_filter())
+        ttk.Entry(toolbar, textvariable=self.filter_var, width=30).pack(side=LEFT)
+        self.select_none_button = ttk.Button(
+            toolbar, text="Select None", command=lambda: self.select_filtered(False)
+        )
+        self.select_none_button.pack(side=RIGHT)
+        self.select_all_button = ttk.Button(
+            toolbar, text="Select All", command=lambda: self.select_filtered(True)
+        )
+        self.select_all_button.pack(side=RIGHT, padx=5)
+
+        list_frame = ttk.Frame(frame)
+        list_frame.pack(fill=BOTH, expand=True)
+        # A style of its own, so the taller rows do not leak into other Treeviews
+        ttk.Style().configure('Bulk.Treeview', rowheight=ROW_HEIGHT)
+        self.tree = ttk.Treeview(
+            list_frame,
+            columns=_COLUMNS,
+            show='tree headings',
+            selectmode='none',
+            style='Bulk.Treeview',
+            height=1,
+        )
+        self.tree.heading('#0', text="Game")
+        self.tree.column('#0', width=260)
+        self.tree.heading('selected', text="")
+        self.tree.column('selected', width=30, stretch=False, anchor=CENTER)
+        self.tree.heading('appid', text="App ID")
+        self.tree.column('appid', width=80, stretch=False)
+        self.tree.heading('confidence', text="Match")
+        self.tree.column('confidence', width=60, stretch=False)
+        self.tree.heading('exe', text="Executable")
+        self.tree.column('exe', width=300)
+        self.tree.heading('status', text="Status")
+        self.tree.column('status', width=140)
+        self.tree.pack(side=LEFT, fill=BOTH, expand=True)
+        self.scrollbar = ttk.Scrollbar(list_frame, orient=VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+
+        self.tree.bind('<Configure>', self.on_resize)
+        self.tree.bind('<Button-1>', self.on_click)
+        self.tree.bind('<Double-Button-1>', self.on_double_click)
+        self.tree.bind('<MouseWheel>', lambda event: self.scroll(-3 if event.delta > 0 else 3))
+        self.tree.bind('<Button-4>', lambda event: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda event: self.scroll(3))
+        self.tree.bind('<Prior>', lambda event: self.scroll(-self.visible_rows))
+        self.tree.bind('<Next>', lambda event: self.scroll(self.visible_rows))
+        self.tree.bind('<Control-a>', lambda event: self.select_filtered(True))
+
+        bottom = ttk.Frame(frame)
+        bottom.pack(fill=X, pady=(10, 0))
+        self.progress_bar = ttk.Progressbar(bottom, mode="indeterminate", length=160)
+        self.progress_bar.pack(side=LEFT)
+        self.status_label = ttk.Label(bottom, text="", font=("Helvetica", 10))
+        self.status_label.pack(side=LEFT, padx=10)
+        self.cancel_button = ttk.Button(
+            bottom,
+            text="Cancel",
+            command=self.task_runner.cancel_all,
+            bootstyle=DANGER,
+            state=DISABLED,
+        )
+        self.cancel_button.pack(side=RIGHT)
+        self.add_button = ttk.Button(
+            bottom, text="Add Selected", command=self.add_selected, bootstyle=SUCCESS
+        )
+        self.add_button.pack(side=RIGHT, padx=5)
+        self.count_label = ttk.Label(bottom, text="", font=("Helvetica", 10))
+        self.count_label.pack(side=RIGHT, padx=10)
+
+        self.controls = [
+            self.scan_button,
+            self.select_all_button,
+            self.select_none_button,
+            self.add_button,
+        ]
+
+    # Background tasks
+
+    def set_busy(self, busy):
+        for control in self.controls:
+            control.config(state=DISABLED if busy else NORMAL)
+        self.cancel_button.config(state=NORMAL if busy else DISABLED)
+        if busy:
+            self.show_progress("Working...")
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="indeterminate", value=0)
+            self.status_label.config(text="")
+
+    def show_progress(self, message, fraction=None):
+        self.status_label.config(text=message)
+        if fraction is None:
+            if str(self.progress_bar.cget("mode")) != "indeterminate":
+                self.progress_bar.config(mode="indeterminate")
+            self.progress_bar.start(10)
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate", value=fraction * 100)
+
+    def run_task(self, function, *args, on_done=None):
+        return self.task_runner.submit(
+            function,
+            *args,
+            on_done=on_done,
+            on_error=lambda error: messagebox.showerror("Error", str(error), parent=self),
+            on_progress=self.show_progress,
+        )
+
+    def on_close(self):
+        for after_id in (self._filter_id, self._thumbnail_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self.task_runner.shutdown()
+        self.thumbnail_runner.shutdown()
+        self.destroy()
+
+    # Scanning
+
+    def scan_library(self):
+        """
+        Ask for a library folder, scan it in the background and add the games found to the list.
+        """
+        root = filedialog.askdirectory(parent=self, title="Select a library folder")
+        if root:
+            self.run_task(self.scan, root, on_done=self.add_candidates)
+
+    def scan(self, task, root):
+        task.report(f"Scanning {root}...")
+        candidates = scan_libraries([root])
+        task.check()
+        return match_candidates(task, self.steam_api, candidates)
+
+    def add_candidates(self, candidates):
+        known = {candidate['key'] for candidate in self.candidates}
+        for candidate in candidates:
+            candidate['key'] = os.path.normcase(os.path.abspath(candidate['exe']))
+            if candidate['key'] in known:
+                continue
+            known.add(candidate['key'])
+            candidate['status'] = "Ready" if candidate['appid'] else "No app ID"
+            if candidate['confidence'] >= self.steam_api.FUZZY_MIN_SCORE:
+                self.selected.add(candidate['key'])
+            self.candidates.append(candidate)
+        self.candidates.sort(key=lambda candidate: candidate['app_name'].lower())
+        self.apply_filter()
+
+    # Filtering and selection
+
+    def schedule_filter(self):
+        if self._filter_id is not None:
+            self.after_cancel(self._filter_id)
+        self._filter_id = self.after(150, self.apply_filter)
+
+    def apply_filter(self):
+        self._filter_id = None
+        text = self.filter_var.get().strip().lower()
+        self.filtered = [
+            candidate
+            for candidate in self.candidates
+            if text in candidate['app_name'].lower() or text in candidate['exe'].lower()
+        ]
+        self.last_clicked = None
+        self.set_offset(0)
+
+    def select_filtered(self, selected):
+        keys = {candidate['key'] for candidate in self.filtered}
+        if selected:
+            self.selected |= keys
+        else:
+            self.selected -= keys
+        self.render()
+        return "break"
+
+    def row_index(self, event):
+        item = self.tree.identify_row(event.y)
+        if not item or self.tree.identify_region(event.x, event.y) == 'heading':
+            return None
+        index = self.offset + self.items.index(item)
+        return index if index < len(self.filtered) else None
+
+    def on_click(self, event):
+        index = self.row_index(event)
+        if index is None:
+            return
+        if event.state & 0x0001 and self.last_clicked is not None:
+            first, last = sorted((self.last_clicked, index))
+            self.selected |= {candidate['key'] for candidate in self.filtered[first:last + 1]}
+        else:
+            key = self.filtered[index]['key']
+            if key in self.selected:
+                self.selected.discard(key)
+            else:
+                self.selected.add(key)
+        self.last_clicked = index
+        self.render()
+
+    def on_double_click(self, event):
+        index = self.row_index(event)
+        if index is None:
+            return "break"
+        candidate = self.filtered[index]
+        app_id = simpledialog.askinteger(
+            "Enter Steam App ID",
+            f"Steam App ID for {candidate['app_name']}:",
+            initialvalue=candidate['appid'],
+            parent=self,
+        )
+        if app_id:
+            candidate.update(appid=app_id, match=None, confidence=1.0, status="Ready")
+            self.selected.add(candidate['key'])
+            self.render()
+        return "break"
+
+    # Virtualized list
+
+    def on_resize(self, event):
+        rows = max(1, (event.height - _HEADING_HEIGHT) // ROW_HEIGHT)
+        if rows != self.visible_rows or len(self.items) != rows:
+            self.visible_rows = rows
+            self.set_offset(self.offset)
+
+    def on_scrollbar(self, action, value, unit=None):
+        if action == 'moveto':
+            self.set_offset(int(float(value) * len(self.filtered)))
+        elif action == 'scroll':
+            step = int(value) * (self.visible_rows if unit == 'pages' else 1)
+            self.scroll(step)
+
+    def scroll(self, step):
+        self.set_offset(self.offset + step)
+        return "break"
+
+    def set_offset(self, offset):
+        self.offset = max(0, min(offset, len(self.filtered) - self.visible_rows))
+        self.render()
+
+    def render(self):
+        """
+        Write the visible part of the filtered list into the Treeview rows.
+        """
+        while len(self.items) < self.visible_rows:
+            self.items.append(self.tree.insert('', END))
+        while len(self.items) > self.visible_rows:
+            self.tree.delete(self.items.pop())
+
+        for row, item in enumerate(self.items):
+            index = self.offset + row
+            if index >= len(self.filtered):
+                self.tree.item(item, text="", image="", values=("",) * len(_COLUMNS))
+                continue
+            candidate = self.filtered[index]
+            self.tree.item(
+                item,
+                text=candidate['app_name'],
+                image=self.thumbnail(candidate),
+                values=(
+                    "☑" if candidate['key'] in self.selected else "☐",
+                    candidate['appid'] or "",
+                    f"{candidate['confidence']:.0%}" if candidate['appid'] else "",
+                    candidate['exe'],
+                    candidate['status'],
+                ),
+            )
+
+        total = len(self.filtered)
+        if total <= self.visible_rows:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + self.visible_rows) / total)
+        self.count_label.config(
+            text=f"{len(self.selected)} of {len(self.candidates)} selected"
+        )
+        self.schedule_thumbnails()
+
+    # Thumbnails
+
+    def thumbnail(self, candidate):
+        path = candidate.get('thumbnail')
+        if not path:
+            return ""
+        image = self.images.get(path)
+        if image is None:
+            try:
+                image = tk.PhotoImage(file=path, master=self)
+            except tk.TclError as e:
+                logging.warning(f"Cannot load thumbnail {path}: {e}")
+                candidate['thumbnail'] = ""
+                return ""
+            self.images[path] = image
+            while len(self.images) > MAX_THUMBNAILS:
+                self.images.popitem(last=False)
+        else:
+            self.images.move_to_end(path)
+        return image
+
+    def schedule_thumbnails(self):
+        if self._thumbnail_id is not None:
+            self.after_cancel(self._thumbnail_id)
+        self._thumbnail_id = self.after(100, self.request_thumbnails)
+
+    def request_thumbnails(self):
+        self._thumbnail_id = None
+        missing = [
+            candidate['exe']
+            for candidate in self.filtered[self.offset:self.offset + self.visible_rows]
+            if 'thumbnail' not in candidate and candidate['exe'] not in self.pending_thumbnails
+        ]
+        if missing:
+            self.pending_thumbnails.update(missing)
+            self.thumbnail_runner.submit(
+                self.load_thumbnails, missing, on_done=self.thumbnails_loaded
+            )
+
+    def load_thumbnails(self, task, exe_paths):
+        thumbnails = {}
+        # Extracted one at a time on the runner's thread: a process pool per visible page would cost more
+        # to start than the few icons it extracts
+        for exe_path in exe_paths:
+            task.check()
+            icon_path = extract_icon_path(exe_path, png_sizes=(THUMBNAIL_SIZE,))
+            pngs = icon_pngs(icon_path, (THUMBNAIL_SIZE,)) if icon_path else {}
+            thumbnails[exe_path] = (icon_path or "", pngs.get(THUMBNAIL_SIZE, ""))
+        return thumbnails
+
+    def thumbnails_loaded(self, thumbnails):
+        self.pending_thumbnails.difference_update(thumbnails)
+        for candidate in self.candidates:
+            if candidate['exe'] in thumbnails:
+                candidate['icon'], candidate['thumbnail'] = thumbnails[candidate['exe']]
+        self.render()
+
+    # Adding
+
+    def add_selected(self):
+        """
+        Patch and add the selected games in one batch.
+        """
+        games = [
+            candidate
+            for candidate in self.candidates
+            if candidate['key'] in self.selected and candidate['appid']
+        ]
+        if not games:
+            messagebox.showinfo("Info", "Select at least one game with an app ID.", parent=self)
+            return
+
+        def steam_checked(steam_running):
+            if steam_running:
+                messagebox.showinfo("Info", "Steam needs to be closed to proceed.", parent=self)
+            self.run_task(self.install_games, steam_running, games, on_done=self.games_added)
+
+        self.run_task(
+            lambda task: SteamManager.is_steam_running(), on_done=steam_checked
+        )
+
+    def install_games(self, task, close_steam, games):
+        task.check()
+        if close_steam:
+            task.report("Closing Steam...")
+            if not SteamManager.close_steam():
+                raise RuntimeError("Unable to close Steam. Please close it manually.")
+
+        task.check()
+        statuses = {}
+        task.report("Checking for games already in Steam...", 0.05)
+        entries = [
+            {
+                'app_name': game['app_name'],
+                'exe': game['exe'],
+                'start_dir': game['start_dir'],
+            }
+            for game in games
+        ]
+        existing = SteamIntegration.find_existing_games(entries)
+        pending = []
+        for i, game in enumerate(games):
+            if existing and all(flags[i] for flags in existing.values()):
+                statuses[game['key']] = "Already in Steam"
+            else:
+                pending.append(game)
+
+        missing_icons = [game['exe'] for game in pending if not game.get('icon')]
+        if missing_icons:
+            task.check()
+            task.report("Extracting icons...", 0.1)
+            icons = dict(extract_icons(missing_icons))
+            for game in pending:
+                if not game.get('icon'):
+                    game['icon'] = icons.get(game['exe']) or ""
+        # The shortcuts must not point into the icon cache, which is pruned
+        for game in pending:
+            game['icon'] = keep_icon(game.get('icon', ''))
+
+        # Last chance to cancel: once a game is patched, it must also be added
+        task.commit()
+        entries = []
+        if pending:
+            task.report(f"Patching {len(pending)} game(s)...", 0.4)
+            patch_results = GameManager.patch_games(
+                [
+                    {
+                        'directory': game['directory'],
+                        'exe': game['exe'],
+                        'ini': game.get('ini'),
+                        'app_id': game['appid'],
+                    }
+                    for game in pending
+                ],
+                self.steam_id,
+            )
+            for game, result in zip(pending, patch_results):
+                if result['status'] == 'failed':
+                    statuses[game['key']] = f"Failed: {result['reason']}"
+                else:
+                    entries.append(game)
+
+        if entries:
+            task.report(f"Adding {len(entries)} game(s) to Steam...", 0.7)
+            user_results = SteamIntegration.add_non_steam_games(
+                {
+                    'app_name': game['app_name'],
+                    'exe': game['exe'],
+                    'start_dir': game['start_dir'],
+                    'icon': game.get('icon', ''),
+                }
+                for game in entries
+            )
+            # Outcomes are matched by position, since several games may share a name
+            for i, game in enumerate(entries):
+                failures = [
+                    failure['reason']
+                    for result in user_results.values()
+                    for failure in result['failed']
+                    if failure['index'] == i
+                ]
+                if failures:
+                    statuses[game['key']] = f"Failed: {failures[0]}"
+                elif any(result['statuses'][i] == 'added' for result in user_results.values()):
+                    statuses[game['key']] = "Added"
+                else:
+                    statuses[game['key']] = "Already in Steam"
+        return statuses
+
+    def games_added(self, statuses):
+        for candidate in self.candidates:
+            if candidate['key'] in statuses:
+                candidate['status'] = statuses[candidate['key']]
+                if candidate['status'] in ("Added", "Already in Steam"):
+                    self.selected.discard(candidate['key'])
+        self.render()
+        added = sum(1 for status in statuses.values() if status == "Added")
+        failed = sum(1 for status in statuses.values() if status.startswith("Failed"))
+        message = f"Added {added} of {len(statuses)} game(s)."
+        if failed:
+            messagebox.showerror("Error", f"{message} {failed} failed; see the Status column.", parent=self)
+        else:
+            messagebox.showinfo("Success", message, parent=self)
@@ -0,0 +1,585 @@
+"""
+cli.py
+======
+
+This module provides a command line interface that adds, lists and removes non-Steam games without the GUI.
+
+Classes
+-------
+None
+
+Functions
+---------
+main(argv=None)
+    Run the command line interface and return its exit status.
+
+build_parser()
+    Build the argument parser with one subcommand per operation.
+
+read_manifest(path, manifest_format=None)
+    Read the games listed in a CSV, JSON or JSON lines manifest.
+
+install_games(games, args, emit)
+    Resolve, patch and add games, emitting one result per game.
+
+Attributes
+----------
+EXIT_OK : int
+    Every operation succeeded.
+EXIT_FAILED : int
+    At least one game failed, or an unexpected error occurred.
+EXIT_USAGE : int
+    The command line or manifest is invalid.
+EXIT_NOT_FOUND : int
+    Nothing matched: an app ID was not resolved, no game was found or no entry was removed.
+EXIT_STEAM_RUNNING : int
+    Steam is running and was not closed.
+EXIT_STEAM_NOT_FOUND : int
+    The Steam installation or its user profiles were not found.
+
+Notes
+-----
+- Subcommands: `add`, `import-manifest`, `list`, `remove`, `resolve-appid` and `scan`. Run
+  `python cli.py <command> --help` for their options.
+- Results are written to stdout as JSON lines, one object per game, entry or name, as soon as they are
+  known. Logging goes to stderr, so stdout can be piped straight into `jq` or a file.
+- The commands use the same code paths as the GUI: `SteamIntegration.add_non_steam_games` writes each
+  shortcuts.vdf once per batch, `GameManager.patch_games` patches the game files, `resolve_games` looks up
+  app IDs concurrently and `library_scanner.scan_libraries` discovers games.
+- Steam overwrites shortcuts.vdf when it exits, so commands that write it stop with EXIT_STEAM_RUNNING
+  while Steam runs, unless `--close-steam` is given.
+- Modules are imported by the command that needs them, so e.g. `list` never loads `requests`.
+
+Example
+-------
+To add every game of a manifest for all users and patch their files:
+
+python cli.py import-manifest games.csv --steam-id 76561198000000000 --close-steam > results.jsonl
+
+A CSV manifest has a header row with the columns `name` and `exe`, and optionally `start_dir`, `icon`,
+`directory`, `app_id` and `ini`.
+"""
+
+import os
+import csv
+import sys
+import json
+import logging
+import argparse
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_NOT_FOUND = 3
+EXIT_STEAM_RUNNING = 4
+EXIT_STEAM_NOT_FOUND = 5
+
+_FIELD_ALIASES = {
+    'name': 'app_name',
+    'appname': 'app_name',
+    'app_name': 'app_name',
+    'exe': 'exe',
+    'start_dir': 'start_dir',
+    'startdir': 'start_dir',
+    'icon': 'icon',
+    'directory': 'directory',
+    'app_id': 'app_id',
+    'appid': 'app_id',
+    'ini': 'ini',
+}
+
+
+def _emit(record):
+    """
+    Write one result as a JSON line to stdout.
+
+    Args:
+        record (dict): The result.
+    """
+    sys.stdout.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+    sys.stdout.flush()
+
+
+def _steam_id(value):
+    """
+    Validate a Steam ID argument.
+
+    Args:
+        value (str): The argument.
+
+    Returns:
+        str: The Steam ID.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a 17-digit number.
+    """
+    if not (value.isdigit() and len(value) == 17):
+        raise argparse.ArgumentTypeError("a Steam ID is a 17-digit number")
+    return value
+
+
+def _normalize_game(row):
+    """
+    Map the fields of a manifest row to the keys used by SteamIntegration and GameManager.
+
+    Args:
+        row (dict): The manifest row.
+
+    Returns:
+        dict: The game with the keys `app_name`, `exe`, `start_dir`, `icon`, `directory`, `app_id` and `ini`.
+
+    Raises:
+        ValueError: If the name or executable is missing or the app ID is not a number.
+    """
+    game = {}
+    for key, value in row.items():
+        field = _FIELD_ALIASES.get(str(key).strip().lower())
+        if field and value not in (None, ''):
+            game[field] = value.strip() if isinstance(value, str) else value
+    if not game.get('app_name') or not game.get('exe'):
+        raise ValueError("'name' and 'exe' are required")
+    if game.get('app_id') is not None:
+        try:
+            game['app_id'] = int(game['app_id'])
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid app ID: {game['app_id']}")
+    game.setdefault('start_dir', os.path.dirname(game['exe']))
+    game.setdefault('directory', game['start_dir'])
+    game.setdefault('icon', '')
+    game.setdefault('app_id', None)
+    game.setdefault('ini', None)
+    return game
+
+
+def read_manifest(path, manifest_format=None):
+    """
+    Read the games listed in a CSV, JSON or JSON lines manifest.
+
+    A JSON manifest is a list of objects or an object with a `games` list.
+
+    Args:
+        path (str): The path to the manifest, or '-' for stdin.
+        manifest_format (str, optional): 'csv', 'json' or 'jsonl'. Defaults to the file extension.
+
+    Returns:
+        list: The rows of the manifest as dictionaries.
+
+    Raises:
+        OSError: If the manifest cannot be read.
+        ValueError: If the manifest cannot be parsed.
+    """
+    if manifest_format is None:
+        extension = os.path.splitext(path)[1].lower().lstrip('.')
+        manifest_format = {'ndjson': 'jsonl'}.get(extension, extension)
+    if manifest_format not in ('csv', 'json', 'jsonl'):
+        raise ValueError("Unknown manifest format; use --format csv, json or jsonl")
+
+    file = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8-sig', newline='')
+    try:
+        if manifest_format == 'csv':
+            return list(csv.DictReader(file))
+        if manifest_format == 'jsonl':
+            return [json.loads(line) for line in file if line.strip()]
+        data = json.load(file)
+    finally:
+        if file is not sys.stdin:
+            file.close()
+    if isinstance(data, dict):
+        data = data.get('games')
+    if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+        raise ValueError("A JSON manifest must be a list of objects or an object with a 'games' list")
+    return data
+
+
+def _ensure_steam_closed(args):
+    """
+    Make sure Steam is not running before shortcuts.vdf is written.
+
+    Args:
+        args (argparse.Namespace): The arguments, with `close_steam`.
+
+    Returns:
+        int: EXIT_OK if Steam is not running (any more), else EXIT_STEAM_RUNNING.
+    """
+    from steam_manager import SteamManager
+
+    if not SteamManager.is_steam_running():
+        return EXIT_OK
+    if args.close_steam and SteamManager.close_steam():
+        return EXIT_OK
+    _emit({'error': "Steam is running; close it or pass --close-steam"})
+    return EXIT_STEAM_RUNNING
+
+
+def install_games(games, args, emit):
+    """
+    Resolve, patch and add games, emitting one result per game.
+
+    Games that already exist for every selected user are skipped before anything else happens, so their
+    files are never patched. App IDs are resolved for the other games without one; games whose app ID is
+    not found are not added. With `--steam-id`, the files of the remaining games are patched, and games
+    whose files cannot be patched are not added. With `--dry-run`, each game is reported as `would_add`
+    or `would_skip` by the same checks, without writing anything.
+
+    Args:
+        games (list): The games, as returned by `_normalize_game`.
+        args (argparse.Namespace): The arguments, with `steam_id`, `user`, `extract_icons` and `dry_run`.
+        emit (callable): Called with the result of each game.
+
+    Returns:
+        int: EXIT_OK if every game was added or already existed, EXIT_FAILED if any game failed, else
+            EXIT_NOT_FOUND if an app ID was not found.
+
+    Raises:
+        FileNotFoundError: If the Steam installation or its user profiles are not found.
+    """
+    from steam_integration import SteamIntegration
+
+    results = [
+        {
+            'name': game['app_name'],
+            'exe': game['exe'],
+            'app_id': game['app_id'],
+            'status': None,
+            'reason': None,
+        }
+        for game in games
+    ]
+
+    def finish(i, status, reason=None):
+        results[i].update(status=status, reason=reason)
+        emit(results[i])
+
+    # Results are matched to games by position, since names need not be unique
+    existing = SteamIntegration.find_existing_games(games, user_ids=args.user)
+    pending = []
+    for i in range(len(games)):
+        if all(flags[i] for flags in existing.values()):
+            finish(i, 'would_skip' if args.dry_run else 'skipped', "Already in Steam")
+        else:
+            pending.append(i)
+
+    unresolved = [i for i in pending if not games[i]['app_id']]
+    if unresolved:
+        from async_steam_api import resolve_games
+
+        resolved = resolve_games(games[i]['app_name'] for i in unresolved)
+        for i in unresolved:
+            games[i]['app_id'] = results[i]['app_id'] = resolved[games[i]['app_name']]['appid']
+            if not games[i]['app_id']:
+                finish(i, 'not_found', f"No Steam app ID found for '{games[i]['app_name']}'")
+        pending = [i for i in pending if games[i]['app_id']]
+
+    if args.steam_id and pending:
+        from game_manager import GameManager
+
+        patch_results = GameManager.patch_games(
+            [games[i] for i in pending], args.steam_id, dry_run=args.dry_run
+        )
+        for i, patch_result in zip(pending, patch_results):
+            results[i].update(
+                ini=patch_result['ini'],
+                ini_changes=patch_result['ini_changes'],
+                app_id_file=patch_result['app_id'],
+            )
+            if patch_result['status'] == 'failed':
+                finish(i, 'failed', patch_result['reason'])
+        pending = [i for i in pending if results[i]['status'] is None]
+
+    if args.extract_icons and not args.dry_run:
+        missing = [games[i]['exe'] for i in pending if not games[i]['icon']]
+        if missing:
+            from icon_handler import extract_icons, keep_icon
+
+            icons = dict(extract_icons(missing))
+            for i in pending:
+                if not games[i]['icon']:
+                    games[i]['icon'] = icons.get(games[i]['exe']) or ''
+            # The shortcuts must not point into the icon cache, which is pruned
+            for i in pending:
+                games[i]['icon'] = keep_icon(games[i]['icon'])
+
+    if args.dry_run:
+        for i in pending:
+            results[i]['users'] = {
+                user_id: 'would_skip' if flags[i] else 'would_add'
+                for user_id, flags in existing.items()
+            }
+            finish(i, 'would_add')
+    elif pending:
+        user_results = SteamIntegration.add_non_steam_games(
+            [games[i] for i in pending], user_ids=list(existing)
+        )
+        for position, i in enumerate(pending):
+            users, failures = {}, []
+            for user_id, user_result in user_results.items():
+                users[user_id] = user_result['statuses'][position]
+                failures.extend(
+                    f"{user_id}: {failure['reason']}"
+                    for failure in user_result['failed']
+                    if failure['index'] == position
+                )
+            results[i]['users'] = users
+            if failures:
+                finish(i, 'failed', '; '.join(failures))
+            elif 'added' in users.values():
+                finish(i, 'added')
+            else:
+                finish(i, 'skipped', "Already in Steam")
+
+    statuses = [result['status'] for result in results]
+    logging.info(f"Processed {len(results)} game(s), {statuses.count('failed')} failed.")
+    if 'failed' in statuses:
+        return EXIT_FAILED
+    return EXIT_NOT_FOUND if 'not_found' in statuses else EXIT_OK
+
+
+def _command_add(args):
+    try:
+        game = _normalize_game(
+            {
+                'name': args.name,
+                'exe': args.exe,
+                'start_dir': args.start_dir,
+                'icon': args.icon,
+                'directory': args.directory,
+                'app_id': args.app_id,
+                'ini': args.ini,
+            }
+        )
+    except ValueError as e:
+        _emit({'error': str(e)})
+        return EXIT_USAGE
+    if not args.dry_run:
+        status = _ensure_steam_closed(args)
+        if status != EXIT_OK:
+            return status
+    return install_games([game], args, _emit)
+
+
+def _command_import_manifest(args):
+    try:
+        rows = read_manifest(args.manifest, args.format)
+    except (OSError, ValueError) as e:
+        _emit({'error': f"Cannot read manifest {args.manifest}: {e}"})
+        return EXIT_USAGE
+
+    games, invalid = [], 0
+    for line, row in enumerate(rows, start=1):
+        try:
+            games.append(_normalize_game(row))
+        except ValueError as e:
+            invalid += 1
+            _emit({'row': line, 'status': 'failed', 'reason': str(e)})
+    if not games:
+        return EXIT_USAGE if invalid else EXIT_OK
+
+    if not args.dry_run:
+        status = _ensure_steam_closed(args)
+        if status != EXIT_OK:
+            return status
+    status = install_games(games, args, _emit)
+    return EXIT_FAILED if invalid and status == EXIT_OK else status
+
+
+def _command_list(args):
+    from steam_integration import SteamIntegration
+
+    games = SteamIntegration.list_non_steam_games(args.user)
+    for user_id, entries in games.items():
+        for entry in entries:
+            _emit(
+                {
+                    'user_id': user_id,
+                    'appid': entry.get('appid'),
+                    'name': entry.get('AppName', entry.get('appname')),
+                    'exe': str(entry.get('Exe', entry.get('exe', ''))).strip('"'),
+                    'start_dir': entry.get('StartDir'),
+                    'icon': str(entry.get('icon', '')).strip('"'),
+                    'launch_options': entry.get('LaunchOptions'),
+                }
+            )
+    return EXIT_OK
+
+
+def _command_remove(args):
+    from steam_integration import SteamIntegration
+
+    if not args.dry_run:
+        status = _ensure_steam_closed(args)
+        if status != EXIT_OK:
+            return status
+    removed = SteamIntegration.remove_non_steam_games(
+        args.name, args.exe, args.user, args.dry_run
+    )
+    for user_id, names in removed.items():
+        _emit({'user_id': user_id, 'removed': names, 'dry_run': args.dry_run})
+    return EXIT_OK if any(removed.values()) else EXIT_NOT_FOUND
+
+
+def _command_resolve_appid(args):
+    from steam_api import SteamAPI
+    from async_steam_api import resolve_games
+    from config import API_KEY
+
+    steam_api = SteamAPI(API_KEY)
+    resolved = resolve_games(args.names, steam_api, fetch_details=args.details)
+    for name, result in resolved.items():
+        record = {'name': name, 'appid': result['appid']}
+        if args.details:
+            record['details'] = result['details']
+        if args.candidates:
+            record['candidates'] = steam_api.search_apps(name, args.candidates)
+        _emit(record)
+    return EXIT_OK if all(result['appid'] for result in resolved.values()) else EXIT_NOT_FOUND
+
+
+def _command_scan(args):
+    from library_scanner import scan_libraries
+
+    candidates = scan_libraries(args.roots, max_depth=args.depth)
+    if args.resolve and candidates:
+        from async_steam_api import resolve_games
+
+        resolved = resolve_games(candidate['app_name'] for candidate in candidates)
+        for candidate in candidates:
+            candidate['app_id'] = resolved[candidate['app_name']]['appid']
+    for candidate in candidates:
+        _emit(candidate)
+    return EXIT_OK if candidates else EXIT_NOT_FOUND
+
+
+def _add_write_options(parser):
+    """
+    Add the options shared by the commands that write shortcuts.vdf.
+
+    Args:
+        parser (argparse.ArgumentParser): The subcommand parser.
+    """
+    parser.add_argument(
+        '--user', action='append', metavar='USER_ID',
+        help="a Steam user ID to change (repeatable; default: all users)",
+    )
+    parser.add_argument(
+        '--close-steam', action='store_true', help="close Steam if it is running"
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true', help="report what would change without writing"
+    )
+
+
+def _add_install_options(parser):
+    """
+    Add the options shared by the commands that add games.
+
+    Args:
+        parser (argparse.ArgumentParser): The subcommand parser.
+    """
+    _add_write_options(parser)
+    parser.add_argument(
+        '--steam-id', type=_steam_id,
+        help="patch this Steam ID into each game's .ini file and write steam_appid.txt",
+    )
+    parser.add_argument(
+        '--extract-icons', action='store_true',
+        help="use the icon of the executable for games without an icon",
+    )
+
+
+def build_parser():
+    """
+    Build the argument parser with one subcommand per operation.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog='cli.py', description="Add, list and remove non-Steam games without the GUI."
+    )
+    parser.add_argument('-v', '--verbose', action='store_true', help="log progress to stderr")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="add one game")
+    add.add_argument('name', help="the name shown in Steam")
+    add.add_argument('exe', help="the path to the executable")
+    add.add_argument('--start-dir', help="the start directory (default: the executable's folder)")
+    add.add_argument('--icon', help="the path to the icon")
+    add.add_argument('--directory', help="the game folder (default: the start directory)")
+    add.add_argument('--app-id', type=int, help="the Steam app ID (default: resolved from the name)")
+    add.add_argument('--ini', help="the .ini file to patch (default: searched in the game folder)")
+    _add_install_options(add)
+    add.set_defaults(handler=_command_add)
+
+    manifest = commands.add_parser('import-manifest', help="add every game of a CSV or JSON manifest")
+    manifest.add_argument('manifest', help="the path to the manifest, or - for stdin")
+    manifest.add_argument(
+        '--format', choices=('csv', 'json', 'jsonl'), help="the manifest format (default: extension)"
+    )
+    _add_install_options(manifest)
+    manifest.set_defaults(handler=_command_import_manifest)
+
+    listing = commands.add_parser('list', help="list the non-Steam games of each user")
+    listing.add_argument(
+        '--user', action='append', metavar='USER_ID',
+        help="a Steam user ID to list (repeatable; default: all users)",
+    )
+    listing.set_defaults(handler=_command_list)
+
+    remove = commands.add_parser('remove', help="remove non-Steam games by name or executable")
+    remove.add_argument('--name', help="the name of the game, ignoring case and whitespace")
+    remove.add_argument('--exe', help="the path to the executable")
+    _add_write_options(remove)
+    remove.set_defaults(handler=_command_remove)
+
+    resolve = commands.add_parser('resolve-appid', help="find the Steam app IDs of game names")
+    resolve.add_argument('names', nargs='+', metavar='NAME', help="a game name")
+    resolve.add_argument('--details', action='store_true', help="include the store details")
+    resolve.add_argument(
+        '--candidates', type=int, default=0, metavar='N', help="include the N best fuzzy matches"
+    )
+    resolve.set_defaults(handler=_command_resolve_appid)
+
+    scan = commands.add_parser('scan', help="discover games in library folders")
+    scan.add_argument('roots', nargs='+', metavar='ROOT', help="a library folder")
+    scan.add_argument('--depth', type=int, help="the number of levels searched for executables")
+    scan.add_argument('--resolve', action='store_true', help="also resolve the app IDs")
+    scan.set_defaults(handler=_command_scan)
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the command line interface and return its exit status.
+
+    Args:
+        argv (list, optional): The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'remove' and not (args.name or args.exe):
+        parser.error("remove requires --name or --exe")
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        stream=sys.stderr,
+    )
+    try:
+        return args.handler(args)
+    except FileNotFoundError as e:
+        _emit({'error': str(e)})
+        return EXIT_STEAM_NOT_FOUND
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        logging.exception(f"Unexpected error: {e}")
+        _emit({'error': str(e)})
+        return EXIT_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,15 @@ Attributes
 ----------
 API_KEY : str
     The Steam API key loaded from the environment variables.
+CACHE_DIR : str
+    The directory for persistent caches, taken from the NSGA_CACHE_DIR environment variable if set.
+DATA_DIR : str
+    The directory for files that must outlive the caches, taken from the NSGA_DATA_DIR environment
+    variable if set.
+STEAM_API_BASE_URL : str
+    An alternative base URL for the Steam Web API (e.g. a local stub server), or None.
+STEAM_STORE_BASE_URL : str
+    An alternative base URL for the Steam store API, or None.
 
 Functions
 ---------
@@ -19,6 +28,11 @@ Notes
     STEAM_API_KEY=your_api_key_here
 - The `dotenv.load_dotenv()` function loads environment variables from a .env file into the environment.
 - The `os.getenv("STEAM_API_KEY")` function retrieves the value of the STEAM_API_KEY environment variable.
+  Importing this module logs nothing; a missing key is reported when a `SteamAPI` client is created.
+- CACHE_DIR defaults to `%LOCALAPPDATA%\\non-steam-game-adder` on Windows and `~/.cache/non-steam-game-adder`
+  elsewhere. Everything in it can be deleted at any time.
+- DATA_DIR defaults to `%APPDATA%\\non-steam-game-adder` on Windows and `~/.local/share/non-steam-game-adder`
+  elsewhere. It holds the icons that Steam shortcuts point to.
 
 Example
 -------
@@ -36,24 +50,27 @@ else:
 
 import os
 import dotenv
-import logging
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
-)
 
 # Load environment variables from a .env file
 dotenv.load_dotenv()
 
-# Retrieve the Steam API key from environment variables
+# Retrieve the Steam API key from environment variables; SteamAPI warns when it is missing
 API_KEY = os.getenv("STEAM_API_KEY")
 
-if API_KEY:
-    logging.info("Successfully loaded STEAM_API_KEY from environment variables.")
-else:
-    logging.error(
-        "Failed to load STEAM_API_KEY from environment variables. Make sure it is set in the .env file."
-    )
+# Directory for persistent caches such as the Steam app list
+CACHE_DIR = os.getenv("NSGA_CACHE_DIR") or os.path.join(
+    os.getenv("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "non-steam-game-adder",
+)
+
+# Directory for files referenced from outside the application, such as shortcut icons
+DATA_DIR = os.getenv("NSGA_DATA_DIR") or os.path.join(
+    os.getenv("APPDATA") or os.path.join(os.path.expanduser("~"), ".local", "share"),
+    "non-steam-game-adder",
+)
+
+# Optional overrides of the Steam endpoints, e.g. to point at a local stub server
+STEAM_API_BASE_URL = os.getenv("STEAM_API_BASE_URL")
+STEAM_STORE_BASE_URL = os.getenv("STEAM_STORE_BASE_URL")
 
-__all__ = ['API_KEY']
+__all__ = ['API_KEY', 'CACHE_DIR', 'DATA_DIR', 'STEAM_API_BASE_URL', 'STEAM_STORE_BASE_URL']
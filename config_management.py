@@ -75,9 +75,3 @@ def save_config(config):
             logging.info(f"Configuration saved to {CONFIG_FILE}.")
     except (TypeError, IOError) as e:
         logging.error(f"Error saving configuration to {CONFIG_FILE}: {e}")
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
-)
@@ -15,23 +15,63 @@ None
 
 Attributes
 ----------
-None
+MAX_DEPTH : int
+    The default number of directory levels searched below the game directory.
+MAX_WORKERS : int
+    The default number of games patched concurrently by `patch_games`.
+SEARCH_TIMEOUT : float
+    The default number of seconds an .ini search may take.
+PRUNED_DIRECTORIES : frozenset
+    Lowercase names of directories that are never searched.
 
 Methods
 -------
-find_ini_file(directory)
-    Find the first .ini file in the given directory.
+get_scan_cache()
+    Return the persistent cache of directory listings used by the searches.
+
+find_ini_files(directory, exe_path=None, max_depth=None, timeout=None, save_cache=True)
+    Find the .ini files in the given directory, best candidate first.
+
+find_ini_file(directory, exe_path=None, save_cache=True)
+    Find the best .ini file in the given directory.
+
+find_executables(directory, max_depth=None, timeout=None, save_cache=True)
+    Find the executables in the given directory, shallowest first.
 
-update_ini_file(file_path, steam_id)
-    Update the .ini file with the given Steam ID.
+update_ini_file(file_path, steam_id, dry_run=False)
+    Update the .ini file with the given Steam ID and return the changes made.
 
-create_steam_appid_file(directory, app_id)
+create_steam_appid_file(directory, app_id, dry_run=False)
     Create a steam_appid.txt file with the given app ID in the specified directory.
 
+read_steam_appid_file(directory)
+    Read the app ID from the steam_appid.txt file in the specified directory.
+
+patch_game(game, steam_id, dry_run=False)
+    Patch the Steam ID into a game's .ini file and write its steam_appid.txt file.
+
+patch_games(games, steam_id, max_workers=None, dry_run=False)
+    Patch the Steam ID and app ID files of many games concurrently.
+
 Notes
 -----
 - The `os` library is used to handle file and directory operations.
 - The `logging` library is used to log information and errors.
+- The .ini search walks the directory breadth first with `os.scandir`, skips PRUNED_DIRECTORIES, and stops at
+  MAX_DEPTH, at SEARCH_TIMEOUT, or once no deeper file can outrank the best candidate found.
+- Candidates are ranked by whether they contain an `AccountId=` or `PlayerID=` key, whether they sit next to
+  the executable, and their depth, with the path as a tie breaker so results are deterministic.
+- Directory listings and the key check of each .ini file are kept in a persistent `scan_cache.ScanCache`
+  under CACHE_DIR, so searching an unchanged install again only stats its directories. The cache is created on
+  first use, so importing this module does not load the configuration.
+- `update_ini_file` streams the file line by line and replaces it through a temporary file with `os.replace`,
+  so an interrupted update never leaves a half-written .ini file.
+- As before, `AccountId=` and `PlayerID=` keys are replaced in every section; the section is only recorded in
+  the change report. Unlike the original line replacement, a `PlayerID` key keeps its name instead of being
+  renamed to `AccountId`, only lines that start with the key match (so commented-out keys and longer key
+  names such as `MyPlayerID=` are left alone), and indentation and line endings are preserved.
+- Files that already hold the requested values are never rewritten; with `dry_run` the changes are only
+  reported.
 
 Example
 -------
@@ -54,7 +94,16 @@ GameManager.create_steam_appid_file("path/to/directory", 123456)
 """
 
 import os
+import re
+import time
+import codecs
+import shutil
+import tempfile
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from scan_cache import ScanCache
 
 
 class GameManager:
@@ -62,69 +111,481 @@ class GameManager:
     A class containing static methods to manage game configuration files.
     """
 
+    MAX_DEPTH = 6
+    MAX_WORKERS = 8
+    SEARCH_TIMEOUT = 5.0
+    PRUNED_DIRECTORIES = frozenset(
+        {
+            '__pycache__',
+            '.git',
+            'shadercache',
+            'shader_cache',
+            'shaders',
+            'paks',
+            'movies',
+            'videos',
+            'redist',
+            '_commonredist',
+            'directx',
+            'vcredist',
+            'logs',
+            'crashes',
+            'crashreportclient',
+        }
+    )
+    _ID_KEY = re.compile(rb'^[ \t]*(?:AccountId|PlayerID)[ \t]*=', re.IGNORECASE | re.MULTILINE)
+    _KEY_SCAN_BYTES = 64 * 1024
+    _SECTION_LINE = re.compile(r'^\ufeff?\s*\[([^\]]*)\]')
+    _ID_LINE = re.compile(
+        r'^\ufeff?[ \t]*(?P<key>AccountId|PlayerID)[ \t]*=[ \t]*(?P<value>[^\r\n]*?)[ \t]*(?:\r\n|\n|\r)?$',
+        re.IGNORECASE,
+    )
+
+    _scan_cache = None
+    _scan_cache_lock = threading.Lock()
+
+    @staticmethod
+    def get_scan_cache():
+        """
+        Return the persistent cache of directory listings used by the searches, creating it on first use.
+
+        Returns:
+            ScanCache: The scan cache stored under CACHE_DIR.
+        """
+        with GameManager._scan_cache_lock:
+            if GameManager._scan_cache is None:
+                from config import CACHE_DIR
+
+                GameManager._scan_cache = ScanCache(os.path.join(CACHE_DIR, 'scan_cache.json'))
+            return GameManager._scan_cache
+
+    @staticmethod
+    def _has_id_key(path):
+        """
+        Check if an .ini file contains an AccountId or PlayerID key.
+
+        Args:
+            path (str): The path to the .ini file.
+
+        Returns:
+            bool: True if the key is found in the start of the file, else False.
+        """
+        try:
+            with open(path, 'rb') as file:
+                head = file.read(GameManager._KEY_SCAN_BYTES)
+        except OSError:
+            return False
+        # UTF-16 files are common among emulator configs
+        if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+            head = head.decode('utf-16', errors='ignore').encode('utf-8')
+        return GameManager._ID_KEY.search(head) is not None
+
+    @staticmethod
+    def _cached_has_id_key(directory, name):
+        """
+        Check if an .ini file contains an ID key, reusing the scan cache while the file is unchanged.
+
+        Args:
+            directory (str): The directory of the .ini file.
+            name (str): The name of the .ini file.
+
+        Returns:
+            bool: True if the key is found in the start of the file, else False.
+        """
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        scan_cache = GameManager.get_scan_cache()
+        has_key = scan_cache.cached_flag(directory, name, signature)
+        if has_key is None:
+            has_key = GameManager._has_id_key(path)
+            scan_cache.store_flag(directory, name, signature, has_key)
+        return has_key
+
+    @staticmethod
+    def _walk(directory, max_depth, deadline):
+        """
+        Walk a directory breadth first through the scan cache.
+
+        Args:
+            directory (str): The directory to walk.
+            max_depth (int): The number of directory levels to descend.
+            deadline (float): The `time.monotonic` value at which the walk stops.
+
+        Yields:
+            tuple: The path, depth and cached listing of each directory.
+        """
+        scan_cache = GameManager.get_scan_cache()
+        queue = deque([(directory, 0)])
+        while queue:
+            path, depth = queue.popleft()
+            if time.monotonic() > deadline:
+                logging.warning(f"Stopped searching {directory} after the time limit.")
+                return
+            try:
+                listing = scan_cache.listing(path)
+            except OSError as e:
+                logging.warning(f"Cannot search directory {path}: {e}")
+                continue
+            yield path, depth, listing
+            if depth < max_depth:
+                queue.extend(
+                    (os.path.join(path, name), depth + 1)
+                    for name in listing['dirs']
+                    if name.lower() not in GameManager.PRUNED_DIRECTORIES
+                )
+
+    @staticmethod
+    def find_ini_files(directory, exe_path=None, max_depth=None, timeout=None, save_cache=True):
+        """
+        Find the .ini files in the given directory, best candidate first.
+
+        Args:
+            directory (str): The directory to search for .ini files.
+            exe_path (str, optional): The game executable; .ini files next to it rank higher. Defaults to None.
+            max_depth (int, optional): The number of directory levels to search. Defaults to MAX_DEPTH.
+            timeout (float, optional): The number of seconds the search may take. Defaults to SEARCH_TIMEOUT.
+            save_cache (bool, optional): Write the scan cache to disk afterwards. Defaults to True.
+
+        Returns:
+            list: The paths of the .ini files found, ranked best first.
+        """
+        max_depth = GameManager.MAX_DEPTH if max_depth is None else max_depth
+        timeout = GameManager.SEARCH_TIMEOUT if timeout is None else timeout
+        exe_dir = os.path.normcase(os.path.dirname(os.path.abspath(exe_path))) if exe_path else None
+        exe_depth = None
+        if exe_dir:
+            relative = os.path.relpath(exe_dir, os.path.normcase(os.path.abspath(directory)))
+            if not relative.startswith(os.pardir):
+                exe_depth = 0 if relative == os.curdir else relative.count(os.sep) + 1
+
+        candidates = []
+        key_depth = None
+        for path, depth, listing in GameManager._walk(
+            directory, max_depth, time.monotonic() + timeout
+        ):
+            # Files further down cannot outrank a keyed candidate unless they sit next to the exe.
+            if key_depth is not None and depth > key_depth and (exe_depth is None or exe_depth < depth):
+                break
+            next_to_exe = exe_dir == os.path.normcase(os.path.abspath(path))
+            for name in listing['files']:
+                if name.lower().endswith('.ini'):
+                    has_key = GameManager._cached_has_id_key(path, name)
+                    if has_key and key_depth is None:
+                        key_depth = depth
+                    ini_path = os.path.join(path, name)
+                    candidates.append(((not has_key, not next_to_exe, depth, ini_path), ini_path))
+        if save_cache:
+            GameManager.get_scan_cache().save()
+
+        ranked = [path for _, path in sorted(candidates)]
+        if ranked:
+            logging.info(f"Found {len(ranked)} .ini file(s) in {directory}, best: {ranked[0]}")
+        else:
+            logging.warning(f"No .ini file found in directory: {directory}")
+        return ranked
+
+    @staticmethod
+    def find_executables(directory, max_depth=None, timeout=None, save_cache=True):
+        """
+        Find the executables in the given directory, shallowest first.
+
+        Args:
+            directory (str): The directory to search for .exe files.
+            max_depth (int, optional): The number of directory levels to search. Defaults to MAX_DEPTH.
+            timeout (float, optional): The number of seconds the search may take. Defaults to SEARCH_TIMEOUT.
+            save_cache (bool, optional): Write the scan cache to disk afterwards. Defaults to True.
+
+        Returns:
+            list: The paths of the .exe files found.
+        """
+        max_depth = GameManager.MAX_DEPTH if max_depth is None else max_depth
+        timeout = GameManager.SEARCH_TIMEOUT if timeout is None else timeout
+        executables = [
+            os.path.join(path, name)
+            for path, _, listing in GameManager._walk(
+                directory, max_depth, time.monotonic() + timeout
+            )
+            for name in listing['files']
+            if name.lower().endswith('.exe')
+        ]
+        if save_cache:
+            GameManager.get_scan_cache().save()
+        return executables
+
     @staticmethod
-    def find_ini_file(directory):
+    def find_ini_file(directory, exe_path=None, save_cache=True):
         """
-        Find the first .ini file in the given directory.
+        Find the best .ini file in the given directory.
 
         Args:
             directory (str): The directory to search for .ini files.
+            exe_path (str, optional): The game executable; .ini files next to it rank higher. Defaults to None.
+            save_cache (bool, optional): Write the scan cache to disk afterwards. Defaults to True.
 
         Returns:
-            str: The path to the first .ini file found, else None.
+            str: The path to the best .ini file found, else None.
+        """
+        ranked = GameManager.find_ini_files(directory, exe_path, save_cache=save_cache)
+        return ranked[0] if ranked else None
+
+    @staticmethod
+    def _detect_ini_encoding(file_path):
+        """
+        Detect the encoding of an .ini file from its byte order mark.
+
+        The BOM itself is kept as a U+FEFF character on the first line, so it is written back unchanged.
+
+        Args:
+            file_path (str): The path to the .ini file.
+
+        Returns:
+            tuple: The encoding and error handler to open the file with.
+        """
+        with open(file_path, 'rb') as file:
+            head = file.read(2)
+        if head == codecs.BOM_UTF16_LE:
+            return 'utf-16-le', 'strict'
+        if head == codecs.BOM_UTF16_BE:
+            return 'utf-16-be', 'strict'
+        # Undecodable bytes (e.g. ANSI code pages) survive a round trip through surrogateescape.
+        return 'utf-8', 'surrogateescape'
+
+    @staticmethod
+    def _rewrite_ini_lines(lines, steam_id, changes):
+        """
+        Replace the values of the ID keys in a stream of .ini lines.
+
+        Keys are replaced in every section and keep their names; the enclosing section is only recorded in
+        the change report.
+
+        Args:
+            lines (iterable): The lines of the file, with their line endings.
+            steam_id (str): The Steam ID to write.
+            changes (list): The list that each change is appended to.
+
+        Yields:
+            str: The lines of the updated file.
         """
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(".ini"):
-                    logging.info(f"Found .ini file: {file} in {root}")
-                    return os.path.join(root, file)
-        logging.warning(f"No .ini file found in directory: {directory}")
-        return None
+        section = None
+        for number, line in enumerate(lines, start=1):
+            match = GameManager._SECTION_LINE.match(line)
+            if match:
+                section = match.group(1).strip()
+                yield line
+                continue
+            match = GameManager._ID_LINE.match(line)
+            if match and match.group('value') != steam_id:
+                changes.append(
+                    {
+                        'line': number,
+                        'section': section,
+                        'key': match.group('key'),
+                        'old': match.group('value'),
+                        'new': steam_id,
+                    }
+                )
+                line = line[: match.start('value')] + steam_id + line[match.end('value'):]
+            yield line
 
     @staticmethod
-    def update_ini_file(file_path, steam_id):
+    def update_ini_file(file_path, steam_id, dry_run=False):
         """
         Update the .ini file with the given Steam ID.
 
+        Only `AccountId` and `PlayerID` key lines are changed; comments, other keys, the encoding, the
+        byte order mark and the line endings are preserved. The file is left untouched if it already holds
+        the Steam ID, and otherwise replaced atomically.
+
         Args:
             file_path (str): The path to the .ini file to update.
             steam_id (str): The Steam ID to insert into the .ini file.
+            dry_run (bool, optional): Only report the changes, without writing. Defaults to False.
+
+        Returns:
+            list: The changes made (or that would be made), as dictionaries with the keys `line`,
+                `section`, `key`, `old` and `new`, or None if the file could not be updated.
         """
+        steam_id = str(steam_id)
         try:
-            with open(file_path, 'r') as file:
-                lines = file.readlines()
+            encoding, errors = GameManager._detect_ini_encoding(file_path)
 
-            with open(file_path, 'w') as file:
-                for line in lines:
-                    if 'PlayerID=' in line or 'AccountId=' in line:
-                        file.write(f"AccountId={steam_id}\n")
-                    else:
-                        file.write(line)
-            logging.info(f"Updated .ini file at {file_path} with Steam ID.")
+            # Find the changes first so an up-to-date file is never rewritten.
+            changes = []
+            with open(file_path, 'r', encoding=encoding, errors=errors, newline='') as file:
+                for _ in GameManager._rewrite_ini_lines(file, steam_id, changes):
+                    pass
+            if not changes:
+                logging.info(f".ini file at {file_path} already has the Steam ID.")
+                return changes
+            if dry_run:
+                return changes
+
+            directory = os.path.dirname(os.path.abspath(file_path))
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.ini.', suffix='.tmp')
+            try:
+                with open(
+                    file_path, 'r', encoding=encoding, errors=errors, newline=''
+                ) as source, os.fdopen(
+                    fd, 'w', encoding=encoding, errors=errors, newline=''
+                ) as target:
+                    target.writelines(GameManager._rewrite_ini_lines(source, steam_id, []))
+                    target.flush()
+                    os.fsync(target.fileno())
+                shutil.copymode(file_path, temp_path)
+                os.replace(temp_path, file_path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+            logging.info(
+                f"Updated .ini file at {file_path} with Steam ID ({len(changes)} line(s) changed)."
+            )
+            return changes
         except Exception as e:
             logging.error(f"Error updating .ini file at {file_path}: {e}")
+            return None
 
     @staticmethod
-    def create_steam_appid_file(directory, app_id):
+    def create_steam_appid_file(directory, app_id, dry_run=False):
         """
         Create a steam_appid.txt file with the given app ID in the specified directory.
 
+        An existing file that already holds the app ID is left untouched.
+
         Args:
             directory (str): The directory to create the steam_appid.txt file in.
             app_id (int): The app ID to write to the steam_appid.txt file.
+            dry_run (bool, optional): Only report whether the file would change. Defaults to False.
+
+        Returns:
+            bool: True if the file was (or would be) written, False if it was up to date, None on error.
         """
         try:
             file_path = os.path.join(directory, "steam_appid.txt")
+            if GameManager.read_steam_appid_file(directory) == str(app_id):
+                return False
+            if dry_run:
+                return True
             with open(file_path, 'w') as file:
                 file.write(str(app_id))
             logging.info(
                 f"Created steam_appid.txt file at {file_path} with app ID: {app_id}"
             )
+            return True
         except Exception as e:
             logging.error(f"Error creating steam_appid.txt file in {directory}: {e}")
+            return None
+
+    @staticmethod
+    def read_steam_appid_file(directory):
+        """
+        Read the app ID from the steam_appid.txt file in the specified directory.
+
+        Args:
+            directory (str): The directory of the steam_appid.txt file.
+
+        Returns:
+            str: The app ID, or None if there is no readable file.
+        """
+        try:
+            with open(os.path.join(directory, "steam_appid.txt"), 'r') as file:
+                return file.read().strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @staticmethod
+    def patch_game(game, steam_id, dry_run=False):
+        """
+        Patch the Steam ID into a game's .ini file and write its steam_appid.txt file.
+
+        Args:
+            game (dict): The game, with the key `directory` and optionally `app_id`, `ini` and `exe`.
+            steam_id (str): The Steam ID to insert into the .ini file.
+            dry_run (bool, optional): Only report the changes, without writing. Defaults to False.
+
+        Returns:
+            dict: The result with the keys `directory`, `status` (`updated`, `unchanged` or `failed`), `ini`,
+                `ini_changes`, `app_id` (the old and new app ID if steam_appid.txt changes, else None)
+                and `reason`.
+        """
+        directory = game['directory']
+        result = {
+            'directory': directory,
+            'status': 'unchanged',
+            'ini': game.get('ini'),
+            'ini_changes': [],
+            'app_id': None,
+            'reason': None,
+        }
+        if not result['ini']:
+            result['ini'] = GameManager.find_ini_file(directory, game.get('exe'), save_cache=False)
+        if not result['ini']:
+            result.update(status='failed', reason="INI file not found")
+            return result
+
+        changes = GameManager.update_ini_file(result['ini'], steam_id, dry_run)
+        if changes is None:
+            result.update(status='failed', reason=f"Cannot update {result['ini']}")
+            return result
+        result['ini_changes'] = changes
+
+        app_id = game.get('app_id')
+        if app_id:
+            old_app_id = GameManager.read_steam_appid_file(directory)
+            written = GameManager.create_steam_appid_file(directory, app_id, dry_run)
+            if written is None:
+                result.update(status='failed', reason="Cannot write steam_appid.txt")
+                return result
+            if written:
+                result['app_id'] = {'old': old_app_id, 'new': str(app_id)}
+
+        if result['ini_changes'] or result['app_id']:
+            result['status'] = 'updated'
+        return result
+
+    @staticmethod
+    def patch_games(games, steam_id, max_workers=None, dry_run=False):
+        """
+        Patch the Steam ID and app ID files of many games concurrently.
+
+        Args:
+            games (iterable): The games, as accepted by `patch_game`.
+            steam_id (str): The Steam ID to insert into the .ini files.
+            max_workers (int, optional): The number of games patched concurrently. Defaults to MAX_WORKERS.
+            dry_run (bool, optional): Only report the changes, without writing. Defaults to False.
+
+        Returns:
+            list: The result of `patch_game` for each game, in order.
+        """
+        games = list(games)
+
+        def patch(game):
+            try:
+                return GameManager.patch_game(game, steam_id, dry_run)
+            except Exception as e:
+                logging.error(f"Error patching game in {game.get('directory')}: {e}")
+                return {
+                    'directory': game.get('directory'),
+                    'status': 'failed',
+                    'ini': game.get('ini'),
+                    'ini_changes': [],
+                    'app_id': None,
+                    'reason': str(e),
+                }
 
+        workers = max(1, min(max_workers or GameManager.MAX_WORKERS, len(games)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(patch, games))
+        GameManager.get_scan_cache().save()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
-)
+        counts = {}
+        for result in results:
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+        logging.info(f"{'Checked' if dry_run else 'Patched'} {len(results)} game(s): {counts}")
+        return results
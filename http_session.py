@@ -0,0 +1,179 @@
+"""
+http_session.py
+===============
+
+This module provides a pooled, retrying and rate-limited HTTP session for talking to Steam's web services.
+
+Classes
+-------
+RateLimiter
+    A thread-safe token bucket that spaces out requests.
+
+SteamSession
+    A `requests.Session` that applies a default timeout and a rate limit to every request.
+
+Functions
+---------
+create_session(retries=3, backoff_factor=0.5, backoff_jitter=0.25, pool_maxsize=10, rate=None, timeout=None)
+    Create a SteamSession with connection pooling, compression and retries.
+
+Attributes
+----------
+DEFAULT_TIMEOUT : tuple
+    The default connect and read timeouts in seconds.
+RETRY_STATUS_CODES : frozenset
+    The HTTP status codes that are retried.
+
+Methods
+-------
+RateLimiter.acquire()
+    Wait until a request may be sent.
+
+SteamSession.request(method, url, **kwargs)
+    Send a request after waiting for the rate limiter, with the default timeout.
+
+Notes
+-----
+- Retries use exponential backoff with random jitter and honor `Retry-After` headers; only idempotent
+  methods are retried.
+- Responses are requested with gzip/deflate compression, and Brotli when the `brotli` package is installed.
+  `requests` decodes them transparently, including when streaming.
+- A single session keeps up to `pool_maxsize` connections per host alive, so repeated calls skip the TCP
+  and TLS handshakes.
+
+Example
+-------
+To fetch a URL with retries and at most two requests per second:
+
+from http_session import create_session
+
+session = create_session(rate=2)
+response = session.get("https://api.steampowered.com/ISteamApps/GetAppList/v2/")
+response.raise_for_status()
+"""
+
+import time
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+DEFAULT_TIMEOUT = (5, 30)
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket that spaces out requests.
+    """
+
+    def __init__(self, rate, burst=1):
+        """
+        Initialize the RateLimiter.
+
+        Args:
+            rate (float): The sustained number of requests per second.
+            burst (int, optional): The number of requests that may be sent back to back. Defaults to 1.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Wait until a request may be sent.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+class SteamSession(requests.Session):
+    """
+    A `requests.Session` that applies a default timeout and a rate limit to every request.
+    """
+
+    def __init__(self, timeout=None, rate_limiter=None):
+        """
+        Initialize the SteamSession.
+
+        Args:
+            timeout (float or tuple, optional): The default timeout in seconds. Defaults to DEFAULT_TIMEOUT.
+            rate_limiter (RateLimiter, optional): The rate limiter. Defaults to None (no limit).
+        """
+        super().__init__()
+        self.timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+        self.rate_limiter = rate_limiter
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request after waiting for the rate limiter, with the default timeout.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL.
+            **kwargs: The arguments of `requests.Session.request`.
+
+        Returns:
+            requests.Response: The response.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return super().request(method, url, **kwargs)
+
+
+def create_session(
+    retries=3,
+    backoff_factor=0.5,
+    backoff_jitter=0.25,
+    pool_maxsize=10,
+    rate=None,
+    timeout=None,
+):
+    """
+    Create a SteamSession with connection pooling, compression and retries.
+
+    Args:
+        retries (int, optional): The number of retries for failed requests. Defaults to 3.
+        backoff_factor (float, optional): The base of the exponential backoff in seconds. Defaults to 0.5.
+        backoff_jitter (float, optional): The maximum random delay added to each backoff. Defaults to 0.25.
+        pool_maxsize (int, optional): The number of connections kept alive per host. Defaults to 10.
+        rate (float, optional): The maximum number of requests per second. Defaults to None (no limit).
+        timeout (float or tuple, optional): The default timeout in seconds. Defaults to DEFAULT_TIMEOUT.
+
+    Returns:
+        SteamSession: The session.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        backoff_jitter=backoff_jitter,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    rate_limiter = RateLimiter(rate, burst=max(1, int(rate))) if rate else None
+    session = SteamSession(timeout=timeout, rate_limiter=rate_limiter)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(make_headers(accept_encoding=True))
+    session.headers['User-Agent'] = 'non-steam-game-adder'
+    logging.debug(f"Created HTTP session with {retries} retries and rate limit {rate}.")
+    return session
@@ -2,17 +2,61 @@
 icon_handler.py
 ===============
 
-This module provides a function to extract the icon from an executable file and save it as an .ico file using the `icoextract` library.
+This module extracts the icons of executable files into a content-addressed cache using the `icoextract` library, for one file or many in parallel, and renders PNG copies with Pillow.
 
 Functions
 ---------
-extract_icon_path(executable_path)
-    Extracts the icon from the specified executable file and saves it as an .ico file.
+extract_icon_path(executable_path, png_sizes=None)
+    Return the cached .ico file of an executable, extracting its icon on first use.
+
+extract_icons(executable_paths, max_workers=None, timeout=None, png_sizes=None)
+    Extract the icons of many executables on a process pool, yielding results as they complete.
+
+icon_pngs(icon_path, sizes=PNG_SIZES)
+    Return pre-scaled PNG copies of a cached icon, creating the missing ones.
+
+keep_icon(icon_path)
+    Copy a cached icon to SHORTCUT_ICON_DIR and return the copy, for use in a Steam shortcut.
+
+file_digest(path)
+    Compute the content hash of a file.
+
+Attributes
+----------
+ICON_CACHE_DIR : str
+    The directory where extracted icons are cached.
+SHORTCUT_ICON_DIR : str
+    The directory holding the icons that Steam shortcuts point to.
+MAX_AGE : float
+    The number of seconds an unused executable is kept in the icon index.
+MAX_ENTRIES : int
+    The maximum number of executables kept in the icon index.
+EXTRACT_TIMEOUT : float
+    The default number of seconds `extract_icons` allows for one executable.
+PNG_SIZES : tuple
+    The default sizes of the PNG copies created by `icon_pngs`.
+MAX_ICON_GROUPS : int
+    The number of icon groups inspected when choosing the best icon.
 
 Notes
 -----
-- Ensure that the `icoextract` library is installed in your environment.
-- The extracted icon will be saved in the same directory as the executable with the name "icon.ico".
+- Ensure that the `icoextract` and `Pillow` libraries are installed in your environment.
+- Icons are stored in ICON_CACHE_DIR as `<content hash>.ico`, so executables with identical contents (e.g. the
+  same launcher shipped with several games) share one icon file, and nothing is written into game directories.
+- An index maps each executable path to its size, modification time and content hash. While the size and
+  mtime are unchanged, the cached icon is returned without hashing the file or parsing it; otherwise the
+  file is hashed and only parsed if no icon exists for its hash yet.
+- Executables without an icon are remembered too, so they are not parsed again.
+- Each index entry records when it was last used (to the day). Saving the index drops entries unused for
+  MAX_AGE seconds and the least recently used ones beyond MAX_ENTRIES, and deletes the cached icons and PNG
+  copies that no remaining entry refers to.
+- ICON_CACHE_DIR can be pruned or cleared at any time, so shortcuts must not point into it. `keep_icon`
+  copies an icon to SHORTCUT_ICON_DIR under DATA_DIR, which is never pruned; callers that write shortcuts
+  pass extracted icons through it.
+- Of the icon groups of an executable, the one with the largest (then deepest) image is exported.
+- PNG copies are stored next to the cached icon as `<content hash>_<size>.png` and created only once.
+- `extract_icons` hashes and parses executables in worker processes, since PE parsing is CPU-bound pure
+  Python. The icon index is only updated by the calling process.
 
 Example
 -------
@@ -27,36 +71,511 @@ else:
     print("Icon extraction failed.")
 """
 
+import io
 import os
+import json
+import struct
+import time
+import hashlib
 import logging
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from PIL import Image
 from icoextract import IconExtractor, IconExtractorError
+from config import CACHE_DIR, DATA_DIR
+
+ICON_CACHE_DIR = os.path.join(CACHE_DIR, 'icons')
+SHORTCUT_ICON_DIR = os.path.join(DATA_DIR, 'icons')
+EXTRACT_TIMEOUT = 30.0
+PNG_SIZES = (32, 64, 256)
+MAX_ICON_GROUPS = 32
+MAX_AGE = 90 * 86400
+MAX_ENTRIES = 5000
+
+_INDEX_FILE = 'index.json'
+_USE_RESOLUTION = 86400
+_index = None
+_index_dirty = False
+_index_lock = threading.Lock()
+
+
+def file_digest(path):
+    """
+    Compute the content hash of a file.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        str: The hexadecimal BLAKE2b digest of the file.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomic(path, data):
+    """
+    Write a file by swapping in a temporary file.
+
+    Args:
+        path (str): The path to the file.
+        data (bytes): The contents of the file.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_index():
+    """
+    Return the icon index, reading it from disk on first use. The index lock must be held.
+
+    Returns:
+        dict: The size, mtime, content hash, icon flag and last use of each executable path.
+    """
+    global _index
+    if _index is None:
+        try:
+            with open(os.path.join(ICON_CACHE_DIR, _INDEX_FILE), 'r') as file:
+                _index = json.load(file)
+        except (OSError, ValueError):
+            _index = {}
+        now = int(time.time())
+        for entry in _index.values():
+            # Entries written before the last use was recorded
+            if len(entry) < 5:
+                entry.append(now)
+    return _index
+
+
+def _delete_icon_files(digests):
+    """
+    Delete cached icons and their PNG copies.
+
+    Args:
+        digests (set): The content hashes of the icons.
+    """
+    try:
+        names = os.listdir(ICON_CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        # `<digest>.ico` and `<digest>_<size>.png`
+        if name.split('.', 1)[0].split('_', 1)[0] in digests:
+            try:
+                os.remove(os.path.join(ICON_CACHE_DIR, name))
+            except OSError as e:
+                logging.warning(f"Cannot delete cached icon {name}: {e}")
 
 
-def extract_icon_path(executable_path):
+def _prune_index():
+    """
+    Drop index entries unused for MAX_AGE seconds and the least recently used ones beyond MAX_ENTRIES, and
+    delete the icons no remaining entry refers to. The index lock must be held.
     """
-    Extract the icon from an executable file and save it as an .ico file.
+    global _index_dirty
+    index = _load_index()
+    cutoff = time.time() - MAX_AGE
+    stale = {key for key, entry in index.items() if entry[4] < cutoff}
+    if len(index) - len(stale) > MAX_ENTRIES:
+        recent = sorted((key for key in index if key not in stale), key=lambda key: index[key][4])
+        stale.update(recent[: len(recent) - MAX_ENTRIES])
+    if not stale:
+        return
+
+    digests = {index[key][2] for key in stale if index[key][3]}
+    for key in stale:
+        del index[key]
+    digests -= {entry[2] for entry in index.values() if entry[3]}
+    if digests:
+        _delete_icon_files(digests)
+    _index_dirty = True
+    logging.info(f"Dropped {len(stale)} stale icon index entries and {len(digests)} icon(s).")
+
+
+def _save_index():
+    """
+    Prune the icon index and write it to disk if it changed. The index lock must be held.
+    """
+    global _index_dirty
+    if _index is None:
+        return
+    _prune_index()
+    if not _index_dirty:
+        return
+    try:
+        os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+        _write_atomic(
+            os.path.join(ICON_CACHE_DIR, _INDEX_FILE),
+            json.dumps(_index, separators=(',', ':')).encode('utf-8'),
+        )
+        _index_dirty = False
+    except OSError as e:
+        logging.error(f"Error saving icon cache index: {e}")
+
+
+def _cached_icon(digest):
+    return os.path.join(ICON_CACHE_DIR, f"{digest}.ico")
+
+
+def _lookup(executable_path):
+    """
+    Look up an executable in the icon index.
 
     Args:
         executable_path (str): The path to the executable file.
 
     Returns:
-        str: The path to the extracted .ico file if successful, else None.
+        tuple: The index key, the current size and mtime of the file, and the cached result: the icon path
+            or None if the file has no icon, or False if the file must be extracted.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    global _index_dirty
+    key = os.path.normcase(os.path.abspath(executable_path))
+    stat = os.stat(executable_path)
+    signature = [stat.st_size, stat.st_mtime_ns]
+    with _index_lock:
+        cached = _load_index().get(key)
+        now = int(time.time())
+        if cached and now - cached[4] >= _USE_RESOLUTION:
+            cached[4] = now
+            _index_dirty = True
+    if cached and cached[:2] == signature:
+        if not cached[3]:
+            return key, signature, None
+        if os.path.exists(_cached_icon(cached[2])):
+            return key, signature, _cached_icon(cached[2])
+    return key, signature, False
+
+
+def _record(key, signature, digest, has_icon, save=True):
+    """
+    Store the extraction result of an executable in the icon index.
+
+    Args:
+        key (str): The index key.
+        signature (list): The size and mtime of the file.
+        digest (str): The content hash of the file.
+        has_icon (bool): Whether the file has an icon.
+        save (bool, optional): Write the index to disk. Defaults to True.
+
+    Returns:
+        str: The path to the cached icon, or None if the file has no icon.
+    """
+    global _index_dirty
+    with _index_lock:
+        _load_index()[key] = signature + [digest, has_icon, int(time.time())]
+        _index_dirty = True
+        if save:
+            _save_index()
+    return _cached_icon(digest) if has_icon else None
+
+
+def _ico_score(data):
+    """
+    Rate an .ico file by its largest image.
+
+    Args:
+        data (bytes): The .ico file.
+
+    Returns:
+        tuple: The pixel count and bit depth of the largest image.
+    """
+    count = struct.unpack_from('<H', data, 4)[0]
+    best = (0, 0)
+    for i in range(count):
+        width, height, _, _, _, bit_count = struct.unpack_from('<BBBBHH', data, 6 + 16 * i)
+        # A dimension of 0 means 256 pixels.
+        best = max(best, ((width or 256) * (height or 256), bit_count))
+    return best
+
+
+def _best_icon(extractor):
+    """
+    Return the icon group with the highest resolution image.
+
+    Args:
+        extractor (IconExtractor): The extractor of the executable.
+
+    Returns:
+        bytes: The .ico file of the best icon group.
 
     Raises:
-        IconExtractorError: If the icon extraction fails due to malformed resources or no icons available.
+        IconExtractorError: If no icon group can be read.
     """
+    best = None
+    for num in range(min(len(extractor.list_group_icons()), MAX_ICON_GROUPS)):
+        try:
+            data = extractor.get_icon(num).getvalue()
+            score = _ico_score(data)
+        except (IconExtractorError, KeyError, IndexError, struct.error) as e:
+            logging.warning(f"Skipping unreadable icon group {num}: {e}")
+            continue
+        if best is None or score > best[0]:
+            best = (score, data)
+    if best is None:
+        raise IconExtractorError("No readable icon group")
+    return best[1]
+
+
+def icon_pngs(icon_path, sizes=PNG_SIZES):
+    """
+    Return pre-scaled PNG copies of a cached icon, creating the missing ones.
+
+    Sizes embedded in the icon are used as they are; other sizes are resampled from the largest image.
+
+    Args:
+        icon_path (str): The path to the cached .ico file.
+        sizes (iterable, optional): The edge lengths in pixels. Defaults to PNG_SIZES.
+
+    Returns:
+        dict: The path to the PNG file for each size, or an empty dictionary if the icon cannot be read.
+    """
+    stem = os.path.splitext(icon_path)[0]
+    pngs = {size: f"{stem}_{size}.png" for size in sizes}
+    missing = [size for size, path in pngs.items() if not os.path.exists(path)]
+    if not missing:
+        return pngs
     try:
-        extractor = IconExtractor(executable_path)
-        icon_file = os.path.join(os.path.dirname(executable_path), "icon.ico")
-        extractor.export_icon(icon_file, num=0)
+        with Image.open(icon_path) as image:
+            available = image.ico.sizes()
+            largest = max(available)
+            for size in missing:
+                if (size, size) in available:
+                    frame = image.ico.getimage((size, size))
+                else:
+                    frame = image.ico.getimage(largest).resize(
+                        (size, size), Image.Resampling.LANCZOS
+                    )
+                buffer = io.BytesIO()
+                frame.convert('RGBA').save(buffer, format='PNG', optimize=True)
+                _write_atomic(pngs[size], buffer.getvalue())
+    except (OSError, ValueError, AttributeError) as e:
+        logging.error(f"Cannot create PNG icons from {icon_path}: {e}")
+        return {}
+    logging.info(f"Created {len(missing)} PNG icon(s) from {icon_path}.")
+    return pngs
+
+
+def _extract_to_cache(executable_path, png_sizes=None):
+    """
+    Hash an executable and extract its best icon into the cache unless an icon for its hash exists.
+
+    This runs in worker processes for `extract_icons`.
+
+    Args:
+        executable_path (str): The path to the executable file.
+        png_sizes (iterable, optional): The sizes of PNG copies to create. Defaults to None.
+
+    Returns:
+        tuple: The content hash of the file and whether it has an icon.
+
+    Raises:
+        OSError: If the file cannot be read or the icon cannot be written.
+    """
+    os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+    digest = file_digest(executable_path)
+    icon_file = _cached_icon(digest)
+    if os.path.exists(icon_file):
+        logging.info(f"Reusing icon {icon_file} for {executable_path}.")
+    else:
+        try:
+            _write_atomic(icon_file, _best_icon(IconExtractor(executable_path)))
+        except IconExtractorError as e:
+            logging.error(f"Icon extraction failed: {e}")
+            return digest, False
         logging.info(f"Icon extracted and saved to: {icon_file}")
-        return icon_file
-    except IconExtractorError as e:
+    if png_sizes:
+        icon_pngs(icon_file, png_sizes)
+    return digest, True
+
+
+def extract_icon_path(executable_path, png_sizes=None):
+    """
+    Return the cached .ico file of an executable, extracting its icon on first use.
+
+    Errors are logged rather than raised: an unreadable file or one without a usable icon yields None.
+
+    Args:
+        executable_path (str): The path to the executable file.
+        png_sizes (iterable, optional): Also create PNG copies of these sizes (see `icon_pngs`).
+            Defaults to None.
+
+    Returns:
+        str: The path to the cached .ico file if the executable has an icon, else None.
+    """
+    try:
+        key, signature, cached = _lookup(executable_path)
+        if cached is not False:
+            logging.info(f"Using cached icon result for {executable_path}.")
+            if cached and png_sizes:
+                icon_pngs(cached, png_sizes)
+            with _index_lock:
+                _save_index()
+            return cached
+        digest, has_icon = _extract_to_cache(executable_path, png_sizes)
+    except OSError as e:
         logging.error(f"Icon extraction failed: {e}")
         return None
+    return _record(key, signature, digest, has_icon)
+
+
+def keep_icon(icon_path):
+    """
+    Copy a cached icon to SHORTCUT_ICON_DIR and return the copy, for use in a Steam shortcut.
+
+    Icons outside ICON_CACHE_DIR, such as ones chosen by the user, are returned unchanged.
+
+    Args:
+        icon_path (str): The path to the icon.
+
+    Returns:
+        str: The path to use in the shortcut; the original path if the icon cannot be copied.
+    """
+    if not icon_path:
+        return icon_path
+    directory = os.path.normcase(os.path.dirname(os.path.abspath(icon_path)))
+    if directory != os.path.normcase(os.path.abspath(ICON_CACHE_DIR)):
+        return icon_path
+    kept = os.path.join(SHORTCUT_ICON_DIR, os.path.basename(icon_path))
+    if not os.path.exists(kept):
+        try:
+            os.makedirs(SHORTCUT_ICON_DIR, exist_ok=True)
+            with open(icon_path, 'rb') as f:
+                _write_atomic(kept, f.read())
+        except OSError as e:
+            logging.error(f"Cannot copy icon {icon_path} to {SHORTCUT_ICON_DIR}: {e}")
+            return icon_path
+    return kept
+
+
+def _kill_workers(executor):
+    """
+    Shut down a process pool without waiting, terminating its worker processes.
+
+    Args:
+        executor (ProcessPoolExecutor): The pool.
+    """
+    # ProcessPoolExecutor cannot cancel a running task, so stuck workers are terminated directly.
+    processes = list((getattr(executor, '_processes', None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
+def extract_icons(executable_paths, max_workers=None, timeout=None, png_sizes=None):
+    """
+    Extract the icons of many executables on a process pool, yielding results as they complete.
+
+    Cached results are yielded first without starting any worker. An executable whose extraction takes
+    longer than `timeout` is given up on and its worker process is terminated.
+
+    Args:
+        executable_paths (iterable): The paths to the executable files.
+        max_workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        timeout (float, optional): The number of seconds one extraction may take. Defaults to EXTRACT_TIMEOUT.
+        png_sizes (iterable, optional): Also create PNG copies of these sizes (see `icon_pngs`).
+            Defaults to None.
+
+    Yields:
+        tuple: The executable path and the path to its .ico file, or None if extraction failed.
+    """
+    timeout = EXTRACT_TIMEOUT if timeout is None else timeout
+    workers = max_workers or os.cpu_count() or 1
+
+    pending = deque()
+    lookups = {}
+    for path in dict.fromkeys(executable_paths):
+        try:
+            key, signature, cached = _lookup(path)
+        except OSError as e:
+            logging.error(f"Icon extraction failed: {e}")
+            yield path, None
+            continue
+        if cached is not False:
+            if cached and png_sizes:
+                icon_pngs(cached, png_sizes)
+            yield path, cached
+        else:
+            lookups[path] = (key, signature)
+            pending.append(path)
+    if not pending:
+        with _index_lock:
+            _save_index()
+        return
+
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(pending)))
+    running = {}
+    crashed = set()
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                # Retries of crashed extractions run alone so they cannot take others down.
+                if pending[0] in crashed and running:
+                    break
+                path = pending.popleft()
+                future = executor.submit(_extract_to_cache, path, png_sizes)
+                running[future] = (path, time.monotonic() + timeout)
+                if path in crashed:
+                    break
+
+            next_deadline = min(deadline for _, deadline in running.values())
+            done, _ = wait(
+                running,
+                timeout=max(0, next_deadline - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
+            broken = False
+            for future in done:
+                path, _ = running.pop(future)
+                try:
+                    digest, has_icon = future.result()
+                except BrokenProcessPool as e:
+                    # Any task on a broken pool fails; retry each one once to find the culprit.
+                    broken = True
+                    if path in crashed:
+                        logging.error(f"Icon extraction of {path} crashed its worker: {e}")
+                        yield path, None
+                    else:
+                        crashed.add(path)
+                        pending.append(path)
+                except Exception as e:
+                    logging.error(f"Icon extraction of {path} failed: {e}")
+                    yield path, None
+                else:
+                    yield path, _record(*lookups[path], digest, has_icon, save=False)
 
+            now = time.monotonic()
+            expired = [future for future, (_, deadline) in running.items() if deadline <= now]
+            for future in expired:
+                path, _ = running.pop(future)
+                logging.error(f"Icon extraction of {path} timed out after {timeout}s.")
+                yield path, None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
-)
+            if expired or broken:
+                # Restart the pool and resubmit the extractions that were interrupted with it.
+                pending.extendleft(path for path, _ in running.values())
+                running.clear()
+                _kill_workers(executor)
+                executor = ProcessPoolExecutor(max_workers=min(workers, max(len(pending), 1)))
+    finally:
+        _kill_workers(executor)
+        with _index_lock:
+            _save_index()
@@ -0,0 +1,262 @@
+"""
+library_scanner.py
+==================
+
+This module provides a scanner that discovers installed games under one or more library folders for bulk import.
+
+Functions
+---------
+scan_libraries(roots, max_workers=None, max_depth=None)
+    Scan library folders and return one candidate per game folder.
+
+scan_game_directory(directory, max_depth=None)
+    Identify the main executable, .ini file and name of the game in a folder.
+
+rank_executables(directory, executables)
+    Rank the executables of a game folder, most likely main executable first.
+
+read_version_info(exe_path)
+    Read the string version information of a Windows executable.
+
+guess_game_name(directory, version_info=None)
+    Guess the display name of a game from its version information or folder name.
+
+Attributes
+----------
+MAX_WORKERS : int
+    The default number of game folders scanned concurrently.
+EXE_DEPTH : int
+    The default number of directory levels searched for executables.
+HELPER_EXE_WORDS : tuple
+    Words in executable names that mark installers, crash reporters and other helper programs.
+
+Notes
+-----
+- Each direct subfolder of a library root is treated as one game. Folders are scanned on a thread pool;
+  directory listings go through the persistent scan cache of `game_manager.GameManager`.
+- Executables are ranked by size, similarity of their name to the folder name, depth and well-known
+  patterns (e.g. Unreal's `-Win64-Shipping`); helper programs are ranked last.
+- Version information is read with `pefile` from the chosen executable only, using a fast load that parses
+  just the resource directory.
+- Each candidate has the keys `app_name`, `exe`, `start_dir` and `icon` expected by
+  `SteamIntegration.add_non_steam_games`, plus `ini`, `directory` and `executables`.
+
+Example
+-------
+To scan a library and add every game found:
+
+from library_scanner import scan_libraries
+from steam_integration import SteamIntegration
+
+candidates = scan_libraries(["D:/Games"])
+SteamIntegration.add_non_steam_games(candidates)
+"""
+
+import os
+import re
+import math
+import difflib
+import logging
+import pefile
+from concurrent.futures import ThreadPoolExecutor
+from game_manager import GameManager
+
+MAX_WORKERS = 8
+EXE_DEPTH = 3
+HELPER_EXE_WORDS = (
+    'unins',
+    'setup',
+    'install',
+    'redist',
+    'vcredist',
+    'dxsetup',
+    'dotnet',
+    'crash',
+    'report',
+    'update',
+    'patch',
+    'config',
+    'settings',
+    'server',
+    'editor',
+    'benchmark',
+    'helper',
+    'cefprocess',
+    'ue4prereq',
+)
+
+_GENERIC_PRODUCT_NAMES = frozenset(
+    {'bootstrappackagedgame', 'unreal engine', 'unity', 'unityplayer', 'godot engine', 'game'}
+)
+_SEPARATORS = re.compile(r'[_.\-]+')
+_CAMEL_CASE = re.compile(r'(?<=[a-z])(?=[A-Z])')
+_SHIPPING = re.compile(r'-win(?:64|32)-shipping$', re.IGNORECASE)
+
+
+def _simplify(name):
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def rank_executables(directory, executables):
+    """
+    Rank the executables of a game folder, most likely main executable first.
+
+    Args:
+        directory (str): The game folder.
+        executables (list): The paths of the executables in the folder.
+
+    Returns:
+        list: The executables, best first.
+    """
+    folder = _simplify(os.path.basename(os.path.normpath(directory)))
+
+    def score(exe_path):
+        stem = os.path.splitext(os.path.basename(exe_path))[0]
+        simple = _simplify(_SHIPPING.sub('', stem))
+        try:
+            size = os.path.getsize(exe_path)
+        except OSError:
+            size = 0
+        depth = os.path.relpath(exe_path, directory).count(os.sep)
+        value = math.log2(size + 1)
+        value += 10 * difflib.SequenceMatcher(None, folder, simple).ratio()
+        value -= 2 * depth
+        if _SHIPPING.search(stem):
+            value += 8
+        if any(word in stem.lower() for word in HELPER_EXE_WORDS):
+            value -= 40
+        if 'launcher' in stem.lower():
+            value -= 3
+        return value
+
+    return sorted(executables, key=lambda exe_path: (-score(exe_path), exe_path))
+
+
+def read_version_info(exe_path):
+    """
+    Read the string version information of a Windows executable.
+
+    Args:
+        exe_path (str): The path to the executable.
+
+    Returns:
+        dict: The version strings (e.g. `ProductName`, `FileDescription`), or an empty dictionary.
+    """
+    try:
+        pe = pefile.PE(exe_path, fast_load=True)
+    except (OSError, pefile.PEFormatError) as e:
+        logging.warning(f"Cannot read version information of {exe_path}: {e}")
+        return {}
+    try:
+        pe.parse_data_directories(
+            directories=[pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE']]
+        )
+        info = {}
+        for file_info in getattr(pe, 'FileInfo', None) or []:
+            for entry in file_info:
+                for table in getattr(entry, 'StringTable', []):
+                    for key, value in table.entries.items():
+                        value = value.decode('utf-8', errors='replace').strip('\x00 ')
+                        if value:
+                            info.setdefault(key.decode('utf-8', errors='replace'), value)
+        return info
+    except Exception as e:
+        logging.warning(f"Cannot read version information of {exe_path}: {e}")
+        return {}
+    finally:
+        pe.close()
+
+
+def guess_game_name(directory, version_info=None):
+    """
+    Guess the display name of a game from its version information or folder name.
+
+    Args:
+        directory (str): The game folder.
+        version_info (dict, optional): The version strings of the main executable. Defaults to None.
+
+    Returns:
+        str: The name.
+    """
+    for key in ('ProductName', 'FileDescription'):
+        value = (version_info or {}).get(key, '').strip()
+        if value and value.lower() not in _GENERIC_PRODUCT_NAMES and not value.lower().endswith('.exe'):
+            return value
+    folder = os.path.basename(os.path.normpath(directory))
+    return ' '.join(_CAMEL_CASE.sub(' ', _SEPARATORS.sub(' ', folder)).split())
+
+
+def scan_game_directory(directory, max_depth=None):
+    """
+    Identify the main executable, .ini file and name of the game in a folder.
+
+    Args:
+        directory (str): The game folder.
+        max_depth (int, optional): The number of directory levels searched for executables.
+            Defaults to EXE_DEPTH.
+
+    Returns:
+        dict: The candidate, or None if the folder has no executable.
+    """
+    executables = GameManager.find_executables(
+        directory, EXE_DEPTH if max_depth is None else max_depth, save_cache=False
+    )
+    if not executables:
+        logging.info(f"No executable found in {directory}, skipping.")
+        return None
+
+    ranked = rank_executables(directory, executables)
+    exe = ranked[0]
+    return {
+        'app_name': guess_game_name(directory, read_version_info(exe)),
+        'exe': exe,
+        'start_dir': os.path.dirname(exe),
+        'icon': '',
+        'ini': GameManager.find_ini_file(directory, exe, save_cache=False),
+        'directory': directory,
+        'executables': ranked,
+    }
+
+
+def scan_libraries(roots, max_workers=None, max_depth=None):
+    """
+    Scan library folders and return one candidate per game folder.
+
+    Args:
+        roots (iterable): The library folders; each direct subfolder is treated as a game.
+        max_workers (int, optional): The number of game folders scanned concurrently. Defaults to MAX_WORKERS.
+        max_depth (int, optional): The number of directory levels searched for executables.
+            Defaults to EXE_DEPTH.
+
+    Returns:
+        list: The candidates, sorted by name.
+    """
+    game_dirs = []
+    for root in roots:
+        try:
+            with os.scandir(root) as entries:
+                game_dirs.extend(
+                    entry.path for entry in entries if entry.is_dir(follow_symlinks=False)
+                )
+        except OSError as e:
+            logging.error(f"Cannot scan library folder {root}: {e}")
+
+    candidates = []
+    with ThreadPoolExecutor(max_workers=max_workers or MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(scan_game_directory, game_dir, max_depth): game_dir
+            for game_dir in game_dirs
+        }
+        for future, game_dir in futures.items():
+            try:
+                candidate = future.result()
+            except Exception as e:
+                logging.error(f"Error scanning game folder {game_dir}: {e}")
+                continue
+            if candidate:
+                candidates.append(candidate)
+    GameManager.get_scan_cache().save()
+
+    candidates.sort(key=lambda candidate: candidate['app_name'].lower())
+    logging.info(f"Found {len(candidates)} game(s) in {len(game_dirs)} folder(s).")
+    return candidates
@@ -1,6 +1,11 @@
+import logging
 from ui import ttk, NonSteamGameAdderApp
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     root = ttk.Window(themename="darkly")
     app = NonSteamGameAdderApp(root)
     root.mainloop()
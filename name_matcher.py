@@ -0,0 +1,358 @@
+"""
+name_matcher.py
+===============
+
+This module provides normalization of game names and a fuzzy matcher that ranks Steam apps by name similarity.
+
+Classes
+-------
+NameMatcher
+    A fuzzy game name matcher over an AppList.
+
+Functions
+---------
+normalize_game_name(name)
+    Normalize a game name for matching.
+
+tokenize_game_name(name)
+    Split a game name into normalized tokens.
+
+Attributes
+----------
+EDITION_WORDS : frozenset
+    Words that describe an edition of a game rather than the game itself.
+ROMAN_NUMERALS : dict
+    The roman numerals that are rewritten as arabic numbers.
+
+Methods
+-------
+NameMatcher.build(app_list)
+    Build the inverted token index over an app list.
+
+NameMatcher.search(name, limit=5, min_score=0.0)
+    Return the best matching apps for a name, ranked by score.
+
+NameMatcher.best_match(name, min_score, margin=0.05)
+    Return the best match for a name if it is good enough and unambiguous.
+
+Notes
+-----
+- Normalization strips accents and trademark symbols, lowercases, replaces punctuation with spaces, rewrites
+  roman numerals (II to XX) as numbers and drops edition words such as "Remastered" or "Game of the Year".
+- Candidates are generated from an inverted index of name tokens. Query tokens that are not in the
+  vocabulary (typos) are expanded to similar vocabulary tokens through a trigram index.
+- Tokens are weighted by inverse document frequency, and apps are scored with a recall-weighted F-measure,
+  so "The Witcher 3" ranks "The Witcher® 3: Wild Hunt" above its DLCs.
+- Tokens that appear in more than STOP_RATIO of all apps (such as "the" or "2") do not generate candidates;
+  they are only checked against the candidates found through rarer tokens, which keeps query latency in
+  the low milliseconds over the full app list. Postings are sorted, so these checks are binary searches.
+
+Example
+-------
+To find the closest Steam apps for a game name:
+
+from steam_api import SteamAPI
+from name_matcher import NameMatcher
+
+matcher = NameMatcher.build(SteamAPI("your_steam_api_key").get_app_list())
+for match in matcher.search("The Witcher 3", limit=3):
+    print(match['appid'], match['name'], match['score'])
+"""
+
+import re
+import math
+import array
+import heapq
+import bisect
+import logging
+import unicodedata
+
+EDITION_WORDS = frozenset(
+    {
+        'edition',
+        'goty',
+        'remastered',
+        'remaster',
+        'definitive',
+        'deluxe',
+        'ultimate',
+        'enhanced',
+        'anniversary',
+        'collectors',
+        'directors',
+        'cut',
+        'standard',
+        'digital',
+    }
+)
+
+ROMAN_NUMERALS = {
+    numeral: str(value)
+    for value, numeral in enumerate(
+        [
+            'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+            'xi', 'xii', 'xiii', 'xiv', 'xv', 'xvi', 'xvii', 'xviii', 'xix', 'xx',
+        ],
+        start=2,
+    )
+}
+
+_PHRASES = [
+    (re.compile(r"game of the year"), ' goty '),
+    (re.compile(r"director'?s"), ' directors '),
+    (re.compile(r"collector'?s"), ' collectors '),
+    (re.compile(r"&"), ' and '),
+]
+_SYMBOLS = re.compile(r"[™®©℠]")
+_APOSTROPHES = re.compile(r"['’`]")
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def tokenize_game_name(name):
+    """
+    Split a game name into normalized tokens.
+
+    Args:
+        name (str): The game name.
+
+    Returns:
+        list: The normalized tokens, in order.
+    """
+    if name.isascii():
+        name = name.lower()
+    else:
+        name = _SYMBOLS.sub('', name)
+        name = unicodedata.normalize('NFKD', name)
+        name = ''.join(char for char in name if not unicodedata.combining(char)).lower()
+    for pattern, replacement in _PHRASES:
+        name = pattern.sub(replacement, name)
+    name = _APOSTROPHES.sub('', name)
+    tokens = [ROMAN_NUMERALS.get(token, token) for token in _NON_WORD.sub(' ', name).split()]
+    significant = [token for token in tokens if token not in EDITION_WORDS]
+    return significant or tokens
+
+
+def normalize_game_name(name):
+    """
+    Normalize a game name for matching.
+
+    Args:
+        name (str): The game name.
+
+    Returns:
+        str: The normalized tokens joined by single spaces.
+    """
+    return ' '.join(tokenize_game_name(name))
+
+
+def _trigrams(token):
+    """
+    Return the trigrams of a token padded with spaces.
+
+    Args:
+        token (str): The token.
+
+    Returns:
+        set: The trigrams.
+    """
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameMatcher:
+    """
+    A fuzzy game name matcher over an AppList.
+    """
+
+    STOP_RATIO = 0.02
+    RECALL_WEIGHT = 2.0
+    MIN_TOKEN_SIMILARITY = 0.5
+    MAX_EXPANSIONS = 3
+
+    def __init__(self, app_list, postings, norms, stop_tokens):
+        """
+        Initialize the NameMatcher.
+
+        Args:
+            app_list (AppList): The indexed app list.
+            postings (dict): The positions of the apps that contain each token.
+            norms (array.array): The summed weight of the tokens of each app.
+            stop_tokens (set): The tokens that are too common to generate candidates.
+        """
+        self.app_list = app_list
+        self.postings = postings
+        self.norms = norms
+        self.stop_tokens = stop_tokens
+        self._log_count = math.log(max(len(app_list), 1) + 1)
+        self._trigram_index = None
+
+    @classmethod
+    def build(cls, app_list):
+        """
+        Build the inverted token index over an app list.
+
+        Args:
+            app_list (AppList): The app list to index.
+
+        Returns:
+            NameMatcher: The matcher.
+        """
+        postings = {}
+        app_tokens = []
+        for position, name in enumerate(app_list.names):
+            tokens = set(tokenize_game_name(name))
+            app_tokens.append(tokens)
+            for token in tokens:
+                postings.setdefault(token, []).append(position)
+
+        stop_limit = max(len(app_list) * cls.STOP_RATIO, 1)
+        stop_tokens = {token for token, apps in postings.items() if len(apps) > stop_limit}
+        postings = {token: array.array('I', apps) for token, apps in postings.items()}
+
+        matcher = cls(app_list, postings, array.array('f'), stop_tokens)
+        matcher.norms.extend(
+            sum(matcher.weight(token) for token in tokens) for tokens in app_tokens
+        )
+        logging.info(
+            f"Built fuzzy name index for {len(app_list)} apps with {len(postings)} tokens."
+        )
+        return matcher
+
+    def weight(self, token):
+        """
+        Return the inverse document frequency weight of a token.
+
+        Args:
+            token (str): The token.
+
+        Returns:
+            float: The weight; unknown tokens get the highest weight.
+        """
+        apps = self.postings.get(token)
+        return self._log_count - math.log(len(apps) if apps else 1)
+
+    def _expand(self, token):
+        """
+        Find vocabulary tokens similar to a token that is not in the vocabulary.
+
+        Args:
+            token (str): The unknown token.
+
+        Returns:
+            list: Tuples of similar tokens and their trigram similarity.
+        """
+        if len(token) < 3:
+            return []
+        if self._trigram_index is None:
+            index = {}
+            for known in self.postings:
+                if len(known) >= 3 and known not in self.stop_tokens:
+                    for trigram in _trigrams(known):
+                        index.setdefault(trigram, []).append(known)
+            self._trigram_index = index
+
+        grams = _trigrams(token)
+        shared = {}
+        for trigram in grams:
+            for known in self._trigram_index.get(trigram, ()):
+                shared[known] = shared.get(known, 0) + 1
+        similar = []
+        for known, count in shared.items():
+            similarity = count / (len(grams) + len(known) + 2 - count)
+            if similarity >= self.MIN_TOKEN_SIMILARITY:
+                similar.append((known, similarity))
+        return heapq.nlargest(self.MAX_EXPANSIONS, similar, key=lambda item: item[1])
+
+    def search(self, name, limit=5, min_score=0.0):
+        """
+        Return the best matching apps for a name, ranked by score.
+
+        Args:
+            name (str): The game name to look up.
+            limit (int, optional): The maximum number of matches. Defaults to 5.
+            min_score (float, optional): The minimum score of a match, between 0 and 1. Defaults to 0.0.
+
+        Returns:
+            list: Dictionaries with the keys `appid`, `name` and `score`, best match first.
+        """
+        tokens = set(tokenize_game_name(name))
+        common = [token for token in tokens if token in self.stop_tokens]
+        rare = [token for token in tokens if token not in self.stop_tokens]
+        if not rare and common:
+            rare = [min(common, key=lambda token: len(self.postings[token]))]
+            common.remove(rare[0])
+
+        query_weight = 0.0
+        scores = {}
+        for token in rare:
+            weight = self.weight(token)
+            query_weight += weight
+            if token in self.postings:
+                variants = [(token, 1.0)]
+            else:
+                variants = self._expand(token)
+            matched = {}
+            for variant, similarity in variants:
+                gain = similarity * min(weight, self.weight(variant))
+                for position in self.postings[variant]:
+                    if gain > matched.get(position, 0.0):
+                        matched[position] = gain
+            for position, gain in matched.items():
+                scores[position] = scores.get(position, 0.0) + gain
+
+        for token in common:
+            weight = self.weight(token)
+            query_weight += weight
+            apps = self.postings[token]
+            for position in scores:
+                found = bisect.bisect_left(apps, position)
+                if found < len(apps) and apps[found] == position:
+                    scores[position] += weight
+
+        if not scores or query_weight <= 0:
+            return []
+
+        beta = self.RECALL_WEIGHT ** 2
+        ranked = []
+        for position, overlap in scores.items():
+            recall = overlap / query_weight
+            precision = min(overlap / (self.norms[position] or query_weight), 1.0)
+            score = (1 + beta) * precision * recall / (beta * precision + recall)
+            if score >= min_score:
+                ranked.append((score, position))
+
+        return [
+            {
+                'appid': self.app_list.appids[position],
+                'name': self.app_list.names[position],
+                'score': round(score, 4),
+            }
+            for score, position in heapq.nlargest(limit, ranked)
+        ]
+
+    def best_match(self, name, min_score, margin=0.05):
+        """
+        Return the best match for a name if it is good enough and unambiguous.
+
+        A match is ambiguous if an app with a different normalized name scores within `margin` of it.
+
+        Args:
+            name (str): The game name to look up.
+            min_score (float): The minimum score of the match, between 0 and 1.
+            margin (float, optional): The minimum lead over the runner-up. Defaults to 0.05.
+
+        Returns:
+            dict: The match with the keys `appid`, `name` and `score`, else None.
+        """
+        matches = self.search(name, limit=2, min_score=min_score)
+        if not matches:
+            return None
+        best = matches[0]
+        if (
+            len(matches) > 1
+            and best['score'] - matches[1]['score'] < margin
+            and normalize_game_name(matches[1]['name']) != normalize_game_name(best['name'])
+        ):
+            logging.info(f"Ambiguous matches for '{name}': {matches}")
+            return None
+        return best
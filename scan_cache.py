@@ -0,0 +1,283 @@
+"""
+scan_cache.py
+=============
+
+This module provides a persistent cache of directory listings for .ini and .exe discovery, validated by directory modification times.
+
+Classes
+-------
+ScanCache
+    A persistent cache of the subdirectories and candidate files of scanned directories.
+
+Functions
+---------
+None
+
+Attributes
+----------
+None
+
+Methods
+-------
+ScanCache.listing(directory)
+    Return the subdirectories and candidate files of a directory, rescanning it only if it changed.
+
+ScanCache.cached_flag(directory, name, signature)
+    Return a cached per-file value if the file is unchanged.
+
+ScanCache.store_flag(directory, name, signature, value)
+    Cache a per-file value, such as whether an .ini file contains an ID key.
+
+ScanCache.invalidate(directory)
+    Forget a directory and everything below it.
+
+ScanCache.save()
+    Drop stale entries and write the cache to disk if it changed.
+
+Notes
+-----
+- A directory's modification time changes whenever an entry is added, removed or renamed in it, so an
+  unchanged mtime means its cached listing is still valid and `os.scandir` can be skipped. Only the changed
+  directories of a tree are listed again.
+- Listings whose mtime is within RACY_WINDOW seconds of the scan are not trusted on the next run, since a
+  change in the same clock tick would not move the mtime.
+- Per-file values are keyed by the file's mtime and size, so edits to a file invalidate them.
+- The cache is a JSON file written atomically; a missing or unreadable file is treated as an empty cache.
+- Each entry records when it was last used (to the day). `save` drops entries unused for MAX_AGE seconds and
+  the least recently used ones beyond MAX_ENTRIES, so directories that were moved or deleted do not
+  accumulate.
+
+Example
+-------
+To list a directory through the cache:
+
+from scan_cache import ScanCache
+
+cache = ScanCache("path/to/scan_cache.json")
+listing = cache.listing("path/to/game")
+print(listing['dirs'], listing['files'])
+cache.save()
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+
+
+class ScanCache:
+    """
+    A persistent cache of the subdirectories and candidate files of scanned directories.
+    """
+
+    EXTENSIONS = ('.ini', '.exe')
+    RACY_WINDOW = 2.0
+    MAX_AGE = 30 * 86400
+    MAX_ENTRIES = 20000
+    _USE_RESOLUTION = 86400
+
+    def __init__(self, path):
+        """
+        Initialize the ScanCache.
+
+        Args:
+            path (str): The path to the cache file.
+        """
+        self.path = path
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(directory):
+        return os.path.normcase(os.path.abspath(directory))
+
+    def _load(self):
+        """
+        Read the cache file on first use.
+        """
+        if self._entries is not None:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                entries = json.load(file)
+            if not isinstance(entries, dict):
+                raise ValueError("not a JSON object")
+        except FileNotFoundError:
+            entries = {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable scan cache {self.path}: {e}")
+            entries = {}
+        now = int(time.time())
+        for entry in entries.values():
+            entry.setdefault('used', now)
+        self._entries = entries
+
+    def listing(self, directory):
+        """
+        Return the subdirectories and candidate files of a directory, rescanning it only if it changed.
+
+        Args:
+            directory (str): The directory.
+
+        Returns:
+            dict: The sorted subdirectory names under `dirs` and the candidate file names under `files`.
+
+        Raises:
+            OSError: If the directory cannot be read.
+        """
+        key = self._key(directory)
+        mtime_ns = os.stat(directory).st_mtime_ns
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry and entry['mtime_ns'] == mtime_ns and not entry.get('racy'):
+                now = int(time.time())
+                # Record use coarsely, so a run that only reads the cache does not rewrite it
+                if now - entry['used'] >= self._USE_RESOLUTION:
+                    entry['used'] = now
+                    self._dirty = True
+                return entry
+
+        dirs, files = [], []
+        with os.scandir(directory) as entries:
+            for item in entries:
+                try:
+                    if item.is_dir(follow_symlinks=False):
+                        dirs.append(item.name)
+                    elif item.name.lower().endswith(self.EXTENSIONS):
+                        files.append(item.name)
+                except OSError:
+                    continue
+        dirs.sort()
+        files.sort()
+
+        new_entry = {
+            'mtime_ns': mtime_ns,
+            'racy': time.time() - mtime_ns / 1e9 < self.RACY_WINDOW,
+            'used': int(time.time()),
+            'dirs': dirs,
+            'files': files,
+            'flags': {},
+        }
+        with self._lock:
+            if entry:
+                new_entry['flags'] = {
+                    name: flag for name, flag in entry.get('flags', {}).items() if name in files
+                }
+                for removed in set(entry['dirs']) - set(dirs):
+                    self._invalidate(os.path.join(key, os.path.normcase(removed)))
+            self._entries[key] = new_entry
+            self._dirty = True
+        return new_entry
+
+    def cached_flag(self, directory, name, signature):
+        """
+        Return a cached per-file value if the file is unchanged.
+
+        Args:
+            directory (str): The directory of the file.
+            name (str): The file name.
+            signature (tuple): The current mtime and size of the file.
+
+        Returns:
+            The cached value, or None if there is none for this version of the file.
+        """
+        with self._lock:
+            self._load()
+            entry = self._entries.get(self._key(directory))
+            flag = entry['flags'].get(name) if entry else None
+        if flag and tuple(flag[:2]) == tuple(signature):
+            return flag[2]
+        return None
+
+    def store_flag(self, directory, name, signature, value):
+        """
+        Cache a per-file value, such as whether an .ini file contains an ID key.
+
+        Args:
+            directory (str): The directory of the file.
+            name (str): The file name.
+            signature (tuple): The mtime and size of the file.
+            value: The JSON-serializable value.
+        """
+        with self._lock:
+            self._load()
+            entry = self._entries.get(self._key(directory))
+            if entry is not None:
+                entry['flags'][name] = [*signature, value]
+                self._dirty = True
+
+    def _invalidate(self, key):
+        """
+        Forget a directory key and every key below it. The lock must be held.
+
+        Args:
+            key (str): The normalized directory path.
+        """
+        prefix = key.rstrip(os.sep) + os.sep
+        for cached in [cached for cached in self._entries if cached == key or cached.startswith(prefix)]:
+            del self._entries[cached]
+            self._dirty = True
+
+    def invalidate(self, directory):
+        """
+        Forget a directory and everything below it.
+
+        Args:
+            directory (str): The directory.
+        """
+        with self._lock:
+            self._load()
+            self._invalidate(self._key(directory))
+
+    def _prune(self):
+        """
+        Drop entries unused for MAX_AGE seconds and the least recently used ones beyond MAX_ENTRIES.
+        The lock must be held.
+        """
+        cutoff = time.time() - self.MAX_AGE
+        stale = [key for key, entry in self._entries.items() if entry['used'] < cutoff]
+        if len(self._entries) - len(stale) > self.MAX_ENTRIES:
+            stale = set(stale)
+            recent = sorted(
+                (key for key in self._entries if key not in stale),
+                key=lambda key: self._entries[key]['used'],
+            )
+            stale.update(recent[: len(recent) - self.MAX_ENTRIES])
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+            logging.info(f"Dropped {len(stale)} stale scan cache entries.")
+
+    def save(self):
+        """
+        Drop stale entries and write the cache to disk if it changed.
+        """
+        with self._lock:
+            if self._entries is not None:
+                self._prune()
+            if not self._dirty:
+                return
+            data = json.dumps(self._entries, separators=(',', ':')).encode('utf-8')
+            self._dirty = False
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logging.error(f"Error saving scan cache to {self.path}: {e}")
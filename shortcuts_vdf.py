@@ -0,0 +1,754 @@
+"""
+shortcuts_vdf.py
+================
+
+This module provides a codec for Steam's binary VDF format and a model of the `shortcuts.vdf` file.
+
+Classes
+-------
+EntryIndex
+    The offsets of the shortcut entries inside a `shortcuts.vdf` buffer.
+
+ShortcutsFile
+    An in-memory model of a `shortcuts.vdf` file.
+
+Functions
+---------
+loads(data)
+    Parse a binary VDF buffer into nested dictionaries.
+
+dumps(mapping)
+    Serialize nested dictionaries into a binary VDF buffer.
+
+normalize_name(app_name)
+    Normalize a game name for duplicate detection.
+
+normalize_path(path)
+    Normalize an executable or start directory path for duplicate detection.
+
+Attributes
+----------
+TYPE_MAP : int
+    The type byte that starts a nested map.
+TYPE_STRING : int
+    The type byte that starts a NUL-terminated string value.
+TYPE_INT32 : int
+    The type byte that starts a little-endian 32-bit integer value.
+TYPE_MAP_END : int
+    The type byte that terminates a map.
+
+Methods
+-------
+EntryIndex.scan(data, entries=None)
+    Index the shortcut entries of a buffer in one forward pass.
+
+EntryIndex.span(index)
+    Return the byte range of the entry with the given index.
+
+EntryIndex.append(data, entries)
+    Splice new entries in after the last entry of a buffer.
+
+EntryIndex.replace(data, entries)
+    Replace the items of the shortcuts map of a buffer, keeping every other root-level key.
+
+ShortcutsFile.parse(data)
+    Parse the contents of a shortcuts.vdf file.
+
+ShortcutsFile.load(path)
+    Read and parse a shortcuts.vdf file.
+
+ShortcutsFile.to_bytes()
+    Serialize the shortcuts into the binary VDF format.
+
+ShortcutsFile.append(entry)
+    Append a shortcut entry and return its index.
+
+ShortcutsFile.mark_dirty()
+    Force the next serialization to rewrite every entry.
+
+ShortcutsFile.find(app_name=None, exe=None, start_dir='')
+    Find the position of an entry by name or by executable and start directory.
+
+ShortcutsFile.contains(app_name=None, exe=None, start_dir='')
+    Check if an entry with the given name or executable and start directory exists.
+
+ShortcutsFile.new_entry(app_name, exe, start_dir, icon='', shortcut_path='')
+    Build a shortcut entry with the fields Steam expects.
+
+Notes
+-----
+- Values are typed by their Python type: `str` is written as a string, `int` as an int32 and `dict` as a nested map.
+- Strings are decoded as UTF-8 with `surrogateescape`, so undecodable bytes survive a parse/serialize round trip.
+- A file that ends before its closing map terminators (as written by older versions of this tool) is accepted.
+- A parsed `ShortcutsFile` keeps its source buffer; appended entries are spliced in at the end of the
+  `shortcuts` map, so the existing entries are copied once and never re-encoded.
+- Duplicate lookups use hash indexes keyed by normalized AppName and by normalized (Exe, StartDir),
+  built on first use and kept up to date by `append`.
+
+Example
+-------
+To add a shortcut to an existing file:
+
+from shortcuts_vdf import ShortcutsFile
+
+shortcuts = ShortcutsFile.load("path/to/shortcuts.vdf")
+shortcuts.append(ShortcutsFile.new_entry("Game", "path/to/game.exe", "path/to/game"))
+with open("path/to/shortcuts.vdf", 'wb') as f:
+    f.write(shortcuts.to_bytes())
+"""
+
+import os
+import struct
+
+TYPE_MAP = 0x00
+TYPE_STRING = 0x01
+TYPE_INT32 = 0x02
+TYPE_MAP_END = 0x08
+
+_INT32 = struct.Struct('<I')
+_ENCODING = 'utf-8'
+_ERRORS = 'surrogateescape'
+
+
+def _read_cstring(data, pos):
+    """
+    Read a NUL-terminated string starting at the given offset.
+
+    Args:
+        data (bytes): The binary VDF buffer.
+        pos (int): The offset of the first byte of the string.
+
+    Returns:
+        tuple: The decoded string and the offset just past its terminator.
+
+    Raises:
+        ValueError: If the string is not terminated.
+    """
+    end = data.find(b'\x00', pos)
+    if end == -1:
+        raise ValueError(f"Unterminated string at offset {pos}")
+    return data[pos:end].decode(_ENCODING, _ERRORS), end + 1
+
+
+def _parse_map(data, pos):
+    """
+    Parse the items of a map starting at the given offset.
+
+    Args:
+        data (bytes): The binary VDF buffer.
+        pos (int): The offset of the first item of the map.
+
+    Returns:
+        tuple: The parsed dictionary and the offset just past the map terminator.
+
+    Raises:
+        ValueError: If the buffer contains an unsupported or truncated value.
+    """
+    result = {}
+    length = len(data)
+    while pos < length:
+        value_type = data[pos]
+        pos += 1
+        if value_type == TYPE_MAP_END:
+            return result, pos
+        key, pos = _read_cstring(data, pos)
+        if value_type == TYPE_MAP:
+            value, pos = _parse_map(data, pos)
+        elif value_type == TYPE_STRING:
+            value, pos = _read_cstring(data, pos)
+        elif value_type == TYPE_INT32:
+            if pos + 4 > length:
+                raise ValueError(f"Truncated int32 value for key '{key}'")
+            value = _INT32.unpack_from(data, pos)[0]
+            pos += 4
+        else:
+            raise ValueError(
+                f"Unsupported binary VDF type 0x{value_type:02x} at offset {pos - 1}"
+            )
+        result[key] = value
+    return result, pos
+
+
+def _skip_map(data, pos):
+    """
+    Skip over the items of a map starting at the given offset without decoding them.
+
+    Args:
+        data (bytes): The binary VDF buffer.
+        pos (int): The offset of the first item of the map.
+
+    Returns:
+        int: The offset just past the map terminator, or the buffer length if it is unterminated.
+
+    Raises:
+        ValueError: If the buffer contains an unsupported or truncated value.
+    """
+    length = len(data)
+    while pos < length:
+        value_type = data[pos]
+        pos += 1
+        if value_type == TYPE_MAP_END:
+            return pos
+        pos = _skip_cstring(data, pos)
+        pos = _skip_value(data, value_type, pos)
+    return pos
+
+
+def _skip_cstring(data, pos):
+    """
+    Skip over a NUL-terminated string starting at the given offset.
+
+    Args:
+        data (bytes): The binary VDF buffer.
+        pos (int): The offset of the first byte of the string.
+
+    Returns:
+        int: The offset just past the string terminator.
+
+    Raises:
+        ValueError: If the string is not terminated.
+    """
+    end = data.find(b'\x00', pos)
+    if end == -1:
+        raise ValueError(f"Unterminated string at offset {pos}")
+    return end + 1
+
+
+def _skip_value(data, value_type, pos):
+    """
+    Skip over a value of the given type starting at the given offset.
+
+    Args:
+        data (bytes): The binary VDF buffer.
+        value_type (int): The type byte of the value.
+        pos (int): The offset of the first byte of the value.
+
+    Returns:
+        int: The offset just past the value.
+
+    Raises:
+        ValueError: If the value type is unsupported or the value is truncated.
+    """
+    if value_type == TYPE_MAP:
+        return _skip_map(data, pos)
+    if value_type == TYPE_STRING:
+        return _skip_cstring(data, pos)
+    if value_type == TYPE_INT32:
+        if pos + 4 > len(data):
+            raise ValueError(f"Truncated int32 value at offset {pos}")
+        return pos + 4
+    raise ValueError(
+        f"Unsupported binary VDF type 0x{value_type:02x} at offset {pos - 1}"
+    )
+
+
+def _encode_cstring(value):
+    """
+    Encode a string as a NUL-terminated byte string.
+
+    Args:
+        value (str): The string to encode.
+
+    Returns:
+        bytes: The encoded string including its terminator.
+
+    Raises:
+        ValueError: If the string contains a NUL character.
+    """
+    if '\x00' in value:
+        raise ValueError(f"Binary VDF strings cannot contain NUL: {value!r}")
+    return value.encode(_ENCODING, _ERRORS) + b'\x00'
+
+
+def _dump_map(mapping, out):
+    """
+    Serialize the items of a map, followed by its terminator, into a buffer.
+
+    Args:
+        mapping (dict): The map to serialize.
+        out (bytearray): The buffer to append to.
+
+    Raises:
+        TypeError: If a value has a type that cannot be represented.
+    """
+    for key, value in mapping.items():
+        if isinstance(value, dict):
+            out.append(TYPE_MAP)
+            out += _encode_cstring(str(key))
+            _dump_map(value, out)
+        elif isinstance(value, str):
+            out.append(TYPE_STRING)
+            out += _encode_cstring(str(key))
+            out += _encode_cstring(value)
+        elif isinstance(value, int) and not isinstance(value, bool):
+            out.append(TYPE_INT32)
+            out += _encode_cstring(str(key))
+            out += _INT32.pack(value & 0xFFFFFFFF)
+        else:
+            raise TypeError(
+                f"Cannot serialize value of type {type(value).__name__} for key '{key}'"
+            )
+    out.append(TYPE_MAP_END)
+
+
+def normalize_name(app_name):
+    """
+    Normalize a game name for duplicate detection.
+
+    Args:
+        app_name (str): The name of the game.
+
+    Returns:
+        str: The case-folded name with surrounding and repeated whitespace removed.
+    """
+    return ' '.join(app_name.casefold().split())
+
+
+def normalize_path(path):
+    """
+    Normalize an executable or start directory path for duplicate detection.
+
+    Args:
+        path (str or os.PathLike): The path, optionally wrapped in quotes as Steam stores it.
+
+    Returns:
+        str: The normalized path, or an empty string if the path is empty.
+    """
+    path = os.fspath(path).strip().strip('"').strip()
+    if not path:
+        return ''
+    return os.path.normcase(os.path.normpath(path))
+
+
+def loads(data):
+    """
+    Parse a binary VDF buffer into nested dictionaries.
+
+    Args:
+        data (bytes): The binary VDF buffer.
+
+    Returns:
+        dict: The parsed root map.
+
+    Raises:
+        ValueError: If the buffer is malformed.
+    """
+    root, _ = _parse_map(data, 0)
+    return root
+
+
+def dumps(mapping):
+    """
+    Serialize nested dictionaries into a binary VDF buffer.
+
+    Args:
+        mapping (dict): The root map to serialize.
+
+    Returns:
+        bytes: The binary VDF buffer.
+    """
+    out = bytearray()
+    _dump_map(mapping, out)
+    return bytes(out)
+
+
+_SHORTCUTS_HEADER = bytes([TYPE_MAP]) + b'shortcuts\x00'
+_MAP_END = bytes([TYPE_MAP_END])
+
+
+class EntryIndex:
+    """
+    The offsets of the shortcut entries inside a `shortcuts.vdf` buffer, built in one forward scan.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty EntryIndex.
+        """
+        self.spans = {}
+        self.keys = []
+        self.next_index = 0
+        self.start_offset = None
+        self.insert_offset = None
+        self.missing = b''
+
+    @classmethod
+    def scan(cls, data, entries=None):
+        """
+        Index the shortcut entries of a buffer in one forward pass.
+
+        Args:
+            data (bytes): The contents of the shortcuts.vdf file.
+            entries (list, optional): If given, the decoded entries are appended to it during the
+                same pass. Defaults to None.
+
+        Returns:
+            EntryIndex: The index of the entries in the buffer.
+
+        Raises:
+            ValueError: If the buffer is malformed.
+        """
+        index = cls()
+        length = len(data)
+        pos = 0
+        while pos < length:
+            value_type = data[pos]
+            pos += 1
+            if value_type == TYPE_MAP_END:
+                return index
+            key, pos = _read_cstring(data, pos)
+            if value_type == TYPE_MAP and key == ShortcutsFile.ROOT_KEY:
+                pos = index._scan_entries(data, pos, entries)
+            else:
+                pos = _skip_value(data, value_type, pos)
+        if index.insert_offset is not None:
+            # The root map was never closed.
+            index.missing += _MAP_END
+        return index
+
+    def _scan_entries(self, data, pos, entries):
+        """
+        Record the offsets of the items of the shortcuts map.
+
+        Args:
+            data (bytes): The contents of the shortcuts.vdf file.
+            pos (int): The offset of the first item of the shortcuts map.
+            entries (list): The list to append decoded entries to, or None.
+
+        Returns:
+            int: The offset just past the shortcuts map terminator.
+        """
+        self.start_offset = pos
+        length = len(data)
+        while pos < length:
+            start = pos
+            value_type = data[pos]
+            pos += 1
+            if value_type == TYPE_MAP_END:
+                self.insert_offset = start
+                return pos
+            key, pos = _read_cstring(data, pos)
+            if value_type != TYPE_MAP:
+                pos = _skip_value(data, value_type, pos)
+                continue
+            if entries is None:
+                pos = _skip_map(data, pos)
+            else:
+                entry, pos = _parse_map(data, pos)
+                entries.append(entry)
+            self.spans[key] = (start, pos)
+            self.keys.append(key)
+            if key.isdigit():
+                self.next_index = max(self.next_index, int(key) + 1)
+        # The shortcuts map was never closed.
+        self.insert_offset = length
+        self.missing = _MAP_END
+        return pos
+
+    def span(self, index):
+        """
+        Return the byte range of the entry with the given index.
+
+        Args:
+            index (int): The index of the entry.
+
+        Returns:
+            tuple: The start and end offsets of the entry, or None if there is no such entry.
+        """
+        return self.spans.get(str(index))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def append(self, data, entries):
+        """
+        Splice new entries in after the last entry of a buffer.
+
+        The index is updated to describe the returned buffer, so further appends stay O(1) to locate.
+
+        Args:
+            data (bytes): The buffer this index was built from.
+            entries (iterable): The shortcut entries to append.
+
+        Returns:
+            bytes: The updated buffer.
+        """
+        out = bytearray()
+        if self.insert_offset is None:
+            out += _SHORTCUTS_HEADER
+            tail = _MAP_END + _MAP_END
+        else:
+            out += data[: self.insert_offset]
+            tail = data[self.insert_offset :] + self.missing
+        for entry in entries:
+            key = str(self.next_index)
+            start = len(out)
+            out.append(TYPE_MAP)
+            out += _encode_cstring(key)
+            _dump_map(entry, out)
+            self.spans[key] = (start, len(out))
+            self.keys.append(key)
+            self.next_index += 1
+        self.insert_offset = len(out)
+        self.missing = b''
+        out += tail
+        return bytes(out)
+
+    def replace(self, data, entries):
+        """
+        Replace the items of the shortcuts map of a buffer, keeping every other root-level key.
+
+        The index is updated to describe the returned buffer.
+
+        Args:
+            data (bytes): The buffer this index was built from.
+            entries (iterable): The shortcut entries, numbered from 0 in order.
+
+        Returns:
+            bytes: The updated buffer.
+        """
+        self.spans = {}
+        self.keys = []
+        self.next_index = 0
+        if self.insert_offset is None:
+            return self.append(b'', entries)
+        head = data[: self.start_offset]
+        tail = data[self.insert_offset :] + self.missing
+        self.insert_offset = len(head)
+        self.missing = b''
+        return self.append(head + tail, entries)
+
+
+class ShortcutsFile:
+    """
+    An in-memory model of a `shortcuts.vdf` file, holding the shortcut entries in file order.
+
+    Entries should be added with `append`; call `mark_dirty` after editing or removing entries in place.
+    """
+
+    ROOT_KEY = 'shortcuts'
+
+    def __init__(self, entries=None):
+        """
+        Initialize the ShortcutsFile with the given entries.
+
+        Args:
+            entries (iterable, optional): The shortcut entries as dictionaries. Defaults to None.
+        """
+        self.entries = list(entries) if entries else []
+        self.index = EntryIndex()
+        self._data = b''
+        self._pending = []
+        self._dirty = bool(self.entries)
+        self._by_name = None
+        self._by_target = None
+
+    @classmethod
+    def parse(cls, data):
+        """
+        Parse the contents of a shortcuts.vdf file.
+
+        Args:
+            data (bytes): The contents of the shortcuts.vdf file.
+
+        Returns:
+            ShortcutsFile: The parsed shortcuts.
+
+        Raises:
+            ValueError: If the data is not a valid shortcuts.vdf file.
+        """
+        shortcuts = cls()
+        shortcuts.index = EntryIndex.scan(data, shortcuts.entries)
+        shortcuts._data = data
+        return shortcuts
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read and parse a shortcuts.vdf file.
+
+        Args:
+            path (str): The path to the shortcuts.vdf file.
+
+        Returns:
+            ShortcutsFile: The parsed shortcuts.
+        """
+        with open(path, 'rb') as f:
+            return cls.parse(f.read())
+
+    def to_bytes(self):
+        """
+        Serialize the shortcuts into the binary VDF format.
+
+        Appended entries are spliced into the parsed buffer. If the file was marked dirty, every
+        entry is rewritten and renumbered from 0 in its current order; root-level keys other than
+        the shortcuts map are kept as parsed.
+
+        Returns:
+            bytes: The contents of the shortcuts.vdf file.
+        """
+        if self._dirty:
+            self._data = self.index.replace(self._data, self.entries)
+            self._dirty = False
+        elif self._pending or self.index.missing or self.index.insert_offset is None:
+            self._data = self.index.append(self._data, self._pending)
+        self._pending = []
+        return self._data
+
+    def append(self, entry):
+        """
+        Append a shortcut entry.
+
+        Args:
+            entry (dict): The shortcut entry to append.
+
+        Returns:
+            int: The index of the appended entry.
+        """
+        new_index = self.next_index
+        self.entries.append(entry)
+        if not self._dirty:
+            self._pending.append(entry)
+        if self._by_name is not None:
+            self._index_entry(len(self.entries) - 1, entry)
+        return new_index
+
+    @property
+    def next_index(self):
+        """
+        int: The index the next appended entry will receive.
+        """
+        if self._dirty:
+            return len(self.entries)
+        return self.index.next_index + len(self._pending)
+
+    def mark_dirty(self):
+        """
+        Force the next serialization to rewrite every entry.
+        """
+        self._dirty = True
+        self._pending = []
+        self._by_name = None
+        self._by_target = None
+
+    @staticmethod
+    def _target_key(exe, start_dir):
+        """
+        Build the lookup key for an executable and start directory pair.
+
+        Args:
+            exe (str): The executable path.
+            start_dir (str): The start directory.
+
+        Returns:
+            tuple: The normalized (exe, start_dir) pair.
+        """
+        return normalize_path(exe), normalize_path(start_dir)
+
+    def _index_entry(self, position, entry):
+        """
+        Add an entry to the lookup indexes, keeping the first position for duplicate keys.
+
+        Args:
+            position (int): The position of the entry in `entries`.
+            entry (dict): The shortcut entry.
+        """
+        app_name = entry.get('AppName', entry.get('appname'))
+        if isinstance(app_name, str):
+            self._by_name.setdefault(normalize_name(app_name), position)
+        exe = entry.get('Exe', entry.get('exe'))
+        if isinstance(exe, str) and exe.strip('" '):
+            start_dir = entry.get('StartDir', '')
+            if not isinstance(start_dir, str):
+                start_dir = ''
+            self._by_target.setdefault(self._target_key(exe, start_dir), position)
+
+    def _build_indexes(self):
+        """
+        Build the lookup indexes if they are not built yet.
+        """
+        if self._by_name is not None:
+            return
+        self._by_name = {}
+        self._by_target = {}
+        for position, entry in enumerate(self.entries):
+            self._index_entry(position, entry)
+
+    def find(self, app_name=None, exe=None, start_dir=''):
+        """
+        Find the position of an entry by name or by executable and start directory.
+
+        Args:
+            app_name (str, optional): The name of the game. Defaults to None.
+            exe (str, optional): The executable path of the game. Defaults to None.
+            start_dir (str, optional): The start directory of the game. Defaults to ''.
+
+        Returns:
+            int: The position of the first matching entry in `entries`, else None.
+        """
+        self._build_indexes()
+        if app_name:
+            position = self._by_name.get(normalize_name(app_name))
+            if position is not None:
+                return position
+        if exe:
+            return self._by_target.get(self._target_key(exe, start_dir or ''))
+        return None
+
+    def contains(self, app_name=None, exe=None, start_dir=''):
+        """
+        Check if an entry with the given name or executable and start directory exists.
+
+        Args:
+            app_name (str, optional): The name of the game. Defaults to None.
+            exe (str, optional): The executable path of the game. Defaults to None.
+            start_dir (str, optional): The start directory of the game. Defaults to ''.
+
+        Returns:
+            bool: True if a matching entry exists, else False.
+        """
+        return self.find(app_name, exe, start_dir) is not None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, index):
+        return self.entries[index]
+
+    @staticmethod
+    def new_entry(app_name, exe, start_dir, icon='', shortcut_path=''):
+        """
+        Build a shortcut entry with the fields Steam expects.
+
+        Args:
+            app_name (str): The name of the non-Steam game.
+            exe (str): The executable path of the non-Steam game.
+            start_dir (str): The start directory of the non-Steam game.
+            icon (str, optional): The icon path of the non-Steam game. Defaults to ''.
+            shortcut_path (str, optional): The shortcut path. Defaults to ''.
+
+        Returns:
+            dict: The shortcut entry.
+        """
+        return {
+            'appid': 0,
+            'AppName': app_name,
+            'Exe': f'"{exe}"',
+            'StartDir': os.path.join(start_dir, ''),
+            'icon': f'"{icon}"',
+            'ShortcutPath': shortcut_path,
+            'LaunchOptions': '',
+            'IsHidden': 0,
+            'AllowDesktopConfig': 1,
+            'AllowOverlay': 1,
+            'OpenVR': 0,
+            'Devkit': 0,
+            'DevkitGameID': '',
+            'DevkitOverrideAppID': 0,
+            'LastPlayTime': 0,
+            'FlatpakAppID': '',
+            'tags': {},
+        }
@@ -0,0 +1,224 @@
+"""
+startup_benchmark.py
+====================
+
+This module measures the import time of the application's startup path with `python -X importtime` and checks it against a budget.
+
+Classes
+-------
+None
+
+Functions
+---------
+measure_imports(module='ui', script_args=None)
+    Import a module in a fresh interpreter and return the timing of every import.
+
+check_startup(module='ui', budget_ms=STARTUP_BUDGET_MS, repeat=5, script_args=None)
+    Measure the startup imports and report whether they stay within the budget.
+
+main(argv=None)
+    Run the benchmark from the command line.
+
+Attributes
+----------
+STARTUP_BUDGET_MS : float
+    The maximum import time of the startup path in milliseconds.
+DEFERRED_MODULES : tuple
+    The heavy top-level packages that must not be imported before the window is shown.
+
+Notes
+-----
+- Each measurement runs in a new interpreter, and the fastest of `repeat` runs is used, so the first run
+  also compiles any stale bytecode and noise from other processes is filtered out.
+- The check fails if the startup path exceeds the budget or imports any of DEFERRED_MODULES; the latter
+  catches regressions regardless of how fast the machine running the check is.
+- With `script_args`, the module is run as a script (e.g. `cli.py --help`) instead of imported, and every
+  import made after interpreter startup is counted, including those made lazily by the command.
+- Exit status is 0 if the check passes, 1 if it fails and 2 if the module cannot be imported.
+
+Example
+-------
+To check the startup path from the repository root:
+
+python startup_benchmark.py --budget 400 --top 15
+
+To check a command of the command line interface:
+
+python startup_benchmark.py --module cli -- list
+"""
+
+import os
+import sys
+import logging
+import argparse
+import subprocess
+
+STARTUP_BUDGET_MS = 400.0
+DEFERRED_MODULES = ('requests', 'urllib3', 'psutil', 'pefile', 'PIL', 'icoextract', 'dotenv')
+
+
+def _run_importtime(command):
+    """
+    Run a Python command with `-X importtime` in a fresh interpreter and parse the timings.
+
+    Args:
+        command (list): The interpreter arguments after `-X importtime`.
+
+    Returns:
+        list: Tuples of the imported name, its nesting depth, and its own and cumulative time in
+            microseconds, in the order `-X importtime` reports them.
+
+    Raises:
+        ImportError: If the command fails.
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', *command],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    if process.returncode != 0:
+        raise ImportError(f"Cannot run {' '.join(command)}: {process.stderr.strip().splitlines()[-1:]}")
+
+    imports = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return imports
+
+
+def measure_imports(module='ui', script_args=None):
+    """
+    Import a module in a fresh interpreter and return the timing of every import.
+
+    Args:
+        module (str, optional): The module to import. Defaults to 'ui'.
+        script_args (list, optional): Run `<module>.py` as a script with these arguments instead of
+            importing it. Defaults to None.
+
+    Returns:
+        list: Tuples of the imported name, its nesting depth, and its own and cumulative time in
+            microseconds, in the order `-X importtime` reports them.
+
+    Raises:
+        ImportError: If the module cannot be imported or the script fails.
+    """
+    if script_args is None:
+        return _run_importtime(['-c', f'import {module}'])
+    return _run_importtime([f'{module}.py', *script_args])
+
+
+def _total(imports, module, startup=None):
+    """
+    Sum the import time of the startup path of one measurement.
+
+    Args:
+        imports (list): The timings from `measure_imports`.
+        module (str): The measured module.
+        startup (set, optional): The names imported by interpreter startup if the module was run as a
+            script, else None.
+
+    Returns:
+        int: The import time in microseconds.
+    """
+    if startup is None:
+        # Interpreter startup imports are listed too; only the module's own entry is counted
+        return next(
+            cumulative
+            for name, depth, _, cumulative in reversed(imports)
+            if depth == 0 and name == module
+        )
+    # A script has no entry of its own, so every top-level import after interpreter startup is counted
+    return sum(
+        cumulative
+        for name, depth, _, cumulative in imports
+        if depth == 0 and name not in startup
+    )
+
+
+def check_startup(module='ui', budget_ms=STARTUP_BUDGET_MS, repeat=5, script_args=None):
+    """
+    Measure the startup imports and report whether they stay within the budget.
+
+    Args:
+        module (str, optional): The module imported at startup. Defaults to 'ui'.
+        budget_ms (float, optional): The budget in milliseconds. Defaults to STARTUP_BUDGET_MS.
+        repeat (int, optional): The number of measurements. Defaults to 5.
+        script_args (list, optional): Run `<module>.py` as a script with these arguments instead of
+            importing it. Defaults to None.
+
+    Returns:
+        dict: The report with the keys `module` (the command line if run as a script), `total_ms`,
+            `budget_ms`, `imports` (of the fastest run), `deferred_loaded` (the DEFERRED_MODULES that were
+            imported) and `ok`.
+    """
+    startup = None
+    if script_args is not None:
+        startup = {name for name, _, _, _ in _run_importtime(['-c', 'pass'])}
+    best = None
+    for _ in range(max(1, repeat)):
+        imports = measure_imports(module, script_args)
+        total = _total(imports, module, startup)
+        if best is None or total < best[0]:
+            best = (total, imports)
+
+    total, imports = best
+    loaded = {name.split('.')[0] for name, _, _, _ in imports}
+    deferred_loaded = [name for name in DEFERRED_MODULES if name in loaded]
+    total_ms = total / 1000
+    return {
+        'module': module if script_args is None else ' '.join([f'{module}.py', *script_args]),
+        'total_ms': total_ms,
+        'budget_ms': budget_ms,
+        'imports': imports,
+        'deferred_loaded': deferred_loaded,
+        'ok': total_ms <= budget_ms and not deferred_loaded,
+    }
+
+
+def main(argv=None):
+    """
+    Run the benchmark from the command line.
+
+    Args:
+        argv (list, optional): The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(description="Check the import time of the startup path.")
+    parser.add_argument('--module', default='ui', help="the module imported at startup")
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET_MS, help="the budget in ms")
+    parser.add_argument('--repeat', type=int, default=5, help="the number of measurements")
+    parser.add_argument('--top', type=int, default=10, help="the number of slowest imports shown")
+    parser.add_argument(
+        'script_args', nargs='*', help="run the module as a script with these arguments (after --)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        report = check_startup(
+            args.module, args.budget, args.repeat, args.script_args if args.script_args else None
+        )
+    except ImportError as e:
+        logging.error(str(e))
+        return 2
+
+    print(f"Starting {report['module']} took {report['total_ms']:.1f} ms (budget {report['budget_ms']:.0f} ms).")
+    slowest = sorted(report['imports'], key=lambda item: item[2], reverse=True)[:args.top]
+    for name, _, self_us, cumulative_us in slowest:
+        print(f"  {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms cumulative  {name}")
+    if report['deferred_loaded']:
+        print(f"Deferred modules imported at startup: {', '.join(report['deferred_loaded'])}")
+    print("OK" if report['ok'] else "FAILED")
+    return 0 if report['ok'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,25 +16,69 @@ None
 Attributes
 ----------
 BASE_URL : str
-    The base URL for the Steam Web API.
-APP_LIST_URL : str
-    The URL for retrieving the list of all Steam applications.
+    The default base URL for the Steam Web API.
+STORE_URL : str
+    The default base URL for the Steam store API.
+APP_LIST_PATH : str
+    The path for retrieving the list of all Steam applications.
+CACHE_TTL : int
+    The number of seconds a cached app list is used without revalidation.
+FUZZY_MIN_SCORE : float
+    The minimum score for a fuzzy match to be accepted as an app ID.
+REQUESTS_PER_SECOND : float
+    The default rate limit of the HTTP session.
+STREAM_CHUNK_SIZE : int
+    The number of bytes read at a time while streaming the app list.
+OFFLINE_RETRY_DELAY : float
+    The number of seconds a failed app list download is remembered before it is tried again.
 
 Methods
 -------
-__init__(api_key)
+__init__(api_key, cache_dir=None, cache_ttl=None, base_url=None, store_url=None, session=None)
     Initialize the SteamAPI class with the provided API key.
 
-get_app_list()
+get_app_list(force_refresh=False)
     Retrieve the list of all Steam applications.
 
-find_app_id(game_name)
+prefetch(fuzzy=True)
+    Load the app list and build its indexes ahead of the first lookup.
+
+get_name_index()
+    Return the lowercase name index for the current app list.
+
+get_name_matcher()
+    Return the fuzzy name matcher for the current app list.
+
+search_apps(game_name, limit=5)
+    Return the Steam apps whose names best match a game name.
+
+find_app_id(game_name, fuzzy=True)
     Find the Steam app ID for a given game name.
 
+find_app_ids(game_names, fuzzy=True)
+    Find the Steam app IDs for several game names.
+
+get_app_details(app_id)
+    Retrieve the store details of a Steam app.
+
 Notes
 -----
 - Ensure that the `requests` library is installed in your environment.
-- The `get_app_list` method caches the app list after the first retrieval to optimize performance.
+- All requests go through one pooled session (see `http_session.create_session`) with timeouts, retries with
+  jittered exponential backoff, compression and rate limiting.
+- Loading the app list and building its indexes is guarded by a lock, so concurrent callers share one download.
+  A lookup made while `prefetch` runs on another thread waits for it instead of starting a second download.
+- The base URLs default to STEAM_API_BASE_URL and STEAM_STORE_BASE_URL from `config`, so a local stub server
+  can stand in for Steam.
+- The `get_app_list` method caches the app list in memory and on disk (see `app_list_cache.AppListCache`).
+  A cache older than CACHE_TTL is revalidated with If-None-Match/If-Modified-Since, and the last snapshot
+  is used when the Steam Web API cannot be reached. Without a snapshot, a failed download is not retried for
+  OFFLINE_RETRY_DELAY seconds, so a batch of lookups pays the network timeout once rather than once per name.
+- The app list is parsed while it is downloaded and stored in compact columns (see `app_list_cache.AppList`),
+  so the whole JSON payload is never held in memory.
+- The name index used by `find_app_id` is built once per app list version and stored next to the cached list.
+- When no app has the exact name, `find_app_id` falls back to `name_matcher.NameMatcher` and accepts the best
+  match if it scores at least FUZZY_MIN_SCORE and clearly beats the runner-up.
 
 Example
 -------
@@ -58,8 +102,14 @@ else:
     print("App ID not found.")
 """
 
+import time
 import requests
 import logging
+import threading
+from app_list_cache import AppList, AppListCache, NameIndex
+from name_matcher import NameMatcher
+from http_session import create_session
+from config import CACHE_DIR, STEAM_API_BASE_URL, STEAM_STORE_BASE_URL
 
 
 class SteamAPI:
@@ -67,18 +117,58 @@ class SteamAPI:
     A class to interact with the Steam Web API for retrieving app lists and working with Steam IDs.
     """
 
-    BASE_URL = "http://api.steampowered.com"
-    APP_LIST_URL = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
-
-    def __init__(self, api_key):
+    BASE_URL = "https://api.steampowered.com"
+    STORE_URL = "https://store.steampowered.com"
+    APP_LIST_PATH = "/ISteamApps/GetAppList/v2/"
+    REQUESTS_PER_SECOND = 4
+    CACHE_TTL = 24 * 60 * 60
+    FUZZY_MIN_SCORE = 0.75
+    STREAM_CHUNK_SIZE = 64 * 1024
+    OFFLINE_RETRY_DELAY = 60.0
+
+    def __init__(
+        self,
+        api_key,
+        cache_dir=None,
+        cache_ttl=None,
+        base_url=None,
+        store_url=None,
+        session=None,
+    ):
         """
         Initialize the SteamAPI class with the provided API key.
 
         Args:
             api_key (str): The API key for accessing the Steam Web API.
+            cache_dir (str, optional): The directory for the persistent app list cache. Defaults to CACHE_DIR.
+            cache_ttl (float, optional): The number of seconds a cached app list is used without
+                revalidation. Defaults to CACHE_TTL.
+            base_url (str, optional): The base URL of the Steam Web API. Defaults to STEAM_API_BASE_URL
+                or BASE_URL.
+            store_url (str, optional): The base URL of the Steam store API. Defaults to
+                STEAM_STORE_BASE_URL or STORE_URL.
+            session (requests.Session, optional): The HTTP session. Defaults to a new session from
+                `create_session` limited to REQUESTS_PER_SECOND.
         """
         self.api_key = api_key
+        if not api_key:
+            logging.warning(
+                "No Steam API key set. Set STEAM_API_KEY in the environment or the .env file."
+            )
+        self.base_url = (base_url or STEAM_API_BASE_URL or self.BASE_URL).rstrip('/')
+        self.store_url = (store_url or STEAM_STORE_BASE_URL or self.STORE_URL).rstrip('/')
+        self.app_list_url = self.base_url + self.APP_LIST_PATH
+        self.session = session or create_session(rate=self.REQUESTS_PER_SECOND)
         self.app_list_cache = None
+        self.app_list_metadata = {}
+        self.name_index = None
+        self.name_matcher = None
+        self._lock = threading.RLock()
+        self._offline_until = 0.0
+        self.persistent_cache = AppListCache(
+            cache_dir or CACHE_DIR,
+            self.CACHE_TTL if cache_ttl is None else cache_ttl,
+        )
 
     def validate_steam_id(self, steam_id):
         """
@@ -98,31 +188,173 @@ class SteamAPI:
             logging.warning(f"Invalid Steam ID format: {steam_id}")
             return False
 
-    def get_app_list(self):
+    def get_app_list(self, force_refresh=False):
         """
         Retrieve the list of all Steam applications.
 
+        The list is loaded from the persistent cache while it is fresh. Otherwise it is revalidated
+        with the Steam Web API, falling back to the cached snapshot if the request fails.
+
+        Args:
+            force_refresh (bool, optional): Revalidate the cache even if it is fresh. Defaults to False.
+
         Returns:
-            list: A list of dictionaries containing app information.
+            AppList: The apps, iterable as dictionaries containing app information.
         """
-        try:
-            if not self.app_list_cache:
-                response = requests.get(self.APP_LIST_URL)
-                response.raise_for_status()
-                data = response.json()
-                self.app_list_cache = data['applist']['apps']
-                logging.info("Retrieved Steam app list.")
+        if self.app_list_cache and not force_refresh:
             return self.app_list_cache
-        except requests.RequestException as e:
+        with self._lock:
+            if self.app_list_cache and not force_refresh:
+                return self.app_list_cache
+            if not force_refresh and time.monotonic() < self._offline_until:
+                logging.debug("Skipping the Steam app list download after a recent failure.")
+                return AppList()
+            return self._load_app_list(force_refresh)
+
+    def _load_app_list(self, force_refresh):
+        """
+        Load the app list from the persistent cache or the Steam Web API.
+
+        Args:
+            force_refresh (bool): Revalidate the cache even if it is fresh.
+
+        Returns:
+            AppList: The apps.
+        """
+        cache = self.persistent_cache
+        app_list, metadata = cache.load()
+        if app_list is not None and cache.is_fresh(metadata) and not force_refresh:
+            self.app_list_cache, self.app_list_metadata = app_list, metadata
+            return app_list
+
+        headers = cache.validation_headers(metadata) if app_list is not None else {}
+        try:
+            with self.session.get(
+                self.app_list_url, headers=headers, stream=True
+            ) as response:
+                if response.status_code == 304 and app_list is not None:
+                    metadata = cache.touch()
+                    logging.info("Steam app list is unchanged, using the cached copy.")
+                else:
+                    response.raise_for_status()
+                    app_list = AppList.from_json_stream(
+                        response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE)
+                    )
+                    metadata = cache.save(
+                        app_list,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified'),
+                    )
+                    logging.info(
+                        f"Retrieved Steam app list: {len(app_list)} apps in "
+                        f"{app_list.memory_usage() / 2**20:.1f} MiB."
+                    )
+        except (requests.RequestException, ValueError) as e:
             logging.error(f"Error retrieving Steam app list: {e}")
+            if app_list is None:
+                self._offline_until = time.monotonic() + self.OFFLINE_RETRY_DELAY
+                return AppList()
+            logging.warning("Using the cached Steam app list while offline.")
+
+        self.app_list_cache, self.app_list_metadata = app_list, metadata
+        return app_list
+
+    def prefetch(self, fuzzy=True):
+        """
+        Load the app list and build its indexes ahead of the first lookup.
+
+        Meant to run on a background thread at startup.
+
+        Args:
+            fuzzy (bool, optional): Also build the fuzzy name matcher. Defaults to True.
+
+        Returns:
+            int: The number of apps loaded.
+        """
+        self.get_name_index()
+        if fuzzy:
+            self.get_name_matcher()
+        count = len(self.app_list_cache or ())
+        logging.info(f"Prefetched the Steam app list: {count} apps.")
+        return count
+
+    def get_name_index(self):
+        """
+        Return the lowercase name index for the current app list.
+
+        The index is loaded from the persistent cache if it matches the app list version, otherwise it
+        is built and stored.
+
+        Returns:
+            NameIndex: The index.
+        """
+        with self._lock:
+            app_list = self.get_app_list()
+            if self.name_index is not None and self.name_index.app_list is app_list:
+                return self.name_index
+
+            index = self.persistent_cache.load_index(app_list, self.app_list_metadata)
+            if index is None:
+                index = NameIndex.build(app_list)
+                if app_list:
+                    self.persistent_cache.save_index(index, self.app_list_metadata)
+            self.name_index = index
+            return index
+
+    def get_name_matcher(self):
+        """
+        Return the fuzzy name matcher for the current app list.
+
+        Returns:
+            NameMatcher: The matcher, built on first use for each app list.
+        """
+        with self._lock:
+            app_list = self.get_app_list()
+            if self.name_matcher is None or self.name_matcher.app_list is not app_list:
+                self.name_matcher = NameMatcher.build(app_list)
+            return self.name_matcher
+
+    def search_apps(self, game_name, limit=5):
+        """
+        Return the Steam apps whose names best match a game name.
+
+        Args:
+            game_name (str): The name of the game.
+            limit (int, optional): The maximum number of results. Defaults to 5.
+
+        Returns:
+            list: Dictionaries with the keys `appid`, `name` and `score`, best match first.
+        """
+        if not game_name:
             return []
+        return self.get_name_matcher().search(game_name, limit=limit)
+
+    def _fuzzy_app_id(self, game_name):
+        """
+        Find the app ID of the best fuzzy match for a game name.
+
+        Args:
+            game_name (str): The name of the game.
 
-    def find_app_id(self, game_name):
+        Returns:
+            int: The app ID if a confident match is found, else None.
+        """
+        match = self.get_name_matcher().best_match(game_name, self.FUZZY_MIN_SCORE)
+        if match:
+            logging.info(
+                f"Matched game '{game_name}' to '{match['name']}' (score {match['score']})."
+            )
+            return match['appid']
+        return None
+
+    def find_app_id(self, game_name, fuzzy=True):
         """
         Find the Steam app ID for a given game name.
 
         Args:
             game_name (str): The name of the game to find the app ID for.
+            fuzzy (bool, optional): Fall back to fuzzy matching if no app has the exact name.
+                Defaults to True.
 
         Returns:
             int: The app ID if found, else None.
@@ -130,10 +362,9 @@ class SteamAPI:
         if not game_name or game_name == "":
             return None
 
-        apps = self.get_app_list()
-        app_dict = {app['name'].lower(): app['appid'] for app in apps}
-
-        app_id = app_dict.get(game_name.lower())
+        app_id = self.get_name_index().lookup(game_name)
+        if not app_id and fuzzy:
+            app_id = self._fuzzy_app_id(game_name)
         if app_id:
             logging.info(f"Found app ID for game '{game_name}': {app_id}")
         else:
@@ -141,8 +372,51 @@ class SteamAPI:
 
         return app_id
 
+    def find_app_ids(self, game_names, fuzzy=True):
+        """
+        Find the Steam app IDs for several game names.
+
+        Args:
+            game_names (iterable): The names of the games to find the app IDs for.
+            fuzzy (bool, optional): Fall back to fuzzy matching for names without an exact match.
+                Defaults to True.
+
+        Returns:
+            dict: The app ID (or None if not found) for each game name.
+        """
+        index = self.get_name_index()
+        app_ids = {
+            game_name: index.lookup(game_name) if game_name else None
+            for game_name in game_names
+        }
+        if fuzzy:
+            for game_name, app_id in app_ids.items():
+                if game_name and not app_id:
+                    app_ids[game_name] = self._fuzzy_app_id(game_name)
+        found = sum(1 for app_id in app_ids.values() if app_id)
+        logging.info(f"Found app IDs for {found} of {len(app_ids)} games.")
+        return app_ids
+
+    def get_app_details(self, app_id):
+        """
+        Retrieve the store details of a Steam app.
+
+        Args:
+            app_id (int): The app ID.
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
-)
+        Returns:
+            dict: The store details (name, type, header image, ...) if available, else None.
+        """
+        try:
+            response = self.session.get(
+                f"{self.store_url}/api/appdetails", params={'appids': app_id}
+            )
+            response.raise_for_status()
+            entry = response.json().get(str(app_id)) or {}
+        except (requests.RequestException, ValueError, AttributeError) as e:
+            logging.error(f"Error retrieving details for app {app_id}: {e}")
+            return None
+        if not entry.get('success'):
+            logging.warning(f"No store details for app {app_id}.")
+            return None
+        return entry.get('data')
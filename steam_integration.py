@@ -17,6 +17,10 @@ Attributes
 ----------
 STEAM_PATH_OPTIONS : list
     A list of possible paths to the Steam installation directory.
+MAX_WORKERS : int
+    The default number of user profiles processed concurrently.
+BACKUP_COUNT : int
+    The default number of timestamped shortcuts.vdf backups to keep.
 
 Methods
 -------
@@ -29,10 +33,22 @@ find_steam_user_ids(steam_path)
 read_shortcuts_file(path)
     Read the shortcuts.vdf file.
 
-write_shortcuts_file(path, data)
-    Write to the shortcuts.vdf file.
+write_shortcuts_file(path, data, backup_count=None)
+    Atomically write to the shortcuts.vdf file.
 
-game_exists(shortcuts_data, app_name)
+backup_shortcuts_file(path, backup_count)
+    Keep a timestamped backup of the shortcuts.vdf file and prune old ones.
+
+parse_shortcuts(shortcuts_data)
+    Parse the shortcuts data into a ShortcutsFile.
+
+load_shortcuts(path)
+    Load a shortcuts.vdf file, reusing the parsed copy while the file is unchanged.
+
+save_shortcuts(path, shortcuts)
+    Serialize and write a ShortcutsFile, keeping the parsed copy cached.
+
+game_exists(shortcuts_data, app_name, exe=None, start_dir='')
     Check if a game already exists in the shortcuts data.
 
 find_last_entry_index(shortcuts_data)
@@ -41,17 +57,38 @@ find_last_entry_index(shortcuts_data)
 add_non_steam_game_entry(shortcuts_data, app_name, exe, start_dir, icon='', shortcut_path='')
     Add a new non-Steam game entry to the shortcuts data.
 
+process_user_entries(steam_path, user_id, entries)
+    Add several non-Steam game entries for a specific user ID with one read and one write.
+
 process_user_id(steam_path, user_id, app_name, exe, start_dir, icon='', shortcut_path='')
     Process the addition of a non-Steam game entry for a specific user ID.
 
-add_non_steam_game(app_name, exe, start_dir, icon='')
+add_non_steam_game(app_name, exe, start_dir, icon='', max_workers=None)
     Add a non-Steam game to all user profiles in the Steam installation.
 
+add_non_steam_games(entries, user_ids=None, max_workers=None)
+    Add several non-Steam games to user profiles, reading and writing each shortcuts.vdf once.
+
+find_existing_games(entries, user_ids=None)
+    Check which games already have an entry in each user profile, without changing anything.
+
+list_non_steam_games(user_ids=None)
+    List the non-Steam game entries of user profiles.
+
+remove_user_entries(steam_path, user_id, app_name=None, exe=None, dry_run=False)
+    Remove the non-Steam game entries matching a name or executable for a specific user ID.
+
+remove_non_steam_games(app_name=None, exe=None, user_ids=None, dry_run=False)
+    Remove the non-Steam game entries matching a name or executable from user profiles.
+
 Notes
 -----
-- The `psutil` library is used to iterate over running processes.
-- The `subprocess` library is used to open the Steam application.
-- Ensure that the `psutil` and `icoextract` libraries are installed in your environment.
+- The `shortcuts.vdf` file is parsed and serialized with `shortcuts_vdf.ShortcutsFile`.
+- Parsed files are cached per path and reused while their modification time and size are unchanged.
+- Writes go to a temporary file that is fsynced and swapped in with `os.replace`, so an interrupted
+  write never truncates the existing shortcuts.vdf.
+- User profiles are processed on a bounded thread pool; each shortcuts.vdf is read, modified and written
+  under a per-file lock.
 
 Example
 -------
@@ -72,12 +109,13 @@ except FileNotFoundError as e:
 """
 
 import os
+import shutil
 import logging
-
-NUL = b'\x00'
-SOH = b'\x01'
-STX = b'\x02'
-BS = b'\x08'
+import tempfile
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from shortcuts_vdf import EntryIndex, ShortcutsFile, dumps, normalize_name, normalize_path
 
 
 class SteamIntegration:
@@ -91,6 +129,19 @@ class SteamIntegration:
         'C:\\Program Files\\Steam',
     ]
 
+    MAX_WORKERS = 8
+    BACKUP_COUNT = 3
+
+    _shortcuts_cache = {}
+    _file_locks = {}
+    _file_locks_guard = threading.Lock()
+    # The umask can only be read by setting it, which affects every thread, so it is read once at import,
+    # before any worker threads exist
+    _umask = os.umask(0o022)
+    os.umask(_umask)
+    _file_mode = 0o666 & ~_umask
+    del _umask
+
     @staticmethod
     def locate_steam_installation():
         """
@@ -146,53 +197,205 @@ class SteamIntegration:
             return f.read()
 
     @staticmethod
-    def write_shortcuts_file(path, data):
+    def write_shortcuts_file(path, data, backup_count=None):
         """
-        Write to the shortcuts.vdf file.
+        Atomically write to the shortcuts.vdf file.
+
+        The data is re-parsed before anything touches the disk, written to a temporary file in the
+        same directory, fsynced and then swapped in with `os.replace`.
 
         Args:
             path (str): The path to the shortcuts.vdf file.
             data (bytes): The data to be written to the file.
+            backup_count (int, optional): The number of timestamped backups to keep. Defaults to
+                BACKUP_COUNT; 0 disables backups.
+
+        Raises:
+            ValueError: If the data is not a complete shortcuts.vdf file.
         """
-        with open(path, 'wb') as f:
-            f.write(data)
+        index = EntryIndex.scan(data)
+        if index.insert_offset is None or index.missing:
+            raise ValueError(f"Refusing to write an incomplete shortcuts file to {path}")
+
+        if backup_count is None:
+            backup_count = SteamIntegration.BACKUP_COUNT
+        if backup_count > 0 and os.path.exists(path):
+            SteamIntegration.backup_shortcuts_file(path, backup_count)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(
+            dir=directory, prefix='.shortcuts.vdf.', suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            if os.path.exists(path):
+                shutil.copymode(path, temp_path)
+            else:
+                # mkstemp creates the file with mode 0600; use what open() would have given
+                os.chmod(temp_path, SteamIntegration._file_mode)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+        # Persist the rename itself; directories cannot be opened on Windows.
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
 
     @staticmethod
-    def game_exists(shortcuts_data, app_name):
+    def backup_shortcuts_file(path, backup_count):
+        """
+        Keep a timestamped backup of the shortcuts.vdf file and prune old ones.
+
+        Backups are hard links where the file system supports them, so they cost no copy.
+
+        Args:
+            path (str): The path to the shortcuts.vdf file.
+            backup_count (int): The number of backups to keep.
+
+        Returns:
+            str: The path to the new backup, else None.
+        """
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        backup_path = f"{path}.{timestamp}.bak"
+        try:
+            try:
+                os.link(path, backup_path)
+            except OSError:
+                shutil.copy2(path, backup_path)
+        except OSError as e:
+            logging.error(f"Error backing up shortcuts file {path}: {e}")
+            return None
+
+        directory, name = os.path.split(os.path.abspath(path))
+        backups = sorted(
+            entry
+            for entry in os.listdir(directory)
+            if entry.startswith(name + '.') and entry.endswith('.bak')
+        )
+        for old_backup in backups[:-backup_count]:
+            try:
+                os.remove(os.path.join(directory, old_backup))
+            except OSError as e:
+                logging.warning(f"Error removing old backup {old_backup}: {e}")
+        logging.info(f"Backed up shortcuts file to {backup_path}")
+        return backup_path
+
+    @staticmethod
+    def parse_shortcuts(shortcuts_data):
+        """
+        Parse the shortcuts data into a ShortcutsFile.
+
+        Args:
+            shortcuts_data (bytes or ShortcutsFile): The data from the shortcuts.vdf file.
+
+        Returns:
+            ShortcutsFile: The parsed shortcuts.
+        """
+        if isinstance(shortcuts_data, ShortcutsFile):
+            return shortcuts_data
+        return ShortcutsFile.parse(shortcuts_data)
+
+    @staticmethod
+    def game_exists(shortcuts_data, app_name, exe=None, start_dir=''):
         """
         Check if a game already exists in the shortcuts data.
 
+        A game exists if an entry has the same name (ignoring case and whitespace) or the same
+        executable and start directory.
+
         Args:
-            shortcuts_data (bytes): The data from the shortcuts.vdf file.
+            shortcuts_data (bytes or ShortcutsFile): The data from the shortcuts.vdf file.
             app_name (str): The name of the game to check.
+            exe (str, optional): The executable path of the game. Defaults to None.
+            start_dir (str, optional): The start directory of the game. Defaults to ''.
 
         Returns:
             bool: True if the game exists, else False.
         """
-        exists = app_name.encode('utf-8') in shortcuts_data
+        shortcuts = SteamIntegration.parse_shortcuts(shortcuts_data)
+        exists = shortcuts.contains(app_name, exe, start_dir)
         if exists:
             logging.info(f"The game '{app_name}' already exists in the shortcuts file.")
         return exists
 
+    @staticmethod
+    def load_shortcuts(path):
+        """
+        Load a shortcuts.vdf file, reusing the parsed copy while the file is unchanged.
+
+        Args:
+            path (str): The path to the shortcuts.vdf file.
+
+        Returns:
+            ShortcutsFile: The parsed shortcuts, or an empty ShortcutsFile if the file does not exist.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            SteamIntegration._shortcuts_cache.pop(path, None)
+            return ShortcutsFile()
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = SteamIntegration._shortcuts_cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        shortcuts = ShortcutsFile.parse(SteamIntegration.read_shortcuts_file(path))
+        SteamIntegration._shortcuts_cache[path] = (signature, shortcuts)
+        return shortcuts
+
+    @staticmethod
+    def save_shortcuts(path, shortcuts):
+        """
+        Serialize and write a ShortcutsFile, keeping the parsed copy cached.
+
+        Args:
+            path (str): The path to the shortcuts.vdf file.
+            shortcuts (ShortcutsFile): The shortcuts to write.
+        """
+        try:
+            SteamIntegration.write_shortcuts_file(path, shortcuts.to_bytes())
+            stat = os.stat(path)
+        except Exception:
+            SteamIntegration._shortcuts_cache.pop(path, None)
+            raise
+        SteamIntegration._shortcuts_cache[path] = (
+            (stat.st_mtime_ns, stat.st_size),
+            shortcuts,
+        )
+
     @staticmethod
     def find_last_entry_index(shortcuts_data):
         """
         Find the index of the last entry in the shortcuts data.
 
         Args:
-            shortcuts_data (bytes): The data from the shortcuts.vdf file.
+            shortcuts_data (bytes or ShortcutsFile): The data from the shortcuts.vdf file.
 
         Returns:
-            int: The index of the last entry in the shortcuts data.
+            int: The index of the last entry in the shortcuts data, or -1 if there are none.
         """
-        last_index = 0
-        while True:
-            index = shortcuts_data.find(NUL + str(last_index).encode('utf-8') + NUL)
-            if index == -1:
-                break
-            last_index += 1
-        logging.info(f"Last entry index in shortcuts data: {last_index - 1}")
-        return last_index - 1
+        if isinstance(shortcuts_data, ShortcutsFile):
+            last_index = shortcuts_data.next_index - 1
+        else:
+            last_index = EntryIndex.scan(shortcuts_data).next_index - 1
+        logging.info(f"Last entry index in shortcuts data: {last_index}")
+        return last_index
 
     @staticmethod
     def add_non_steam_game_entry(
@@ -212,106 +415,137 @@ class SteamIntegration:
         Returns:
             bytes: The updated shortcuts data with the new non-Steam game entry.
         """
-        if b'shortcuts' not in shortcuts_data:
-            shortcuts_data = NUL + b'shortcuts' + NUL
+        index = EntryIndex.scan(shortcuts_data)
+        new_entry_index = index.next_index
+        updated_shortcuts_data = index.append(
+            shortcuts_data,
+            [ShortcutsFile.new_entry(app_name, exe, start_dir, icon, shortcut_path)],
+        )
+        logging.info(
+            f"Added new non-Steam game entry for '{app_name}' with index {new_entry_index}."
+        )
+        return updated_shortcuts_data
 
-        last_entry_index = SteamIntegration.find_last_entry_index(shortcuts_data)
-        new_entry_index = last_entry_index + 1
+    @staticmethod
+    def file_lock(path):
+        """
+        Return the lock that guards a shortcuts.vdf file.
 
-        shortcuts_data = shortcuts_data.rstrip(BS)
+        Args:
+            path (str): The path to the shortcuts.vdf file.
 
-        if new_entry_index == 0:
-            entry_start = NUL + b'0' + NUL
-        else:
-            entry_start = NUL + str(new_entry_index).encode('utf-8') + NUL
-            shortcuts_data = shortcuts_data + BS + BS
-
-        app_struct = (
-            entry_start
-            + STX
-            + b'appid'
-            + NUL
-            + (NUL * 4)
-            + SOH
-            + b'AppName'
-            + NUL
-            + app_name.encode('utf-8')
-            + NUL
-            + SOH
-            + b'Exe'
-            + NUL
-            + f'"{exe}"'.encode('utf-8')
-            + NUL
-            + SOH
-            + b'StartDir'
-            + NUL
-            + os.path.join(start_dir, '').encode('utf-8')
-            + NUL
-            + SOH
-            + b'icon'
-            + NUL
-            + f'"{icon}"'.encode('utf-8')
-            + NUL
-            + SOH
-            + b'ShortcutPath'
-            + NUL
-            + shortcut_path.encode('utf-8')
-            + NUL
-            + SOH
-            + b'LaunchOptions'
-            + NUL
-            + NUL
-            + STX
-            + b'IsHidden'
-            + NUL
-            + (NUL * 4)
-            + STX
-            + b'AllowDesktopConfig'
-            + NUL
-            + SOH
-            + (NUL * 3)
-            + STX
-            + b'AllowOverlay'
-            + NUL
-            + SOH
-            + (NUL * 3)
-            + STX
-            + b'OpenVR'
-            + NUL
-            + (NUL * 4)
-            + STX
-            + b'Devkit'
-            + NUL
-            + (NUL * 4)
-            + SOH
-            + b'DevkitGameID'
-            + NUL
-            + NUL
-            + STX
-            + b'DevkitOverrideAppID'
-            + NUL
-            + (NUL * 4)
-            + STX
-            + b'LastPlayTime'
-            + NUL
-            + (NUL * 4)
-            + SOH
-            + b'FlatpakAppID'
-            + NUL
-            + NUL
-            + NUL
-            + b'tags'
-            + NUL
-            + BS
-            + BS
-            + BS
-            + BS
-        )
+        Returns:
+            threading.Lock: The lock for the file.
+        """
+        key = os.path.normcase(os.path.abspath(path))
+        with SteamIntegration._file_locks_guard:
+            return SteamIntegration._file_locks.setdefault(key, threading.Lock())
 
-        logging.info(
-            f"Added new non-Steam game entry for '{app_name}' with index {new_entry_index}."
+    @staticmethod
+    def process_user_entries(steam_path, user_id, entries):
+        """
+        Add several non-Steam game entries for a specific user ID with one read and one write.
+
+        Args:
+            steam_path (str): The path to the Steam installation directory.
+            user_id (str): The Steam user ID.
+            entries (iterable): The games to add, as dictionaries with the keys `app_name`, `exe`,
+                `start_dir` and optionally `icon` and `shortcut_path`.
+
+        Returns:
+            dict: The names of the games that were `added` and `skipped` as duplicates, the games that
+                `failed` as dictionaries with the keys `index`, `app_name` and `reason`, and `statuses`,
+                the status (`added`, `skipped` or `failed`) of each entry in the order of `entries`.
+        """
+        shortcuts_file = os.path.join(
+            steam_path, 'userdata', user_id, 'config', 'shortcuts.vdf'
         )
-        return shortcuts_data + app_struct
+        entries = list(entries)
+        result = {'added': [], 'skipped': [], 'failed': [], 'statuses': [None] * len(entries)}
+
+        with SteamIntegration.file_lock(shortcuts_file):
+            try:
+                if not os.path.exists(shortcuts_file):
+                    logging.info(
+                        f"Shortcuts file for user {user_id} not found, creating a new one."
+                    )
+                shortcuts = SteamIntegration.load_shortcuts(shortcuts_file)
+            except Exception as e:
+                logging.error(
+                    f"Error reading shortcuts file for user {user_id}: {e}"
+                )
+                result['failed'] = [
+                    {'index': i, 'app_name': entry.get('app_name'), 'reason': str(e)}
+                    for i, entry in enumerate(entries)
+                ]
+                result['statuses'] = ['failed'] * len(entries)
+                return result
+
+            added = []
+            try:
+                for i, entry in enumerate(entries):
+                    app_name = entry.get('app_name')
+                    try:
+                        exe = entry['exe']
+                        start_dir = entry['start_dir']
+                        if not app_name:
+                            raise ValueError("Missing game name")
+
+                        if SteamIntegration.game_exists(
+                            shortcuts, app_name, exe, start_dir
+                        ):
+                            logging.info(
+                                f"The game '{app_name}' already exists for user {user_id}."
+                            )
+                            result['skipped'].append(app_name)
+                            result['statuses'][i] = 'skipped'
+                            continue
+
+                        new_entry = ShortcutsFile.new_entry(
+                            app_name,
+                            exe,
+                            start_dir,
+                            entry.get('icon', ''),
+                            entry.get('shortcut_path', ''),
+                        )
+                        dumps(new_entry)
+                    except Exception as e:
+                        reason = f"Invalid entry: {e}"
+                        logging.error(f"Cannot add '{app_name}' for user {user_id}: {reason}")
+                        result['failed'].append({'index': i, 'app_name': app_name, 'reason': reason})
+                        result['statuses'][i] = 'failed'
+                        continue
+
+                    new_entry_index = shortcuts.append(new_entry)
+                    logging.info(
+                        f"Added new non-Steam game entry for '{app_name}' with index {new_entry_index}."
+                    )
+                    result['added'].append(app_name)
+                    result['statuses'][i] = 'added'
+                    added.append(i)
+
+                if added:
+                    try:
+                        SteamIntegration.save_shortcuts(shortcuts_file, shortcuts)
+                    except Exception as e:
+                        logging.error(
+                            f"Error writing shortcuts file for user {user_id}: {e}"
+                        )
+                        for i in added:
+                            result['failed'].append(
+                                {'index': i, 'app_name': entries[i].get('app_name'), 'reason': str(e)}
+                            )
+                            result['statuses'][i] = 'failed'
+                        result['added'] = []
+                        return result
+                    logging.info(
+                        f"{len(result['added'])} non-Steam game(s) added for user {user_id} successfully."
+                    )
+            except BaseException:
+                # The cached copy holds the unsaved entries; drop it so the next load rereads the file
+                SteamIntegration._shortcuts_cache.pop(shortcuts_file, None)
+                raise
+        return result
 
     @staticmethod
     def process_user_id(
@@ -329,47 +563,158 @@ class SteamIntegration:
             icon (str, optional): The icon path of the non-Steam game. Defaults to ''.
             shortcut_path (str, optional): The shortcut path. Defaults to ''.
         """
-        shortcuts_file = os.path.join(
-            steam_path, 'userdata', user_id, 'config', 'shortcuts.vdf'
+        SteamIntegration.process_user_entries(
+            steam_path,
+            user_id,
+            [
+                {
+                    'app_name': app_name,
+                    'exe': exe,
+                    'start_dir': start_dir,
+                    'icon': icon,
+                    'shortcut_path': shortcut_path,
+                }
+            ],
         )
 
-        if not os.path.exists(shortcuts_file):
-            logging.info(
-                f"Shortcuts file for user {user_id} not found, creating a new one."
-            )
-            with open(shortcuts_file, 'wb') as f:
-                f.write(NUL + b'shortcuts' + NUL)
+    @staticmethod
+    def add_non_steam_game(app_name, exe, start_dir, icon='', max_workers=None):
+        """
+        Add a non-Steam game to all user profiles in the Steam installation.
 
-        shortcuts_data = SteamIntegration.read_shortcuts_file(shortcuts_file)
+        Args:
+            app_name (str): The name of the non-Steam game.
+            exe (str): The executable path of the non-Steam game.
+            start_dir (str): The start directory of the non-Steam game.
+            icon (str, optional): The icon path of the non-Steam game. Defaults to ''.
+            max_workers (int, optional): The number of profiles processed concurrently.
+                Defaults to MAX_WORKERS.
 
-        if SteamIntegration.game_exists(shortcuts_data, app_name):
-            logging.info(f"The game '{app_name}' already exists for user {user_id}.")
-            return
+        Returns:
+            dict: The result of `process_user_entries` for each user ID.
 
-        updated_shortcuts_data = SteamIntegration.add_non_steam_game_entry(
-            shortcuts_data,
-            app_name=app_name,
-            exe=exe,
-            start_dir=start_dir,
-            icon=icon,
-            shortcut_path=shortcut_path,
+        Raises:
+            FileNotFoundError: If the Steam installation is not found.
+        """
+        return SteamIntegration.add_non_steam_games(
+            [{'app_name': app_name, 'exe': exe, 'start_dir': start_dir, 'icon': icon}],
+            max_workers=max_workers,
         )
 
-        SteamIntegration.write_shortcuts_file(shortcuts_file, updated_shortcuts_data)
-        logging.info(
-            f"Non-Steam game '{app_name}' added for user {user_id} successfully."
-        )
+    @staticmethod
+    def add_non_steam_games(entries, user_ids=None, max_workers=None):
+        """
+        Add several non-Steam games to user profiles, reading and writing each shortcuts.vdf once.
+
+        Profiles are processed concurrently on a bounded thread pool. An error in one profile is recorded
+        in that profile's `failed` list and does not affect the others.
+
+        Args:
+            entries (iterable): The games to add, as dictionaries with the keys `app_name`, `exe`,
+                `start_dir` and optionally `icon` and `shortcut_path`.
+            user_ids (list, optional): The Steam user IDs to add the games to. Defaults to all
+                user profiles in the Steam installation.
+            max_workers (int, optional): The number of profiles processed concurrently.
+                Defaults to MAX_WORKERS.
+
+        Returns:
+            dict: The result of `process_user_entries` for each user ID.
+
+        Raises:
+            FileNotFoundError: If the Steam installation is not found.
+        """
+        steam_path = SteamIntegration.locate_steam_installation()
+        if not steam_path:
+            raise FileNotFoundError("Steam installation not found")
+
+        if user_ids is None:
+            user_ids = SteamIntegration.find_steam_user_ids(steam_path)
+
+        entries = list(entries)
+        max_workers = max_workers or SteamIntegration.MAX_WORKERS
+        workers = max(1, min(max_workers, len(user_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                user_id: executor.submit(
+                    SteamIntegration.process_user_entries, steam_path, user_id, entries
+                )
+                for user_id in user_ids
+            }
+
+        results = {}
+        for user_id, future in futures.items():
+            try:
+                results[user_id] = future.result()
+            except Exception as e:
+                # One broken profile must not discard the results of the others
+                logging.error(f"Error adding games for user {user_id}: {e}")
+                results[user_id] = {
+                    'added': [],
+                    'skipped': [],
+                    'failed': [
+                        {'index': i, 'app_name': entry.get('app_name'), 'reason': str(e)}
+                        for i, entry in enumerate(entries)
+                    ],
+                    'statuses': ['failed'] * len(entries),
+                }
+        return results
 
     @staticmethod
-    def add_non_steam_game(app_name, exe, start_dir, icon=''):
+    def find_existing_games(entries, user_ids=None):
         """
-        Add a non-Steam game to all user profiles in the Steam installation.
+        Check which games already have an entry in each user profile, without changing anything.
+
+        Uses the duplicate rule of `process_user_entries`, so a game reported as existing is skipped when
+        it is added. A profile whose shortcuts.vdf cannot be read is reported as holding none of the games.
 
         Args:
-            app_name (str): The name of the non-Steam game.
-            exe (str): The executable path of the non-Steam game.
-            start_dir (str): The start directory of the non-Steam game.
-            icon (str, optional): The icon path of the non-Steam game. Defaults to ''.
+            entries (iterable): The games, as dictionaries with the keys `app_name`, `exe` and `start_dir`.
+            user_ids (list, optional): The Steam user IDs to check. Defaults to all user profiles in the
+                Steam installation.
+
+        Returns:
+            dict: For each user ID, a list with True for each entry that already exists, in the order of
+                `entries`.
+
+        Raises:
+            FileNotFoundError: If the Steam installation is not found.
+        """
+        steam_path = SteamIntegration.locate_steam_installation()
+        if not steam_path:
+            raise FileNotFoundError("Steam installation not found")
+
+        if user_ids is None:
+            user_ids = SteamIntegration.find_steam_user_ids(steam_path)
+
+        entries = list(entries)
+        existing = {}
+        for user_id in user_ids:
+            shortcuts_file = os.path.join(
+                steam_path, 'userdata', user_id, 'config', 'shortcuts.vdf'
+            )
+            try:
+                with SteamIntegration.file_lock(shortcuts_file):
+                    shortcuts = SteamIntegration.load_shortcuts(shortcuts_file)
+            except Exception as e:
+                logging.warning(f"Cannot read shortcuts file for user {user_id}: {e}")
+                shortcuts = ShortcutsFile()
+            existing[user_id] = [
+                shortcuts.contains(entry.get('app_name'), entry.get('exe'), entry.get('start_dir', ''))
+                for entry in entries
+            ]
+        return existing
+
+    @staticmethod
+    def list_non_steam_games(user_ids=None):
+        """
+        List the non-Steam game entries of user profiles.
+
+        Args:
+            user_ids (list, optional): The Steam user IDs to list. Defaults to all user profiles in the
+                Steam installation.
+
+        Returns:
+            dict: The shortcut entries, as dictionaries, for each user ID.
 
         Raises:
             FileNotFoundError: If the Steam installation is not found.
@@ -378,15 +723,107 @@ class SteamIntegration:
         if not steam_path:
             raise FileNotFoundError("Steam installation not found")
 
-        user_ids = SteamIntegration.find_steam_user_ids(steam_path)
+        if user_ids is None:
+            user_ids = SteamIntegration.find_steam_user_ids(steam_path)
 
+        games = {}
         for user_id in user_ids:
-            SteamIntegration.process_user_id(
-                steam_path, user_id, app_name, exe, start_dir, icon
+            shortcuts_file = os.path.join(
+                steam_path, 'userdata', user_id, 'config', 'shortcuts.vdf'
             )
+            with SteamIntegration.file_lock(shortcuts_file):
+                games[user_id] = list(SteamIntegration.load_shortcuts(shortcuts_file))
+        return games
 
+    @staticmethod
+    def remove_user_entries(steam_path, user_id, app_name=None, exe=None, dry_run=False):
+        """
+        Remove the non-Steam game entries matching a name or executable for a specific user ID.
+
+        Args:
+            steam_path (str): The path to the Steam installation directory.
+            user_id (str): The Steam user ID.
+            app_name (str, optional): The name of the game, ignoring case and whitespace. Defaults to None.
+            exe (str, optional): The executable path of the game. Defaults to None.
+            dry_run (bool, optional): Only report the matching entries, without writing. Defaults to False.
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
-)
+        Returns:
+            list: The names of the removed entries.
+
+        Raises:
+            OSError: If the shortcuts file cannot be read or written.
+            ValueError: If the shortcuts file is invalid.
+        """
+        shortcuts_file = os.path.join(
+            steam_path, 'userdata', user_id, 'config', 'shortcuts.vdf'
+        )
+        name = normalize_name(app_name) if app_name else None
+        target = normalize_path(exe) if exe else None
+
+        def matches(entry):
+            entry_name = entry.get('AppName', entry.get('appname'))
+            entry_exe = entry.get('Exe', entry.get('exe'))
+            return (
+                name is not None
+                and isinstance(entry_name, str)
+                and normalize_name(entry_name) == name
+            ) or (
+                target is not None
+                and isinstance(entry_exe, str)
+                and normalize_path(entry_exe) == target
+            )
+
+        with SteamIntegration.file_lock(shortcuts_file):
+            if not os.path.exists(shortcuts_file):
+                return []
+            shortcuts = SteamIntegration.load_shortcuts(shortcuts_file)
+            kept = [entry for entry in shortcuts if not matches(entry)]
+            removed = [
+                entry.get('AppName', entry.get('appname'))
+                for entry in shortcuts
+                if matches(entry)
+            ]
+            if removed and not dry_run:
+                shortcuts.entries[:] = kept
+                shortcuts.mark_dirty()
+                SteamIntegration.save_shortcuts(shortcuts_file, shortcuts)
+                logging.info(
+                    f"Removed {len(removed)} non-Steam game(s) for user {user_id}: {removed}"
+                )
+        return removed
+
+    @staticmethod
+    def remove_non_steam_games(app_name=None, exe=None, user_ids=None, dry_run=False):
+        """
+        Remove the non-Steam game entries matching a name or executable from user profiles.
+
+        Args:
+            app_name (str, optional): The name of the game, ignoring case and whitespace. Defaults to None.
+            exe (str, optional): The executable path of the game. Defaults to None.
+            user_ids (list, optional): The Steam user IDs to remove the games from. Defaults to all
+                user profiles in the Steam installation.
+            dry_run (bool, optional): Only report the matching entries, without writing. Defaults to False.
+
+        Returns:
+            dict: The names of the removed entries for each user ID.
+
+        Raises:
+            FileNotFoundError: If the Steam installation is not found.
+            ValueError: If neither a name nor an executable is given.
+        """
+        if not app_name and not exe:
+            raise ValueError("A game name or executable is required")
+
+        steam_path = SteamIntegration.locate_steam_installation()
+        if not steam_path:
+            raise FileNotFoundError("Steam installation not found")
+
+        if user_ids is None:
+            user_ids = SteamIntegration.find_steam_user_ids(steam_path)
+
+        return {
+            user_id: SteamIntegration.remove_user_entries(
+                steam_path, user_id, app_name, exe, dry_run
+            )
+            for user_id in user_ids
+        }
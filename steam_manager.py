@@ -127,9 +127,3 @@ class SteamManager:
                 return True
         logging.error("Steam executable not found in any of the specified paths.")
         return False
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
-)
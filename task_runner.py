@@ -0,0 +1,305 @@
+"""
+task_runner.py
+==============
+
+This module provides a background task runner for Tk applications, so blocking work never runs in a Tk callback.
+
+Classes
+-------
+TaskCancelled
+    Raised inside a task that was cancelled.
+
+Task
+    A handle to a background task, used by the task to report progress and check for cancellation.
+
+TaskRunner
+    Runs functions on worker threads and delivers their progress and results on the Tk main thread.
+
+Functions
+---------
+None
+
+Attributes
+----------
+None
+
+Methods
+-------
+Task.report(message, fraction=None)
+    Report progress to the main thread.
+
+Task.check()
+    Raise TaskCancelled if the task was cancelled.
+
+Task.commit()
+    Pass the last cancellation point of the task.
+
+Task.cancel()
+    Ask the task to stop.
+
+TaskRunner.submit(function, *args, on_done=None, on_error=None, on_progress=None)
+    Run `function(task, *args)` on a worker thread.
+
+TaskRunner.cancel_all()
+    Cancel every running and queued task.
+
+TaskRunner.shutdown()
+    Cancel all tasks and stop the worker threads.
+
+Notes
+-----
+- Workers never touch Tk. They put events on a queue that the main thread drains every POLL_INTERVAL
+  milliseconds with `root.after`; callbacks run on the main thread and may update widgets freely.
+- Polling only runs while tasks are active, so an idle window costs nothing.
+- Cancellation is cooperative: a task calls `Task.check()` between steps. The result of a cancelled task is
+  discarded, even if the task finished its current step.
+- A task whose remaining steps must not be interrupted (e.g. writing files that belong together) calls
+  `Task.commit()` instead of its last `Task.check()`. From then on `Task.cancel()` is ignored, so the
+  task's result or error is always delivered.
+- `on_busy` is called with True when the first task starts and with False when the last one ends, which is
+  where callers disable and re-enable their controls.
+
+Example
+-------
+To load something in the background and show it when done:
+
+from task_runner import TaskRunner
+
+runner = TaskRunner(root)
+
+def load(task, path):
+    task.report(f"Reading {path}...")
+    with open(path) as file:
+        return file.read()
+
+runner.submit(load, "notes.txt", on_done=lambda text: print(len(text)))
+"""
+
+import queue
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskCancelled(Exception):
+    """
+    Raised inside a task that was cancelled.
+    """
+
+
+class Task:
+    """
+    A handle to a background task, used by the task to report progress and check for cancellation.
+    """
+
+    def __init__(self, runner, on_done=None, on_error=None, on_progress=None):
+        """
+        Initialize the Task.
+
+        Args:
+            runner (TaskRunner): The runner that owns the task.
+            on_done (callable, optional): Called with the result on the main thread. Defaults to None.
+            on_error (callable, optional): Called with the exception on the main thread. Defaults to None.
+            on_progress (callable, optional): Called with the message and fraction on the main thread.
+                Defaults to None.
+        """
+        self.runner = runner
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self._cancelled = threading.Event()
+        self._committed = False
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        """
+        bool: Whether the task was cancelled.
+        """
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """
+        Ask the task to stop. Ignored once the task has called `commit`.
+        """
+        with self._lock:
+            if not self._committed:
+                self._cancelled.set()
+
+    def check(self):
+        """
+        Raise TaskCancelled if the task was cancelled.
+
+        Raises:
+            TaskCancelled: If the task was cancelled.
+        """
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+
+    def commit(self):
+        """
+        Pass the last cancellation point of the task: raise TaskCancelled if the task was cancelled, and
+        otherwise ignore any later cancellation, so the task runs to completion and its outcome is delivered.
+
+        Raises:
+            TaskCancelled: If the task was cancelled.
+        """
+        with self._lock:
+            self.check()
+            self._committed = True
+
+    def report(self, message, fraction=None):
+        """
+        Report progress to the main thread.
+
+        Args:
+            message (str): The status message.
+            fraction (float, optional): The completed fraction between 0 and 1, or None if unknown.
+                Defaults to None.
+        """
+        self.runner._events.put((self, 'progress', (message, fraction)))
+
+
+class TaskRunner:
+    """
+    Runs functions on worker threads and delivers their progress and results on the Tk main thread.
+    """
+
+    MAX_WORKERS = 2
+    POLL_INTERVAL = 16
+
+    def __init__(self, root, max_workers=None, on_busy=None):
+        """
+        Initialize the TaskRunner.
+
+        Args:
+            root (tk.Misc): A widget of the application, used to schedule polling.
+            max_workers (int, optional): The number of worker threads. Defaults to MAX_WORKERS.
+            on_busy (callable, optional): Called with True when tasks start running and with False when
+                all have finished. Defaults to None.
+        """
+        self.root = root
+        self.on_busy = on_busy
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.MAX_WORKERS, thread_name_prefix='task'
+        )
+        self._events = queue.Queue()
+        self._tasks = set()
+        self._poll_id = None
+
+    @property
+    def busy(self):
+        """
+        bool: Whether any task is running or queued.
+        """
+        return bool(self._tasks)
+
+    def submit(self, function, *args, on_done=None, on_error=None, on_progress=None):
+        """
+        Run `function(task, *args)` on a worker thread.
+
+        Must be called from the main thread.
+
+        Args:
+            function (callable): The function to run; it receives the Task as its first argument.
+            *args: The other arguments of the function.
+            on_done (callable, optional): Called with the result on the main thread. Defaults to None.
+            on_error (callable, optional): Called with the exception on the main thread. Defaults to None,
+                which logs the error.
+            on_progress (callable, optional): Called with the message and fraction on the main thread.
+                Defaults to None.
+
+        Returns:
+            Task: The handle of the task.
+        """
+        task = Task(self, on_done, on_error, on_progress)
+        self._tasks.add(task)
+        if len(self._tasks) == 1 and self.on_busy:
+            self.on_busy(True)
+        self._executor.submit(self._run, task, function, args)
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.POLL_INTERVAL, self._poll)
+        return task
+
+    def _run(self, task, function, args):
+        """
+        Run a task on a worker thread and queue its outcome.
+
+        Args:
+            task (Task): The task.
+            function (callable): The function to run.
+            args (tuple): The other arguments of the function.
+        """
+        try:
+            task.check()
+            result = function(task, *args)
+        except TaskCancelled:
+            self._events.put((task, 'cancelled', None))
+        except Exception as e:
+            self._events.put((task, 'error', e))
+        else:
+            self._events.put((task, 'done', result))
+
+    def _poll(self):
+        """
+        Deliver queued events on the main thread and reschedule while tasks are active.
+        """
+        self._poll_id = None
+        while True:
+            try:
+                task, kind, value = self._events.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._dispatch(task, kind, value)
+            except Exception as e:
+                logging.exception(f"Error in task callback: {e}")
+
+        if self._tasks and self._poll_id is None:
+            self._poll_id = self.root.after(self.POLL_INTERVAL, self._poll)
+
+    def _dispatch(self, task, kind, value):
+        """
+        Call the callback of a task event.
+
+        Args:
+            task (Task): The task.
+            kind (str): The kind of event: `progress`, `done`, `error` or `cancelled`.
+            value: The payload of the event.
+        """
+        if kind == 'progress':
+            if task.on_progress and not task.cancelled:
+                task.on_progress(*value)
+            return
+
+        try:
+            if task.cancelled or kind == 'cancelled':
+                logging.info("Background task cancelled.")
+            elif kind == 'error':
+                if task.on_error:
+                    task.on_error(value)
+                else:
+                    logging.error(f"Background task failed: {value}")
+            elif task.on_done:
+                task.on_done(value)
+        finally:
+            self._tasks.discard(task)
+            if not self._tasks and self.on_busy:
+                self.on_busy(False)
+
+    def cancel_all(self):
+        """
+        Cancel every running and queued task.
+        """
+        for task in list(self._tasks):
+            task.cancel()
+
+    def shutdown(self):
+        """
+        Cancel all tasks and stop the worker threads.
+        """
+        self.cancel_all()
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,25 @@
+import os
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def steam_home(tmp_path, monkeypatch):
+    """
+    Point HOME at a temporary directory holding a Steam installation with one user profile.
+
+    Subprocesses inherit the environment, so they find this installation instead of the real one.
+
+    Returns:
+        pathlib.Path: The user's config directory, where shortcuts.vdf is written.
+    """
+    config_dir = tmp_path / 'home' / '.local' / 'share' / 'Steam' / 'userdata' / '12345' / 'config'
+    config_dir.mkdir(parents=True)
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    monkeypatch.setenv('NSGA_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.delenv('STEAM_API_KEY', raising=False)
+    return config_dir
@@ -0,0 +1,164 @@
+import json
+import pytest
+import cli
+from game_manager import GameManager
+from scan_cache import ScanCache
+from steam_integration import SteamIntegration
+from steam_manager import SteamManager
+
+
+@pytest.fixture
+def steam(steam_home, tmp_path, monkeypatch):
+    """
+    Run the commands against the temporary Steam installation of `steam_home`, with Steam not running.
+
+    Returns:
+        pathlib.Path: The path to the user's shortcuts.vdf.
+    """
+    monkeypatch.setattr(
+        SteamIntegration, 'STEAM_PATH_OPTIONS', [str(steam_home.parents[2])]
+    )
+    monkeypatch.setattr(SteamManager, 'is_steam_running', staticmethod(lambda: False))
+    monkeypatch.setattr(
+        GameManager, '_scan_cache', ScanCache(str(tmp_path / 'cache' / 'scan_cache.json'))
+    )
+    return steam_home / 'shortcuts.vdf'
+
+
+@pytest.fixture
+def game(tmp_path):
+    """
+    Create a game folder with an executable and an .ini file holding an account ID.
+
+    Returns:
+        pathlib.Path: The path to the executable.
+    """
+    directory = tmp_path / 'games' / 'Test Game'
+    directory.mkdir(parents=True)
+    (directory / 'game.ini').write_text('[Settings]\nAccountId=1\n')
+    exe = directory / 'game.exe'
+    exe.write_bytes(b'MZ')
+    return exe
+
+
+def run(capsys, *argv):
+    status = cli.main([str(arg) for arg in argv])
+    return status, [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_add_and_list(steam, game, capsys):
+    status, records = run(capsys, 'add', 'Test Game', game, '--app-id', 10)
+    assert status == cli.EXIT_OK
+    assert [record['status'] for record in records] == ['added']
+    assert steam.exists()
+
+    status, records = run(capsys, 'list')
+    assert status == cli.EXIT_OK
+    assert [(record['user_id'], record['name'], record['exe']) for record in records] == [
+        ('12345', 'Test Game', str(game))
+    ]
+
+
+def test_existing_game_is_skipped_without_patching(steam, game, capsys):
+    run(capsys, 'add', 'Test Game', game, '--app-id', 10)
+
+    status, records = run(
+        capsys, 'add', 'Test Game', game, '--app-id', 10, '--steam-id', '76561198000000000'
+    )
+    assert status == cli.EXIT_OK
+    assert [record['status'] for record in records] == ['skipped']
+    assert (game.parent / 'game.ini').read_text() == '[Settings]\nAccountId=1\n'
+    assert not (game.parent / 'steam_appid.txt').exists()
+
+
+def test_dry_run_predicts_outcome(steam, game, tmp_path, capsys):
+    run(capsys, 'add', 'Test Game', game, '--app-id', 10)
+    before = steam.read_bytes()
+    manifest = tmp_path / 'games.json'
+    manifest.write_text(
+        json.dumps(
+            [
+                {'name': 'Test Game', 'exe': str(game), 'app_id': 10},
+                {'name': 'Other Game', 'exe': str(tmp_path / 'other.exe'), 'app_id': 20},
+            ]
+        )
+    )
+
+    status, records = run(capsys, 'import-manifest', manifest, '--dry-run')
+    assert status == cli.EXIT_OK
+    assert {record['name']: record['status'] for record in records} == {
+        'Test Game': 'would_skip',
+        'Other Game': 'would_add',
+    }
+    assert steam.read_bytes() == before
+
+
+def test_games_with_the_same_name_keep_their_own_results(steam, tmp_path, capsys):
+    manifest = tmp_path / 'games.json'
+    manifest.write_text(
+        json.dumps(
+            [
+                {'name': 'Same Name', 'exe': str(tmp_path / 'a' / 'game.exe'), 'app_id': 10},
+                {'name': 'Same Name', 'exe': str(tmp_path / 'b' / 'game.exe'), 'app_id': 20},
+            ]
+        )
+    )
+
+    status, records = run(capsys, 'import-manifest', manifest)
+    assert status == cli.EXIT_OK
+    assert [(record['exe'], record['status']) for record in records] == [
+        (str(tmp_path / 'a' / 'game.exe'), 'added'),
+        (str(tmp_path / 'b' / 'game.exe'), 'skipped'),
+    ]
+
+
+def test_remove(steam, game, capsys):
+    run(capsys, 'add', 'Test Game', game, '--app-id', 10)
+
+    status, records = run(capsys, 'remove', '--name', 'test game')
+    assert status == cli.EXIT_OK
+    assert records == [{'user_id': '12345', 'removed': ['Test Game'], 'dry_run': False}]
+
+    status, records = run(capsys, 'list')
+    assert status == cli.EXIT_OK
+    assert records == []
+
+
+def test_remove_without_match_exits_not_found(steam, game, capsys):
+    run(capsys, 'add', 'Test Game', game, '--app-id', 10)
+
+    status, _ = run(capsys, 'remove', '--name', 'Missing Game')
+    assert status == cli.EXIT_NOT_FOUND
+
+
+def test_unresolved_app_id_exits_not_found(steam, game, monkeypatch, capsys):
+    import async_steam_api
+
+    monkeypatch.setattr(
+        async_steam_api,
+        'resolve_games',
+        lambda names, *args, **kwargs: {name: {'appid': None, 'details': None} for name in names},
+    )
+
+    status, records = run(capsys, 'add', 'Unknown Game', game)
+    assert status == cli.EXIT_NOT_FOUND
+    assert records[0]['status'] == 'not_found'
+    assert records[0]['reason']
+    assert not steam.exists()
+
+
+def test_steam_running_exits(steam, game, monkeypatch, capsys):
+    monkeypatch.setattr(SteamManager, 'is_steam_running', staticmethod(lambda: True))
+
+    status, records = run(capsys, 'add', 'Test Game', game, '--app-id', 10)
+    assert status == cli.EXIT_STEAM_RUNNING
+    assert 'error' in records[0]
+    assert not steam.exists()
+
+
+def test_steam_not_found_exits(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(SteamIntegration, 'STEAM_PATH_OPTIONS', [str(tmp_path / 'missing')])
+
+    status, records = run(capsys, 'list')
+    assert status == cli.EXIT_STEAM_NOT_FOUND
+    assert 'error' in records[0]
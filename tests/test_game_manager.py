@@ -0,0 +1,34 @@
+from game_manager import GameManager
+
+STEAM_ID = '76561198000000000'
+
+
+def test_update_ini_file_replaces_keys_in_every_section(tmp_path):
+    ini = tmp_path / 'game.ini'
+    ini.write_bytes(
+        b'[Settings]\r\nAccountId=1\r\n; AccountId=2\r\nMyPlayerID=3\r\n[Player]\r\n  PlayerID = 4\r\n'
+    )
+
+    changes = GameManager.update_ini_file(str(ini), STEAM_ID)
+
+    assert [(change['section'], change['key'], change['old']) for change in changes] == [
+        ('Settings', 'AccountId', '1'),
+        ('Player', 'PlayerID', '4'),
+    ]
+    assert ini.read_bytes() == (
+        b'[Settings]\r\nAccountId=' + STEAM_ID.encode() + b'\r\n; AccountId=2\r\nMyPlayerID=3\r\n'
+        b'[Player]\r\n  PlayerID = ' + STEAM_ID.encode() + b'\r\n'
+    )
+
+
+def test_update_ini_file_dry_run_and_up_to_date_files_are_not_written(tmp_path):
+    ini = tmp_path / 'game.ini'
+    ini.write_text('[Settings]\nAccountId=1\n')
+
+    assert len(GameManager.update_ini_file(str(ini), STEAM_ID, dry_run=True)) == 1
+    assert ini.read_text() == '[Settings]\nAccountId=1\n'
+
+    GameManager.update_ini_file(str(ini), STEAM_ID)
+    mtime = ini.stat().st_mtime_ns
+    assert GameManager.update_ini_file(str(ini), STEAM_ID) == []
+    assert ini.stat().st_mtime_ns == mtime
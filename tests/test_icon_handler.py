@@ -0,0 +1,73 @@
+import os
+import time
+import pytest
+
+icon_handler = pytest.importorskip('icon_handler')
+
+
+@pytest.fixture
+def icon_dirs(tmp_path, monkeypatch):
+    """
+    Point the icon cache and the shortcut icon directory at temporary directories with an empty index.
+    """
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    monkeypatch.setattr(icon_handler, 'ICON_CACHE_DIR', str(cache_dir))
+    monkeypatch.setattr(icon_handler, 'SHORTCUT_ICON_DIR', str(tmp_path / 'data'))
+    monkeypatch.setattr(icon_handler, '_index', {})
+    monkeypatch.setattr(icon_handler, '_index_dirty', False)
+    return cache_dir, tmp_path / 'data'
+
+
+def cache_icon(cache_dir, key, digest, used):
+    (cache_dir / f'{digest}.ico').write_bytes(b'ico')
+    (cache_dir / f'{digest}_32.png').write_bytes(b'png')
+    icon_handler._index[key] = [1, 1, digest, True, used]
+
+
+def test_prune_drops_unused_entries_and_their_icons(icon_dirs):
+    cache_dir, _ = icon_dirs
+    now = int(time.time())
+    cache_icon(cache_dir, 'old', 'a' * 32, now - icon_handler.MAX_AGE - 1)
+    cache_icon(cache_dir, 'new', 'b' * 32, now)
+    # A stale entry whose icon is shared with a recent one
+    cache_icon(cache_dir, 'shared-old', 'c' * 32, now - icon_handler.MAX_AGE - 1)
+    cache_icon(cache_dir, 'shared-new', 'c' * 32, now)
+
+    with icon_handler._index_lock:
+        icon_handler._save_index()
+
+    assert set(icon_handler._index) == {'new', 'shared-new'}
+    assert sorted(os.listdir(cache_dir)) == sorted(
+        ['b' * 32 + '.ico', 'b' * 32 + '_32.png', 'c' * 32 + '.ico', 'c' * 32 + '_32.png', 'index.json']
+    )
+
+
+def test_prune_keeps_the_most_recently_used_entries(icon_dirs, monkeypatch):
+    cache_dir, _ = icon_dirs
+    monkeypatch.setattr(icon_handler, 'MAX_ENTRIES', 2)
+    now = int(time.time())
+    for i, digest in enumerate('def'):
+        cache_icon(cache_dir, f'game{i}', digest * 32, now - 10 + i)
+
+    with icon_handler._index_lock:
+        icon_handler._save_index()
+
+    assert set(icon_handler._index) == {'game1', 'game2'}
+    assert not (cache_dir / ('d' * 32 + '.ico')).exists()
+
+
+def test_keep_icon_copies_cached_icons_only(icon_dirs, tmp_path):
+    cache_dir, data_dir = icon_dirs
+    cached = cache_dir / ('a' * 32 + '.ico')
+    cached.write_bytes(b'ico')
+    own = tmp_path / 'own.ico'
+
+    kept = icon_handler.keep_icon(str(cached))
+    assert kept == str(data_dir / cached.name)
+    assert open(kept, 'rb').read() == b'ico'
+    cached.unlink()
+    assert os.path.exists(kept)
+
+    assert icon_handler.keep_icon(str(own)) == str(own)
+    assert icon_handler.keep_icon('') == ''
@@ -0,0 +1,70 @@
+import pytest
+from app_list_cache import AppList, NameIndex
+
+APPS = [
+    {'appid': 400, 'name': 'Portal'},
+    {'appid': 620, 'name': 'Portal 2'},
+    {'appid': 220, 'name': 'Half-Life 2'},
+    {'appid': 70, 'name': 'Half-Life'},
+    {'appid': 1, 'name': 'Duplicate'},
+    {'appid': 2, 'name': 'DUPLICATE'},
+    {'appid': 3, 'name': 'duplicate'},
+    {'appid': 500, 'name': 'Ökoland'},
+]
+
+
+@pytest.fixture
+def index():
+    return NameIndex.build(AppList.from_apps(APPS))
+
+
+def baseline_lookup(name):
+    # The dictionary lookup the index replaces
+    return {app['name'].lower(): app['appid'] for app in APPS}.get(name.lower())
+
+
+def test_exact_names_are_found(index):
+    assert index.lookup('Portal') == 400
+    assert index.lookup('Portal 2') == 620
+    assert index.lookup('Half-Life') == 70
+
+
+def test_lookup_ignores_case(index):
+    assert index.lookup('portal 2') == 620
+    assert index.lookup('HALF-LIFE 2') == 220
+    assert index.lookup('öKOLAND') == 500
+
+
+def test_prefixes_and_extensions_do_not_match(index):
+    assert index.lookup('Port') is None
+    assert index.lookup('Portal 3') is None
+    assert index.lookup('Half') is None
+    assert index.lookup('') is None
+    assert index.lookup('zzz') is None
+
+
+def test_last_app_wins_for_shared_names(index):
+    assert index.lookup('Duplicate') == 3
+    assert index.lookup('duplicate') == 3
+
+
+def test_matches_baseline_lookup(index):
+    names = [app['name'] for app in APPS] + ['Port', 'portal', 'DUPLICATE', 'Unknown', 'a', '~']
+    assert {name: index.lookup(name) for name in names} == {name: baseline_lookup(name) for name in names}
+    assert index.lookup_many(names) == {name: baseline_lookup(name) for name in names}
+
+
+def test_round_trips_through_bytes(index):
+    app_list = index.app_list
+    restored = NameIndex.from_bytes(app_list, index.to_bytes())
+    assert list(restored.order) == list(index.order)
+    assert restored.lookup('portal 2') == 620
+
+
+def test_rejects_order_of_another_list(index):
+    with pytest.raises(ValueError):
+        NameIndex.from_bytes(AppList.from_apps(APPS[:3]), index.to_bytes())
+
+
+def test_empty_list():
+    assert NameIndex.build(AppList()).lookup('Portal') is None
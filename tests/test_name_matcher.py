@@ -0,0 +1,88 @@
+import pytest
+from app_list_cache import AppList
+from name_matcher import NameMatcher, normalize_game_name
+
+APPS = [
+    {'appid': 292030, 'name': 'The Witcher® 3: Wild Hunt'},
+    {'appid': 378648, 'name': 'The Witcher 3: Wild Hunt - Blood and Wine'},
+    {'appid': 20920, 'name': 'The Witcher 2: Assassins of Kings Enhanced Edition'},
+    {'appid': 400, 'name': 'Portal'},
+    {'appid': 620, 'name': 'Portal 2'},
+    {'appid': 39140, 'name': 'Final Fantasy VII'},
+    {'appid': 489830, 'name': 'Skyrim Special Edition'},
+    {'appid': 413150, 'name': 'Stardew Valley'},
+    {'appid': 1, 'name': 'Same Game'},
+    {'appid': 2, 'name': 'Same Game'},
+]
+# Enough unrelated apps that common tokens such as "the" and "2" become stop tokens
+FILLER = [{'appid': 100000 + i, 'name': f'Filler App {i}'} for i in range(200)]
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return NameMatcher.build(AppList.from_apps(APPS + FILLER))
+
+
+@pytest.mark.parametrize(
+    'name, normalized',
+    [
+        ('The Witcher® 3: Wild Hunt', 'the witcher 3 wild hunt'),
+        ('FINAL FANTASY VII', 'final fantasy 7'),
+        ('Pokémon', 'pokemon'),
+        ("Assassin's Creed: Director's Cut", 'assassins creed'),
+        ('Fallout 3 Game of the Year Edition', 'fallout 3'),
+        ('Deluxe Edition', 'deluxe edition'),
+    ],
+)
+def test_normalize_game_name(name, normalized):
+    assert normalize_game_name(name) == normalized
+
+
+def test_exact_name_ranks_first_with_full_score(matcher):
+    assert matcher.search('Portal')[0] == {'appid': 400, 'name': 'Portal', 'score': 1.0}
+    assert matcher.search('Portal 2')[0]['appid'] == 620
+
+
+def test_matching_ignores_case_symbols_and_numeral_style(matcher):
+    for name in ('the witcher 3 wild hunt', 'THE WITCHER 3: WILD HUNT', 'The Witcher III: Wild Hunt'):
+        assert matcher.search(name)[0] == {
+            'appid': 292030, 'name': 'The Witcher® 3: Wild Hunt', 'score': 1.0
+        }
+    assert matcher.search('final fantasy 7')[0]['appid'] == 39140
+
+
+def test_prefix_of_a_name_prefers_the_base_game(matcher):
+    matches = matcher.search('The Witcher 3', limit=3)
+    assert [match['appid'] for match in matches[:2]] == [292030, 378648]
+    assert matches[0]['score'] > matches[1]['score']
+
+
+def test_edition_words_do_not_affect_the_match(matcher):
+    assert matcher.search('Skyrim Remastered')[0]['appid'] == 489830
+
+
+def test_typos_are_expanded_to_known_tokens(matcher):
+    assert matcher.search('Stardew Valey')[0]['appid'] == 413150
+
+
+def test_unknown_names_have_no_match(matcher):
+    assert matcher.search('Nonexistent Zebra') == []
+    assert matcher.best_match('Nonexistent Zebra', 0.75) is None
+
+
+def test_ties_prefer_the_later_app(matcher):
+    # The same order as NameIndex.lookup, where the last app with a name wins
+    assert [match['appid'] for match in matcher.search('Same Game', limit=2)] == [2, 1]
+    assert matcher.best_match('Same Game', 0.75)['appid'] == 2
+
+
+def test_limit_and_min_score(matcher):
+    assert len(matcher.search('The Witcher 3', limit=1)) == 1
+    assert all(match['score'] >= 0.7 for match in matcher.search('The Witcher 3', min_score=0.7))
+
+
+def test_best_match_rejects_weak_and_ambiguous_matches(matcher):
+    assert matcher.best_match('Witcher 2', 0.75) is None
+    assert matcher.best_match('The Witcher 3', 0.75)['appid'] == 292030
+    # Both apps score within the margin and have different names
+    assert matcher.best_match('Witcher 3 Wild Hunt', 0.5, margin=0.5) is None
@@ -0,0 +1,148 @@
+import os
+import pathlib
+import pytest
+from shortcuts_vdf import EntryIndex, ShortcutsFile, dumps, loads, normalize_path
+
+NUL, SOH, STX, BS = b'\x00', b'\x01', b'\x02', b'\x08'
+
+
+def _string(key, value):
+    return SOH + key + NUL + value.encode('utf-8') + NUL
+
+
+def _int32(key, value):
+    return STX + key + NUL + value.to_bytes(4, 'little')
+
+
+def baseline_entry(index, app_name, exe, start_dir):
+    # Byte for byte what the original hand-written serializer produced
+    return (
+        NUL + str(index).encode('utf-8') + NUL
+        + _int32(b'appid', 0)
+        + _string(b'AppName', app_name)
+        + _string(b'Exe', f'"{exe}"')
+        + _string(b'StartDir', os.path.join(start_dir, ''))
+        + _string(b'icon', '""')
+        + _string(b'ShortcutPath', '')
+        + _string(b'LaunchOptions', '')
+        + _int32(b'IsHidden', 0)
+        + _int32(b'AllowDesktopConfig', 1)
+        + _int32(b'AllowOverlay', 1)
+        + _int32(b'OpenVR', 0)
+        + _int32(b'Devkit', 0)
+        + _string(b'DevkitGameID', '')
+        + _int32(b'DevkitOverrideAppID', 0)
+        + _int32(b'LastPlayTime', 0)
+        + _string(b'FlatpakAppID', '')
+        + NUL + b'tags' + NUL + BS
+        + BS
+    )
+
+
+def baseline_file(*games):
+    entries = b''.join(baseline_entry(i, *game) for i, game in enumerate(games))
+    return NUL + b'shortcuts' + NUL + entries + BS + BS
+
+
+GAMES = [
+    ('First', 'C:/games/first/first.exe', 'C:/games/first'),
+    ('Second', 'C:/games/second/second.exe', 'C:/games/second'),
+]
+
+
+@pytest.fixture
+def data():
+    return baseline_file(*GAMES)
+
+
+def test_parses_baseline_file(data):
+    shortcuts = ShortcutsFile.parse(data)
+
+    assert [entry['AppName'] for entry in shortcuts] == ['First', 'Second']
+    assert shortcuts[0] == ShortcutsFile.new_entry(*GAMES[0])
+    assert shortcuts.next_index == 2
+
+
+def test_round_trips_baseline_file(data):
+    assert ShortcutsFile.parse(data).to_bytes() == data
+    assert dumps(loads(data)) == data
+
+
+def test_append_matches_full_rewrite(data):
+    new_entry = ShortcutsFile.new_entry('Third', 'C:/games/third/third.exe', 'C:/games/third')
+    appended = ShortcutsFile.parse(data)
+    appended.append(new_entry)
+    rewritten = ShortcutsFile.parse(data)
+    rewritten.append(new_entry)
+    rewritten.mark_dirty()
+
+    full = dumps({'shortcuts': {str(i): entry for i, entry in enumerate(appended.entries)}})
+    assert appended.to_bytes() == full
+    assert rewritten.to_bytes() == full
+    assert appended.to_bytes() == baseline_file(
+        *GAMES, ('Third', 'C:/games/third/third.exe', 'C:/games/third')
+    )
+
+
+def test_append_to_empty_file():
+    shortcuts = ShortcutsFile()
+    shortcuts.append(ShortcutsFile.new_entry(*GAMES[0]))
+    assert shortcuts.to_bytes() == baseline_file(GAMES[0])
+
+
+def test_index_records_entry_offsets(data):
+    index = EntryIndex.scan(data)
+
+    assert index.keys == ['0', '1']
+    start, end = index.span(1)
+    assert data[start:end] == baseline_entry(1, *GAMES[1])
+    assert index.insert_offset == len(data) - 2
+    assert index.span(2) is None
+
+
+def test_index_follows_appends(data):
+    shortcuts = ShortcutsFile.parse(data)
+    shortcuts.append(ShortcutsFile.new_entry('Third', 'C:/games/third/third.exe', 'C:/games/third'))
+    written = shortcuts.to_bytes()
+
+    assert shortcuts.index.span(2) == EntryIndex.scan(written).span(2)
+    assert shortcuts.index.insert_offset == EntryIndex.scan(written).insert_offset
+
+
+def test_rewrite_keeps_other_root_keys():
+    data = dumps({'shortcuts': {'0': ShortcutsFile.new_entry(*GAMES[0])}, 'other': {'key': 'value'}})
+    shortcuts = ShortcutsFile.parse(data)
+    del shortcuts.entries[0]
+    shortcuts.mark_dirty()
+
+    assert loads(shortcuts.to_bytes()) == {'shortcuts': {}, 'other': {'key': 'value'}}
+
+
+def test_unterminated_file_is_completed(data):
+    shortcuts = ShortcutsFile.parse(data[:-2])
+    assert shortcuts.to_bytes() == data
+
+
+def test_malformed_file_is_rejected(data):
+    # Cut inside the name of a key
+    with pytest.raises(ValueError):
+        ShortcutsFile.parse(data[:100])
+
+
+def test_duplicates_are_found_by_name_or_target(data):
+    shortcuts = ShortcutsFile.parse(data)
+
+    assert shortcuts.contains('  first ')
+    assert shortcuts.contains('Renamed', 'C:/games/second/second.exe', 'C:/games/second')
+    assert not shortcuts.contains('Renamed', 'C:/games/second/second.exe', 'C:/elsewhere')
+
+
+def test_normalize_path_accepts_path_objects():
+    path = pathlib.Path('games') / 'Test Game' / 'game.exe'
+    assert normalize_path(path) == normalize_path(f'"{os.fspath(path)}"')
+
+
+def test_contains_accepts_path_objects():
+    shortcuts = ShortcutsFile()
+    shortcuts.append(ShortcutsFile.new_entry('Test Game', 'C:/games/game.exe', 'C:/games'))
+    assert shortcuts.contains(None, pathlib.PurePath('C:/games/game.exe'), pathlib.PurePath('C:/games'))
@@ -0,0 +1,44 @@
+import sys
+import subprocess
+import pytest
+from conftest import ROOT
+from startup_benchmark import STARTUP_BUDGET_MS, check_startup
+
+
+def _assert_within_budget(report):
+    assert not report['deferred_loaded'], f"{report['module']} imported {report['deferred_loaded']}"
+    assert report['total_ms'] <= report['budget_ms'], (
+        f"{report['module']} took {report['total_ms']:.1f} ms (budget {report['budget_ms']:.0f} ms)"
+    )
+
+
+def test_cli_help_within_budget():
+    _assert_within_budget(check_startup('cli', STARTUP_BUDGET_MS, repeat=3, script_args=['--help']))
+
+
+def test_cli_list_within_budget(steam_home):
+    _assert_within_budget(check_startup('cli', STARTUP_BUDGET_MS, repeat=3, script_args=['list']))
+
+
+def test_main_within_budget():
+    pytest.importorskip('ttkbootstrap')
+    _assert_within_budget(check_startup('main', STARTUP_BUDGET_MS, repeat=3))
+
+
+def test_cli_list_does_not_load_config(steam_home):
+    process = subprocess.run(
+        [sys.executable, 'cli.py', 'list'], cwd=ROOT, capture_output=True, text=True
+    )
+    assert process.returncode == 0, process.stderr
+    assert 'STEAM_API_KEY' not in process.stderr
+
+
+def test_game_manager_import_does_not_load_config():
+    process = subprocess.run(
+        [sys.executable, '-c', "import sys, game_manager; print('config' in sys.modules)"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert process.returncode == 0, process.stderr
+    assert process.stdout.strip() == 'False'
@@ -0,0 +1,114 @@
+import os
+import pytest
+from shortcuts_vdf import ShortcutsFile
+from steam_integration import SteamIntegration
+
+
+@pytest.fixture
+def shortcuts_path(steam_home):
+    """
+    Returns:
+        pathlib.Path: The shortcuts.vdf of user 12345 in the temporary Steam installation.
+    """
+    return steam_home / 'shortcuts.vdf'
+
+
+def add(steam_home, *entries):
+    return SteamIntegration.process_user_entries(str(steam_home.parents[2]), '12345', entries)
+
+
+def on_disk(path):
+    return ShortcutsFile.parse(path.read_bytes())
+
+
+def game(name):
+    return {'app_name': name, 'exe': f'C:/games/{name}/game.exe', 'start_dir': f'C:/games/{name}'}
+
+
+def test_invalid_entry_does_not_discard_valid_ones(steam_home, shortcuts_path):
+    result = add(steam_home, game('Good'), {'app_name': 'Bad', 'exe': object(), 'start_dir': ''})
+
+    assert result['statuses'] == ['added', 'failed']
+    assert on_disk(shortcuts_path).contains('Good')
+    assert not on_disk(shortcuts_path).contains('Bad')
+
+
+def test_failed_write_leaves_no_unsaved_entries_cached(steam_home, shortcuts_path, monkeypatch):
+    add(steam_home, game('First'))
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(SteamIntegration, 'write_shortcuts_file', staticmethod(fail))
+        assert add(steam_home, game('Second'))['statuses'] == ['failed']
+
+    assert not SteamIntegration.load_shortcuts(str(shortcuts_path)).contains('Second')
+    assert add(steam_home, game('Second'))['statuses'] == ['added']
+    assert on_disk(shortcuts_path).contains('Second')
+
+
+def test_interrupted_batch_leaves_no_unsaved_entries_cached(steam_home, shortcuts_path, monkeypatch):
+    add(steam_home, game('First'))
+    append = ShortcutsFile.append
+
+    def append_and_fail(self, entry):
+        append(self, entry)
+        raise RuntimeError("interrupted")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ShortcutsFile, 'append', append_and_fail)
+        with pytest.raises(RuntimeError):
+            add(steam_home, game('Second'))
+
+    assert not SteamIntegration.load_shortcuts(str(shortcuts_path)).contains('Second')
+    assert add(steam_home, game('Second'))['statuses'] == ['added']
+    assert on_disk(shortcuts_path).contains('First')
+    assert on_disk(shortcuts_path).contains('Second')
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="file modes are POSIX only")
+def test_new_shortcuts_file_gets_default_mode(steam_home, shortcuts_path):
+    umask = os.umask(0o022)
+    os.umask(umask)
+
+    add(steam_home, game('First'))
+    assert shortcuts_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_parsed_file_is_reused_until_it_changes(steam_home, shortcuts_path):
+    add(steam_home, game('First'))
+    path = str(shortcuts_path)
+    shortcuts = SteamIntegration.load_shortcuts(path)
+    assert SteamIntegration.load_shortcuts(path) is shortcuts
+
+    # Another writer adds an entry: the size changes
+    other = ShortcutsFile.parse(shortcuts_path.read_bytes())
+    other.append(ShortcutsFile.new_entry('Second', 'C:/second.exe', 'C:/'))
+    shortcuts_path.write_bytes(other.to_bytes())
+    reloaded = SteamIntegration.load_shortcuts(path)
+    assert reloaded is not shortcuts
+    assert reloaded.contains('Second')
+
+
+def test_parsed_file_is_reloaded_when_only_mtime_changes(steam_home, shortcuts_path):
+    add(steam_home, game('Abc'))
+    path = str(shortcuts_path)
+    shortcuts = SteamIntegration.load_shortcuts(path)
+
+    # Same size, different contents and modification time
+    shortcuts_path.write_bytes(shortcuts_path.read_bytes().replace(b'Abc', b'Xyz'))
+    stat = shortcuts_path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = SteamIntegration.load_shortcuts(path)
+    assert reloaded is not shortcuts
+    assert reloaded.contains('Xyz')
+    assert not reloaded.contains('Abc')
+
+
+def test_deleted_file_loads_empty(steam_home, shortcuts_path):
+    add(steam_home, game('First'))
+    shortcuts_path.unlink()
+
+    assert len(SteamIntegration.load_shortcuts(str(shortcuts_path))) == 0
+    assert add(steam_home, game('First'))['statuses'] == ['added']
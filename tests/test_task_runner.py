@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+
+from task_runner import TaskCancelled, TaskRunner
+
+
+class FakeRoot:
+    """
+    Stands in for the Tk root: polling is driven by the test instead of the event loop.
+    """
+
+    def after(self, delay, callback):
+        return 'after'
+
+    def after_cancel(self, after_id):
+        pass
+
+
+def run(runner, function, **callbacks):
+    """
+    Submit a function, wait for it to finish and deliver its events.
+    """
+    finished = threading.Event()
+
+    def wrapper(task):
+        try:
+            return function(task)
+        finally:
+            finished.set()
+
+    task = runner.submit(wrapper, **callbacks)
+    assert finished.wait(5)
+    runner._executor.shutdown(wait=True)
+    runner._poll()
+    return task
+
+
+def test_cancelled_task_result_is_discarded():
+    runner = TaskRunner(FakeRoot())
+    results = []
+    started, cancelled = threading.Event(), threading.Event()
+
+    def work(task):
+        started.set()
+        cancelled.wait(5)
+        task.check()
+        return 'done'
+
+    task = runner.submit(work, on_done=results.append)
+    started.wait(5)
+    task.cancel()
+    cancelled.set()
+    runner._executor.shutdown(wait=True)
+    runner._poll()
+
+    assert results == []
+    assert not runner.busy
+
+
+def test_committed_task_ignores_cancel_and_delivers_its_result():
+    runner = TaskRunner(FakeRoot())
+    results = []
+
+    def work(task):
+        task.commit()
+        task.cancel()
+        task.check()
+        return 'written'
+
+    task = run(runner, work, on_done=results.append)
+
+    assert results == ['written']
+    assert not task.cancelled
+    assert not runner.busy
+
+
+def test_committed_task_delivers_its_error():
+    runner = TaskRunner(FakeRoot())
+    errors = []
+
+    def work(task):
+        task.commit()
+        task.cancel()
+        raise OSError("disk full")
+
+    run(runner, work, on_error=errors.append)
+
+    assert [str(error) for error in errors] == ["disk full"]
+
+
+def test_commit_raises_if_already_cancelled():
+    runner = TaskRunner(FakeRoot())
+    task = runner.submit(lambda task: None)
+    task.cancel()
+
+    with pytest.raises(TaskCancelled):
+        task.commit()
+    runner.shutdown()
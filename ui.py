@@ -2,27 +2,42 @@ import ttkbootstrap as ttk
 import tkinter as tk
 from ttkbootstrap.constants import *
 from tkinter import messagebox, filedialog, PhotoImage
-from steam_api import SteamAPI
-from game_manager import GameManager
-from steam_integration import SteamIntegration
-from steam_manager import SteamManager
 from config_management import load_config, save_config
-from icon_handler import extract_icon_path
-from config import API_KEY
+from task_runner import TaskRunner
+import threading
 import webbrowser
 
+# Modules that need requests, psutil, pefile, Pillow or icoextract are imported where they are first
+# used, so the window appears before they are loaded (see startup_benchmark.py).
+
 
 class NonSteamGameAdderApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Non-Steam Game Adder")
-        self.root.geometry("600x350")
+        self.root.geometry("600x450")
         self.root.iconbitmap("assets/app_icon.ico")  # Set application icon
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        self.steam_api = SteamAPI(API_KEY)
+        self._steam_api = None
+        self._steam_api_lock = threading.Lock()
+        self.task_runner = TaskRunner(self.root, on_busy=self.set_busy)
+        # Widgets disabled while a background task runs, with their idle state
+        self.controls = []
 
         self.create_styles()
         self.create_widgets()
+        self.prefetch_app_list()
+
+    @property
+    def steam_api(self):
+        with self._steam_api_lock:
+            if self._steam_api is None:
+                from steam_api import SteamAPI
+                from config import API_KEY
+
+                self._steam_api = SteamAPI(API_KEY)
+            return self._steam_api
 
     def create_styles(self):
         style = ttk.Style()
@@ -44,6 +59,7 @@ class NonSteamGameAdderApp:
 
         self.create_form(frame)
         self.create_buttons(frame)
+        self.create_status_bar(frame)
 
     def create_form(self, frame):
         ttk.Label(frame, text="Game Name:").grid(
@@ -53,6 +69,7 @@ class NonSteamGameAdderApp:
         self.game_name_entry.grid(
             row=1, column=1, padx=10, pady=5, sticky=W, columnspan=2
         )
+        self.controls.append((self.game_name_entry, NORMAL))
 
         ttk.Label(frame, text="Steam ID:").grid(
             row=2, column=0, padx=10, pady=5, sticky=W
@@ -61,6 +78,7 @@ class NonSteamGameAdderApp:
         self.steam_id_entry.grid(
             row=2, column=1, padx=10, pady=5, sticky=W, columnspan=2
         )
+        self.controls.append((self.steam_id_entry, NORMAL))
 
         config = load_config()
         if 'steam_id' in config:
@@ -80,6 +98,7 @@ class NonSteamGameAdderApp:
             frame, text="Browse", command=self.browse_directory
         )
         browse_directory_button.grid(row=3, column=2, padx=10, pady=5, sticky=W)
+        self.controls.append((browse_directory_button, NORMAL))
 
     def create_executable_entry(self, frame):
         ttk.Label(frame, text="Executable Path:").grid(
@@ -91,6 +110,7 @@ class NonSteamGameAdderApp:
             frame, text="Browse", command=self.browse_executable
         )
         browse_executable_button.grid(row=4, column=2, padx=10, pady=5, sticky=W)
+        self.controls.append((browse_executable_button, NORMAL))
 
     def create_icon_entry(self, frame):
         ttk.Label(frame, text="Icon Path (optional):").grid(
@@ -110,6 +130,7 @@ class NonSteamGameAdderApp:
             bootstyle=SUCCESS,
         )
         add_button.grid(row=6, column=1, padx=10, pady=10, sticky=W)
+        self.controls.append((add_button, NORMAL))
 
         self.steam_icon = PhotoImage(file="assets/steam_icon.png")
         open_steam_button = ttk.Button(
@@ -117,11 +138,117 @@ class NonSteamGameAdderApp:
             text="Open Steam",
             image=self.steam_icon,
             compound=LEFT,
-            command=SteamManager.open_steam,
+            command=self.open_steam,
             bootstyle=PRIMARY,
         )
         open_steam_button.grid(row=6, column=2, padx=10, pady=10, sticky=W)
 
+        bulk_import_button = ttk.Button(
+            frame,
+            text="Bulk Import",
+            command=self.open_bulk_import,
+            bootstyle=INFO,
+        )
+        bulk_import_button.grid(row=6, column=0, padx=10, pady=10, sticky=W)
+        self.controls.append((bulk_import_button, NORMAL))
+
+    def create_status_bar(self, frame):
+        self.progress_bar = ttk.Progressbar(frame, mode="indeterminate", length=200)
+        self.progress_bar.grid(row=7, column=0, padx=10, pady=5, sticky=W)
+        self.status_label = ttk.Label(frame, text="", font=("Helvetica", 10))
+        self.status_label.grid(row=7, column=1, padx=10, pady=5, sticky=W)
+        self.cancel_button = ttk.Button(
+            frame,
+            text="Cancel",
+            command=self.cancel_task,
+            bootstyle=DANGER,
+            state=DISABLED,
+        )
+        self.cancel_button.grid(row=7, column=2, padx=10, pady=5, sticky=W)
+
+        self.app_list_label = ttk.Label(
+            frame, text="", font=("Helvetica", 10), foreground="gray"
+        )
+        self.app_list_label.grid(row=8, column=0, columnspan=3, padx=10, sticky=W)
+
+    def prefetch_app_list(self):
+        # Runs outside task_runner so the form stays usable while the list loads
+        self.prefetch_runner = TaskRunner(self.root, max_workers=1)
+        self.app_list_label.config(text="Loading Steam app list...")
+
+        def prefetched(count):
+            if count:
+                self.app_list_label.config(text=f"Steam app list ready ({count:,} apps)")
+            else:
+                self.app_list_label.config(
+                    text="Steam app list unavailable; it will be retried when adding a game"
+                )
+
+        def failed(error):
+            self.app_list_label.config(text=f"Steam app list failed to load: {error}")
+
+        self.prefetch_runner.submit(
+            lambda task: self.steam_api.prefetch(), on_done=prefetched, on_error=failed
+        )
+
+    def set_busy(self, busy):
+        for control, idle_state in self.controls:
+            control.config(state=DISABLED if busy else idle_state)
+        self.cancel_button.config(state=NORMAL if busy else DISABLED)
+        if busy:
+            self.show_progress("Working...")
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="indeterminate", value=0)
+            self.status_label.config(text="")
+
+    def show_progress(self, message, fraction=None):
+        self.status_label.config(text=message)
+        if fraction is None:
+            if str(self.progress_bar.cget("mode")) != "indeterminate":
+                self.progress_bar.config(mode="indeterminate")
+            self.progress_bar.start(10)
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate", value=fraction * 100)
+
+    def show_error(self, error):
+        messagebox.showerror("Error", str(error))
+
+    def cancel_task(self):
+        self.task_runner.cancel_all()
+        self.status_label.config(text="Cancelling...")
+
+    def run_task(self, function, *args, on_done=None):
+        return self.task_runner.submit(
+            function,
+            *args,
+            on_done=on_done,
+            on_error=self.show_error,
+            on_progress=self.show_progress,
+        )
+
+    def on_close(self):
+        self.prefetch_runner.shutdown()
+        self.task_runner.shutdown()
+        self.root.destroy()
+
+    def open_steam(self):
+        from steam_manager import SteamManager
+
+        SteamManager.open_steam()
+
+    def open_bulk_import(self):
+        steam_id = self.steam_id_entry.get()
+        if not self.steam_api.validate_steam_id(steam_id):
+            messagebox.showerror(
+                "Error", "Invalid Steam ID format. Please enter a valid 17-digit Steam ID."
+            )
+            return
+        from bulk_import import BulkImportWindow
+
+        BulkImportWindow(self.root, self.steam_api, steam_id)
+
     def browse_directory(self):
         directory = filedialog.askdirectory()
         if directory:
@@ -137,12 +264,20 @@ class NonSteamGameAdderApp:
             self.exe_entry.delete(0, tk.END)
             self.exe_entry.insert(0, exe_path)
             self.exe_entry.config(state="readonly")
-            icon_path = extract_icon_path(exe_path)
-            if icon_path:
-                self.icon_entry.config(state=tk.NORMAL)
-                self.icon_entry.delete(0, tk.END)
-                self.icon_entry.insert(0, icon_path)
-                self.icon_entry.config(state="readonly")
+            self.run_task(self.extract_icon, exe_path, on_done=self.set_icon_path)
+
+    def extract_icon(self, task, exe_path):
+        task.report("Extracting icon...")
+        from icon_handler import extract_icon_path
+
+        return extract_icon_path(exe_path)
+
+    def set_icon_path(self, icon_path):
+        if icon_path:
+            self.icon_entry.config(state=tk.NORMAL)
+            self.icon_entry.delete(0, tk.END)
+            self.icon_entry.insert(0, icon_path)
+            self.icon_entry.config(state="readonly")
 
     def add_game(self):
         game_name = self.game_name_entry.get()
@@ -155,14 +290,13 @@ class NonSteamGameAdderApp:
         config['steam_id'] = steam_id
         save_config(config)
 
-        try:
-            if not self.steam_api.validate_steam_id(steam_id):
-                messagebox.showerror(
-                    "Error", "Invalid Steam ID format. Please enter a valid 17-digit Steam ID."
-                )
-                return
+        if not self.steam_api.validate_steam_id(steam_id):
+            messagebox.showerror(
+                "Error", "Invalid Steam ID format. Please enter a valid 17-digit Steam ID."
+            )
+            return
 
-            app_id = self.steam_api.find_app_id(game_name)
+        def app_id_found(app_id):
             if not app_id:
                 messagebox.showerror(
                     "Error", "Game Name not found. Please enter a valid game name."
@@ -179,8 +313,11 @@ class NonSteamGameAdderApp:
                 icon_path,
             )
 
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self.run_task(self.find_app_id, game_name, on_done=app_id_found)
+
+    def find_app_id(self, task, game_name):
+        task.report(f"Looking up the app ID of {game_name}...")
+        return self.steam_api.find_app_id(game_name)
 
     def prompt_for_app_id(self, game_name):
         url = f"https://steamdb.info/search/?a=all&q={game_name}"
@@ -214,26 +351,73 @@ class NonSteamGameAdderApp:
     def continue_adding_game(
         self, app_id, game_name, steam_id, game_directory, exe_path, icon_path
     ):
-        try:
-            if SteamManager.is_steam_running():
+        def steam_checked(steam_running):
+            if steam_running:
                 messagebox.showinfo("Info", "Steam needs to be closed to proceed.")
-                if not SteamManager.close_steam():
-                    messagebox.showerror(
-                        "Error", "Unable to close Steam. Please close it manually."
-                    )
-                    return
-
-            ini_file = GameManager.find_ini_file(game_directory)
-
-            if ini_file:
-                GameManager.update_ini_file(ini_file, steam_id)
-                GameManager.create_steam_appid_file(game_directory, app_id)
-                SteamIntegration.add_non_steam_game(
-                    game_name, exe_path, game_directory, icon_path
-                )
-                messagebox.showinfo("Success", "Game added successfully!")
-            else:
-                messagebox.showerror("Error", "INI file not found.")
+            self.run_task(
+                self.install_game,
+                steam_running,
+                app_id,
+                game_name,
+                steam_id,
+                game_directory,
+                exe_path,
+                icon_path,
+                on_done=self.game_added,
+            )
 
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self.run_task(self.check_steam, on_done=steam_checked)
+
+    def check_steam(self, task):
+        task.report("Checking whether Steam is running...")
+        from steam_manager import SteamManager
+
+        return SteamManager.is_steam_running()
+
+    def install_game(
+        self, task, close_steam, app_id, game_name, steam_id, game_directory, exe_path, icon_path
+    ):
+        from game_manager import GameManager
+        from steam_integration import SteamIntegration
+        from steam_manager import SteamManager
+
+        # Cancelling before anything has changed must leave Steam running
+        task.check()
+        if close_steam:
+            task.report("Closing Steam...")
+            if not SteamManager.close_steam():
+                raise RuntimeError("Unable to close Steam. Please close it manually.")
+
+        task.check()
+        task.report("Searching for the INI file...")
+        ini_file = GameManager.find_ini_file(game_directory, exe_path)
+        if not ini_file:
+            raise FileNotFoundError("INI file not found.")
+        if icon_path:
+            from icon_handler import keep_icon
+
+            # The shortcut must not point into the icon cache, which is pruned
+            icon_path = keep_icon(icon_path)
+
+        # Last chance to cancel; the files below are changed together
+        task.commit()
+        task.report("Updating game files...", 0.5)
+        GameManager.update_ini_file(ini_file, steam_id)
+        GameManager.create_steam_appid_file(game_directory, app_id)
+        task.report("Adding the game to Steam...", 0.75)
+        results = SteamIntegration.add_non_steam_game(
+            game_name, exe_path, game_directory, icon_path
+        )
+        return [
+            f"User {user_id}: {failure['reason']}"
+            for user_id, result in results.items()
+            for failure in result['failed']
+        ]
+
+    def game_added(self, failures):
+        if failures:
+            messagebox.showerror(
+                "Error", "Failed to add the game:\n" + "\n".join(failures)
+            )
+        else:
+            messagebox.showinfo("Success", "Game added successfully!")